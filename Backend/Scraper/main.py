@@ -1,7 +1,8 @@
 import asyncio
 import json
 import os
-from typing import Dict, List, Any, Optional, Tuple
+import sys
+from typing import Dict, List, Any, Optional
 
 from playwright.async_api import async_playwright
 from requests import post
@@ -12,6 +13,12 @@ from ticketmaster import search_tickets as ticketmaster_search
 from seatgeek import search_tickets as seatgeek_search
 from gametime import search_tickets as gametime_search
 
+# Shared helpers live in Backend/utils
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.artist_match import ArtistMatcher
+from utils.price import BASE_CURRENCY, safe_price
+from core.ranking import cheapest as pick_cheapest
+
 
 # -------------------------
 # Config
@@ -50,63 +57,25 @@ def load_auth() -> Dict[str, str]:
         return json.load(f)
 
 
-def safe_price(value: Any) -> Optional[float]:
-    """
-    Attempts to normalize different price formats into a float.
-    Examples: 120, "120", "$120.50", "CA$ 120", None -> float or None
-    """
-    if value is None:
-        return None
-    if isinstance(value, (int, float)):
-        return float(value)
-
-    if isinstance(value, str):
-        s = value.strip()
-        # keep digits + decimal point
-        cleaned = "".join(ch for ch in s if ch.isdigit() or ch == ".")
-        if cleaned == "":
-            return None
-        try:
-            return float(cleaned)
-        except ValueError:
-            return None
-
-    return None
-
-
-def is_artist_match(listing_name: str, artist: str) -> bool:
-    """
-    Simple match: case-insensitive contains.
-    You can tighten this later if needed.
-    """
-    if not listing_name:
-        return False
-    return artist.lower() in listing_name.lower()
-
-
-def cheapest_listing(results: List[Dict[str, Any]], artist: str) -> Optional[Dict[str, Any]]:
+def cheapest_listing(results: List[Dict[str, Any]], matcher: ArtistMatcher) -> Optional[Dict[str, Any]]:
     """
-    Filters results to the artist and returns the cheapest listing dict (adds _price_num).
+    Filters results to the matcher's artists and returns the cheapest listing dict (adds _price_num).
     """
-    candidates: List[Tuple[float, Dict[str, Any]]] = []
+    candidates: List[Dict[str, Any]] = []
 
     for item in results or []:
         name = item.get("name") or item.get("event_name") or ""
-        if not is_artist_match(name, artist):
+        if not matcher.match(name):
             continue
 
-        p = safe_price(item.get("price"))
+        p = safe_price(item.get("price"), base_currency=BASE_CURRENCY)
         if p is None:
             continue
 
         item["_price_num"] = p
-        candidates.append((p, item))
-
-    if not candidates:
-        return None
+        candidates.append(item)
 
-    candidates.sort(key=lambda x: x[0])
-    return candidates[0][1]
+    return pick_cheapest(candidates, price=lambda item: item["_price_num"])
 
 
 def post_results(payload: Dict[str, Any], endpoint: str):
@@ -168,8 +137,10 @@ async def main(
 
         all_results = await asyncio.gather(*tasks, return_exceptions=True)
 
+        # Built once for every provider's results
+        matcher = ArtistMatcher([artist])
         cheapest_by_source: Dict[str, Any] = {}
-        overall_candidates: List[Tuple[float, Dict[str, Any]]] = []
+        overall_candidates: List[Dict[str, Any]] = []
 
         for provider_key, result in zip(provider_keys, all_results):
             if isinstance(result, Exception):
@@ -177,7 +148,7 @@ async def main(
                 cheapest_by_source[provider_key] = {"error": str(result)}
                 continue
 
-            cheapest = cheapest_listing(result, artist)
+            cheapest = cheapest_listing(result, matcher)
             if not cheapest:
                 cheapest_by_source[provider_key] = None
                 continue
@@ -192,12 +163,11 @@ async def main(
                 "url": cheapest.get("url"),
                 "source": cheapest.get("source", provider_key),
             }
-            overall_candidates.append((cheapest["_price_num"], cheapest))
+            overall_candidates.append(cheapest)
 
         overall_cheapest = None
-        if overall_candidates:
-            overall_candidates.sort(key=lambda x: x[0])
-            best = overall_candidates[0][1]
+        best = pick_cheapest(overall_candidates, price=lambda item: item["_price_num"])
+        if best:
             overall_cheapest = {
                 "name": best.get("name") or best.get("event_name"),
                 "price": best.get("price"),
@@ -3,6 +3,14 @@ from .scrape_routes import scrape_bp
 from .results_routes import results_bp
 from .tracked_routes import tracked_bp
 from .search_routes import search_bp
+from .history_routes import history_bp
+from .alert_routes import alert_bp
+from .breaker_routes import breaker_bp
+from .metrics_routes import metrics_bp
+from .cache_routes import cache_bp
+from .analytics_routes import analytics_bp
+from .maintenance_routes import maintenance_bp
+from .export_routes import export_bp
 
 
 def register_routes(app):
@@ -14,3 +22,11 @@ def register_routes(app):
     app.register_blueprint(results_bp, url_prefix="/api")
     app.register_blueprint(tracked_bp, url_prefix="/api")
     app.register_blueprint(search_bp, url_prefix="/api")
+    app.register_blueprint(history_bp, url_prefix="/api")
+    app.register_blueprint(alert_bp, url_prefix="/api")
+    app.register_blueprint(breaker_bp, url_prefix="/api")
+    app.register_blueprint(metrics_bp, url_prefix="/api")
+    app.register_blueprint(cache_bp, url_prefix="/api")
+    app.register_blueprint(analytics_bp, url_prefix="/api")
+    app.register_blueprint(maintenance_bp, url_prefix="/api")
+    app.register_blueprint(export_bp, url_prefix="/api")
@@ -0,0 +1,82 @@
+import math
+
+from flask import Blueprint, request, jsonify
+
+from models import db
+from models.price_alert import PriceAlert
+from models.tracked_event import TrackedEvent
+from services.alerts import create_alert
+from services.notifiers import webhook_url_error
+
+alert_bp = Blueprint("alerts", __name__)
+
+
+def _optional_float(data, field):
+    value = data.get(field)
+    if value is None or value == "":
+        return None
+    number = float(value)
+    # float() accepts "nan" / "inf"
+    if not math.isfinite(number) or number <= 0:
+        raise ValueError(field)
+    return number
+
+
+@alert_bp.route("/alerts", methods=["GET"])
+def get_alerts():
+    q = PriceAlert.query
+    tracked_id = request.args.get("tracked_event_id", type=int)
+    if tracked_id is not None:
+        q = q.filter(PriceAlert.tracked_event_id == tracked_id)
+    rows = q.order_by(PriceAlert.created_at.desc()).all()
+    return jsonify({"ok": True, "alerts": [r.to_dict() for r in rows]}), 200
+
+
+@alert_bp.route("/alerts", methods=["POST"])
+def add_alert():
+    """
+    Body:
+      { "tracked_event_id": 1, "target_price": 80 }
+      { "tracked_event_id": 1, "drop_pct": 15, "webhook_url": "https://..." }
+    webhook_url must be https on a host listed in ALERT_WEBHOOK_HOSTS.
+    """
+    data = request.get_json(silent=True) or {}
+
+    tracked = TrackedEvent.query.get(data.get("tracked_event_id") or 0)
+    if not tracked:
+        return jsonify({"ok": False, "error": "tracked event not found"}), 404
+
+    try:
+        target_price = _optional_float(data, "target_price")
+        drop_pct = _optional_float(data, "drop_pct")
+    except (TypeError, ValueError):
+        return jsonify({"ok": False, "error": "target_price and drop_pct must be positive numbers"}), 400
+
+    webhook_url = str(data.get("webhook_url") or "").strip() or None
+    if webhook_url:
+        error = webhook_url_error(webhook_url)
+        if error:
+            return jsonify({"ok": False, "error": error}), 400
+
+    alert, error = create_alert(
+        tracked,
+        target_price=target_price,
+        drop_pct=drop_pct,
+        webhook_url=webhook_url,
+    )
+    if not alert:
+        return jsonify({"ok": False, "error": error}), 400
+
+    return jsonify({"ok": True, "alert": alert.to_dict()}), 201
+
+
+@alert_bp.route("/alerts/<int:alert_id>", methods=["DELETE"])
+def delete_alert(alert_id: int):
+    row = PriceAlert.query.get(alert_id)
+    if not row:
+        return jsonify({"ok": False, "error": "alert not found"}), 404
+
+    db.session.delete(row)
+    db.session.commit()
+
+    return jsonify({"ok": True, "deleted_id": alert_id}), 200
@@ -0,0 +1,59 @@
+from flask import Blueprint, request, jsonify
+
+from services.search_analytics import SEARCH_RETENTION_DAYS, compact_searches, top_artists, trending_artists
+from utils.http import cache_for, require_admin
+
+analytics_bp = Blueprint("analytics", __name__)
+
+# Longest window the endpoints accept (90 days)
+MAX_WINDOW_HOURS = 24 * 90
+# Shortest raw search retention the endpoint allows: the cache warmer reads
+# a week of raw searches for the cities artists are searched in
+MIN_RETENTION_DAYS = 7
+MAX_RETENTION_DAYS = 3650
+
+
+def _window_args():
+    hours = request.args.get("hours", default=24, type=int)
+    limit = request.args.get("limit", default=10, type=int)
+    return min(max(hours, 1), MAX_WINDOW_HOURS), min(max(limit, 1), 100)
+
+
+@analytics_bp.route("/analytics/artists/top", methods=["GET"])
+def top():
+    """
+    Most searched artists, from the hourly search rollups.
+    Query params:
+      - hours (optional): window length in hours, current hour included (default 24)
+      - limit (optional): how many artists (default 10)
+    """
+    hours, limit = _window_args()
+    body = {"ok": True, "hours": hours, "artists": top_artists(hours, limit)}
+    return cache_for(jsonify(body), max_age=60), 200
+
+
+@analytics_bp.route("/analytics/artists/trending", methods=["GET"])
+def trending():
+    """
+    Artists searched more in the last `hours` than in the `hours` before.
+    Query params:
+      - hours, limit (optional): as for /analytics/artists/top
+      - min_searches (optional): least searches in the window to be listed (default 3)
+    """
+    hours, limit = _window_args()
+    min_searches = request.args.get("min_searches", default=3, type=int)
+    body = {"ok": True, "hours": hours, "artists": trending_artists(hours, limit, max(min_searches, 1))}
+    return cache_for(jsonify(body), max_age=60), 200
+
+
+@analytics_bp.route("/analytics/compact", methods=["POST"])
+@require_admin
+def compact():
+    """
+    Retention job (needs the admin token): delete raw searches older than
+    `days` (default SEARCH_RETENTION_DAYS, at least MIN_RETENTION_DAYS).
+    Counts stay in the rollups.
+    """
+    days = request.args.get("days", default=SEARCH_RETENTION_DAYS, type=int)
+    days = min(max(days, MIN_RETENTION_DAYS), MAX_RETENTION_DAYS)
+    return jsonify({"ok": True, "days": days, "deleted": compact_searches(days)})
@@ -0,0 +1,16 @@
+from flask import Blueprint, jsonify
+
+from core import providers
+from core.breaker import get_breaker
+
+breaker_bp = Blueprint("breakers", __name__)
+
+
+@breaker_bp.route("/breakers", methods=["GET"])
+def list_breakers():
+    """
+    Circuit breaker state per provider for this process:
+    closed / open / half_open, recent failures and when the next probe is due.
+    """
+    states = {name: get_breaker(name).snapshot() for name in providers.provider_api_keys()}
+    return jsonify({"ok": True, "breakers": states})
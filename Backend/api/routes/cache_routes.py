@@ -0,0 +1,37 @@
+from flask import Blueprint, request, jsonify
+
+from services.search_analytics import decayed_artist_scores
+from services.warmer import WARM_BUDGET, WARM_HALF_LIFE_HOURS, WARM_TOP_N, WARM_WINDOW_DAYS, warm_cache
+from utils.http import require_admin
+
+cache_bp = Blueprint("cache", __name__)
+
+# Most trending artists a request may ask for
+MAX_TOP = 200
+
+
+@cache_bp.route("/cache/warm", methods=["POST"])
+@require_admin
+def warm():
+    """
+    Refresh the search cache for trending and tracked artists (for a cron
+    job; needs the admin token).
+    Query params:
+      - top (optional): how many trending artists to include (up to MAX_TOP)
+      - budget (optional): most provider requests to spend; can lower
+        WARM_BUDGET, not raise it
+    """
+    top = request.args.get("top", default=WARM_TOP_N, type=int)
+    budget = request.args.get("budget", default=WARM_BUDGET, type=int)
+    return jsonify({"ok": True, **warm_cache(min(max(top, 0), MAX_TOP), min(max(budget, 0), WARM_BUDGET))})
+
+
+@cache_bp.route("/cache/warm", methods=["GET"])
+def warm_preview():
+    """
+    The trending artists the warmer would keep hot, with their decayed search counts.
+    """
+    top = request.args.get("top", default=WARM_TOP_N, type=int)
+    scores = decayed_artist_scores(min(max(top, 0), MAX_TOP), WARM_HALF_LIFE_HOURS, WARM_WINDOW_DAYS)
+    artists = [{"artist": artist, "score": score} for artist, score in scores]
+    return jsonify({"ok": True, "trending": artists})
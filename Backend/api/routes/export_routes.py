@@ -0,0 +1,98 @@
+from datetime import datetime
+from typing import Optional, Tuple
+
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
+
+from services.export import (
+    FORMATS,
+    LISTING_COLUMNS,
+    PRICE_COLUMNS,
+    available_formats,
+    encode,
+    listing_chunks,
+    price_chunks,
+)
+from utils.time import parse_iso_datetime
+
+export_bp = Blueprint("export", __name__)
+
+
+def _range() -> Tuple[Optional[datetime], Optional[datetime]]:
+    """start / end query params; raises ValueError with a client-facing message."""
+    out = []
+    for name in ("start", "end"):
+        value = request.args.get(name)
+        parsed = parse_iso_datetime(value) if value else None
+        if value and parsed is None:
+            raise ValueError(f"{name} must be an ISO-8601 datetime")
+        out.append(parsed)
+    return out[0], out[1]
+
+
+def _format() -> str:
+    fmt = (request.args.get("format") or "csv").strip().lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"format must be one of: {', '.join(FORMATS)}")
+    if fmt not in available_formats():
+        raise ValueError(f"{fmt} export needs pyarrow, which isn't installed; use csv or ndjson")
+    return fmt
+
+
+def _stream(fmt: str, name: str, columns, chunks) -> Response:
+    body = encode(fmt, columns, chunks, dumps=current_app.json.dumps)
+    response = Response(stream_with_context(body), mimetype=FORMATS[fmt])
+    ext = "arrows" if fmt == "arrow" else fmt
+    response.headers["Content-Disposition"] = f'attachment; filename="{name}.{ext}"'
+    return response
+
+
+@export_bp.route("/export/listings", methods=["GET"])
+def export_listings():
+    """
+    Stream ticket_listings rows.
+    Query params:
+      - format (optional): csv (default), ndjson, parquet, arrow
+      - artist (optional): case-insensitive substring
+      - source (optional): ticketmaster / seatgeek / ...
+      - start, end (optional): ISO-8601 bounds on created_at
+      - archive (optional): "1" to include archived rows
+    """
+    try:
+        fmt = _format()
+        start, end = _range()
+    except ValueError as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
+
+    chunks = listing_chunks(
+        artist=(request.args.get("artist") or "").strip() or None,
+        source=(request.args.get("source") or "").strip().lower() or None,
+        start=start,
+        end=end,
+        include_archive=request.args.get("archive") in ("1", "true"),
+    )
+    return _stream(fmt, "ticket_listings", LISTING_COLUMNS, chunks)
+
+
+@export_bp.route("/export/prices", methods=["GET"])
+def export_prices():
+    """
+    Stream raw price history points.
+    Query params:
+      - format (optional): csv (default), ndjson, parquet, arrow
+      - event_key (optional): one event
+      - source (optional): ticketmaster / seatgeek / ...
+      - start, end (optional): ISO-8601 bounds on the observation time
+    """
+    try:
+        fmt = _format()
+        start, end = _range()
+    except ValueError as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
+
+    chunks = price_chunks(
+        event_key=(request.args.get("event_key") or "").strip() or None,
+        source=(request.args.get("source") or "").strip().lower() or None,
+        start=start,
+        end=end,
+    )
+    return _stream(fmt, "price_history", PRICE_COLUMNS, chunks)
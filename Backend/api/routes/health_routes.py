@@ -1,8 +1,22 @@
 from flask import Blueprint, jsonify
 
+from core import providers
+from core.ratelimit import get_rate_limiter
+
 health_bp = Blueprint("health", __name__)
 
 
 @health_bp.route("/health", methods=["GET"])
 def health():
-    return jsonify({"ok": True})
+    """
+    Liveness plus upstream quota: remaining tokens per provider rate limit.
+    """
+    limiter = get_rate_limiter()
+    quota = {
+        name: {
+            "configured": bool(key),
+            "limits": limiter.quota(name, key) if key else {},
+        }
+        for name, key in providers.provider_api_keys().items()
+    }
+    return jsonify({"ok": True, "providers": quota})
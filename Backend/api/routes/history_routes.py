@@ -0,0 +1,63 @@
+from flask import Blueprint, request, jsonify
+
+from services.price_history import get_event_price_series, get_price_series, DEFAULT_MAX_POINTS
+from utils.time import parse_iso_datetime
+from utils.http import cache_for
+
+history_bp = Blueprint("history", __name__)
+
+
+def _series_args():
+    """(kwargs for get_price_series, None) or (None, error response)."""
+    source = (request.args.get("source") or "").strip().lower() or None
+    resolution = (request.args.get("resolution") or "").strip().lower() or None
+
+    start = end = None
+    if request.args.get("start"):
+        start = parse_iso_datetime(request.args["start"])
+        if start is None:
+            return None, (jsonify({"ok": False, "error": "start must be an ISO-8601 datetime"}), 400)
+    if request.args.get("end"):
+        end = parse_iso_datetime(request.args["end"])
+        if end is None:
+            return None, (jsonify({"ok": False, "error": "end must be an ISO-8601 datetime"}), 400)
+
+    try:
+        max_points = int(request.args.get("points", DEFAULT_MAX_POINTS))
+    except ValueError:
+        return None, (jsonify({"ok": False, "error": "points must be an integer"}), 400)
+
+    return dict(source=source, start=start, end=end, max_points=max_points, resolution=resolution), None
+
+
+@history_bp.route("/history/<event_key>", methods=["GET"])
+def price_history(event_key: str):
+    """
+    Downsampled price series for one provider event_key.
+    Query params:
+      - source (optional): ticketmaster / seatgeek / ...
+      - start, end (optional): ISO-8601 datetimes
+      - points (optional): max points to return (default 200)
+      - resolution (optional): raw / hour / day (default: auto)
+    """
+    args, error = _series_args()
+    if error:
+        return error
+    series = get_price_series(event_key, **args)
+    return cache_for(jsonify({"ok": True, **series}), max_age=300), 200
+
+
+@history_bp.route("/history/event/<int:event_id>", methods=["GET"])
+def event_price_history(event_id: int):
+    """
+    Price series for a canonical event (the event_id search results carry),
+    merged across every provider listing linked to it. Same query params as
+    /history/<event_key>.
+    """
+    args, error = _series_args()
+    if error:
+        return error
+    series = get_event_price_series(event_id, **args)
+    if series is None:
+        return jsonify({"ok": False, "error": "event not found"}), 404
+    return cache_for(jsonify({"ok": True, **series}), max_age=300), 200
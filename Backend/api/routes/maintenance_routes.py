@@ -0,0 +1,24 @@
+from flask import Blueprint, request, jsonify
+
+from services.listing_retention import run_maintenance
+from utils.http import require_admin
+
+maintenance_bp = Blueprint("maintenance", __name__)
+
+STEPS = ("compact", "archive", "optimize")
+
+
+@maintenance_bp.route("/maintenance/listings", methods=["POST"])
+@require_admin
+def listings_maintenance():
+    """
+    ticket_listings retention job (for a cron job; needs the admin token).
+    Query params:
+      - steps (optional): comma-separated subset of compact,archive,optimize (default all)
+    """
+    steps = [s.strip() for s in (request.args.get("steps") or "").split(",") if s.strip()]
+    unknown = set(steps) - set(STEPS)
+    if unknown:
+        return jsonify({"ok": False, "error": f"unknown steps: {', '.join(sorted(unknown))}"}), 400
+    ordered = [s for s in STEPS if s in steps] or None
+    return jsonify({"ok": True, **run_maintenance(ordered)})
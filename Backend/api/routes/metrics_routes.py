@@ -0,0 +1,14 @@
+from flask import Blueprint, Response
+
+from core.metrics import render_metrics
+
+metrics_bp = Blueprint("metrics", __name__)
+
+
+@metrics_bp.route("/metrics", methods=["GET"])
+def metrics():
+    """
+    Prometheus scrape endpoint: latency histograms for requests, provider
+    calls, city fallback steps, cache lookups, DB writes and serialization.
+    """
+    return Response(render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8")
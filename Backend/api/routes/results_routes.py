@@ -9,6 +9,7 @@ results_bp = Blueprint("results", __name__)
 @results_bp.route("/results/tickets", methods=["GET"])
 def ticket_results():
     artist = (request.args.get("artist") or "").strip()
+    top = request.args.get("top", default=0, type=int)
     if not artist:
         return jsonify({"ok": False, "error": "artist query param is required"}), 400
 
@@ -19,5 +20,5 @@ def ticket_results():
     # (If your TicketListing has to_dict, this works)
     listings_dicts = [x.to_dict() for x in listings]
 
-    summary = build_ticket_summary(artist, listings_dicts)
+    summary = build_ticket_summary(artist, listings_dicts, top=top)
     return jsonify(summary), 200
@@ -1,8 +1,6 @@
 from flask import Blueprint, request, jsonify
 from services.scraper import run_scraper
-from models.artist_search import ArtistSearch
-from models import db
-from datetime import datetime, timezone
+from services.search_analytics import record_search
 
 scrape_bp = Blueprint("scrape", __name__)
 
@@ -16,9 +14,7 @@ def start_scrape():
         return jsonify({"ok": False, "error": "Artist is required"}), 400
 
     # Log the search
-    db.session.add(ArtistSearch(
-        artist=artist, created_at=datetime.now(timezone.utc)))
-    db.session.commit()
+    record_search(artist)
 
     # Run scraper (synchronous for now)
     result = run_scraper(artist)
@@ -1,13 +1,27 @@
-from flask import Blueprint, request, jsonify
-from services.ticket_search import search_all_platforms
-from services.city_search import find_nearest_city_with_events
-from models.artist_search import ArtistSearch
-from models import db
-from datetime import datetime, timezone
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
+from core import providers
+from core.batch import BATCH_MAX_QUERIES, run_batch
+from core.filters import parse_filters, sort_results
+from core.search import cached_search_all_platforms, cached_search_near_city, paginate_results
+from services.events import link_events
+from services.search_analytics import record_search
+from core.ranking import cheapest_k, cheapest_k_by_source
+from core.serialize import serialize_search_response
+from core.metrics import span
+from utils.http import cache_for
 
 search_bp = Blueprint("search", __name__)
 
 
+def _link_unlinked(results):
+    # The search results hook (services.observations) links events when they
+    # are fetched, so cached results already carry their ids; this only
+    # catches results it couldn't link
+    events = [ev for ev in results.get("events", []) if ev.get("event_id") is None]
+    if events:
+        link_events(events, results.get("listings", []))
+
+
 @search_bp.route("/search/tickets", methods=["GET"])
 def search_tickets():
     """
@@ -15,25 +29,118 @@ def search_tickets():
     Query params:
       - artist (required): Artist or event name to search
       - city (optional): City to filter by - will find nearest city with events if none found
+      - top (optional): also return the `top` cheapest listings overall and per platform
+      - by_platform (optional): "refs" to send by_platform as indexes into listings
+      - pages (optional): upstream pages to fetch per provider (up to PROVIDER_MAX_PAGES)
+      - page, limit (optional): return one page of `limit` listings; pages are
+        sliced from the cached deep search, so paging doesn't refetch
+      - date_from, date_to (optional): YYYY-MM-DD event date range
+      - min_price, max_price (optional): listing price range
+      - platforms (optional): comma-separated platforms to search, e.g. "seatgeek"
+      - sort (optional): "price", "date" or "distance" (from `city`)
     """
     artist = (request.args.get("artist") or "").strip()
     city = (request.args.get("city") or "").strip() or None
+    top = request.args.get("top", default=0, type=int)
+    platform_refs = (request.args.get("by_platform") or "").strip().lower() == "refs"
+    page = request.args.get("page", type=int)
+    limit = request.args.get("limit", type=int)
+    paginate = page is not None or limit is not None
+    # Paging implies a deep search unless a page budget is given
+    pages = request.args.get("pages", default=providers.MAX_PAGES if paginate else 1, type=int)
+    pages = min(max(pages, 1), providers.MAX_PAGES)
     
     if not artist:
         return jsonify({"ok": False, "error": "artist query param is required"}), 400
+    try:
+        filters = parse_filters(request.args.get)
+    except ValueError as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
+    if filters.sort == "distance" and not city:
+        return jsonify({"ok": False, "error": "sort=distance needs a city"}), 400
     
-    db.session.add(ArtistSearch(
-        artist=artist, 
-        created_at=datetime.now(timezone.utc)
-    ))
-    db.session.commit()
+    record_search(artist, city)
     
     if city:
-        results = find_nearest_city_with_events(city, search_all_platforms, artist)
+        results = cached_search_near_city(artist, city, max_pages=pages, filters=filters)
     else:
-        results = search_all_platforms(artist, city)
+        results = cached_search_all_platforms(artist, city, max_pages=pages, filters=filters)
+
+    _link_unlinked(results)
+
+    if top > 0:
+        results["top"] = cheapest_k(results.get("listings", []), top)
+        results["top_by_platform"] = cheapest_k_by_source(results.get("listings", []), top)
+
+    results = sort_results(results, filters.sort, origin_city=city)
+    if paginate:
+        results = paginate_results(results, max(page or 1, 1), min(max(limit or 20, 1), 100))
     
-    return jsonify({
-        "ok": True,
-        **results
-    }), 200
+    with span("serialize", step="build"):
+        body = serialize_search_response(results, platform_refs=platform_refs)
+    with span("serialize", step="json"):
+        response = jsonify({"ok": True, **body})
+    return cache_for(response, max_age=60, stale_while_revalidate=300), 200
+
+
+@search_bp.route("/search/batch", methods=["POST"])
+def search_batch():
+    """
+    Search for many artists at once, streamed as NDJSON.
+    Body:
+      - queries (required): [{"artist": "...", "city": "..."}, ...]
+      - pages, date_from, date_to, min_price, max_price, platforms, sort
+        (optional): as for GET /search/tickets, applied to every query
+    Emits one line per query as its search completes:
+      {"index": 0, "query": {...}, "ok": true, ...search response}
+    then a final {"ok": true, "done": true, ...} line. Queries with the same
+    search run once and reuse the search cache. Batch searches aren't logged
+    as ArtistSearch rows, so dashboards don't skew search analytics.
+    """
+    payload = request.get_json(silent=True) or {}
+    raw_queries = payload.get("queries")
+    if not isinstance(raw_queries, list) or not raw_queries:
+        return jsonify({"ok": False, "error": "queries must be a non-empty list"}), 400
+    if len(raw_queries) > BATCH_MAX_QUERIES:
+        return jsonify({"ok": False, "error": f"at most {BATCH_MAX_QUERIES} queries per batch"}), 400
+
+    queries = []
+    for q in raw_queries:
+        artist = str((q or {}).get("artist") or "").strip() if isinstance(q, dict) else ""
+        if not artist:
+            return jsonify({"ok": False, "error": "every query needs an artist"}), 400
+        queries.append((artist, str(q.get("city") or "").strip() or None))
+
+    def get(name):
+        value = payload.get(name)
+        if isinstance(value, list):
+            value = ",".join(str(v) for v in value)
+        return None if value is None else str(value)
+
+    try:
+        filters = parse_filters(get)
+        pages = int(payload.get("pages") or 1)
+    except ValueError as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
+    pages = min(max(pages, 1), providers.MAX_PAGES)
+    if filters.sort == "distance" and not all(city for _, city in queries):
+        return jsonify({"ok": False, "error": "sort=distance needs a city in every query"}), 400
+
+    def lines():
+        dumps = current_app.json.dumps
+        searches = 0
+        for indexes, results, error in run_batch(queries, max_pages=pages, filters=filters):
+            searches += 1
+            if error is not None:
+                body = {"ok": False, "error": str(error)}
+            else:
+                _link_unlinked(results)
+                results = sort_results(results, filters.sort, origin_city=queries[indexes[0]][1])
+                with span("serialize", step="build"):
+                    body = {"ok": True, **serialize_search_response(results)}
+            for i in indexes:
+                artist, city = queries[i]
+                yield dumps({"index": i, "query": {"artist": artist, "city": city}, **body}) + "\n"
+        yield dumps({"ok": True, "done": True, "queries": len(queries), "searches": searches}) + "\n"
+
+    return Response(stream_with_context(lines()), mimetype="application/x-ndjson")
@@ -1,54 +1,140 @@
-from flask import Blueprint, request, jsonify
-from datetime import datetime, timezone
+import base64
+import hashlib
+import json
+from flask import Blueprint, Response, request, jsonify
+from datetime import datetime
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import load_only
 
 from models import db
 from models.tracked_event import TrackedEvent
+from models.price_alert import PriceAlert
+from models.table_version import get_table_version, bump_table_version
+from api.schemas.tracked_event_schema import validate_tracked_event_request
+from services.tracked import upsert_tracked_events
 
 tracked_bp = Blueprint("tracked", __name__)
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+MAX_BULK_EVENTS = 500
+
+
+def _encode_cursor(row: TrackedEvent) -> str:
+    raw = json.dumps([row.created_at.isoformat(), row.id])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str):
+    created_at, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    return datetime.fromisoformat(created_at), int(row_id)
+
 
 @tracked_bp.route("/tracked", methods=["GET"])
 def get_tracked():
-    rows = TrackedEvent.query.order_by(TrackedEvent.created_at.desc()).all()
-    return jsonify({
+    """
+    Newest-first tracked events, keyset-paginated on (created_at, id).
+    Query params:
+      - limit (optional): page size, default 50, max 500
+      - cursor (optional): next_cursor from the previous page
+      - fields (optional): comma-separated subset of TrackedEvent.FIELDS
+    Supports If-None-Match; the ETag changes whenever tracked_events is written.
+    """
+    try:
+        limit = max(1, min(int(request.args.get("limit", DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE))
+    except ValueError:
+        return jsonify({"ok": False, "error": "limit must be an integer"}), 400
+
+    cursor = (request.args.get("cursor") or "").strip()
+    fields_param = (request.args.get("fields") or "").strip()
+    fields = [f.strip() for f in fields_param.split(",") if f.strip()] if fields_param else list(TrackedEvent.FIELDS)
+    unknown = [f for f in fields if f not in TrackedEvent.FIELDS]
+    if unknown:
+        return jsonify({"ok": False, "error": f"unknown fields: {', '.join(unknown)}"}), 400
+
+    version = get_table_version(TrackedEvent.__tablename__)
+    query_sig = hashlib.sha1(f"{limit}|{cursor}|{','.join(fields)}".encode("utf-8")).hexdigest()[:12]
+    etag = f"tracked-{version}-{query_sig}"
+    if request.if_none_match.contains_weak(etag):
+        resp = Response(status=304)
+        resp.set_etag(etag, weak=True)
+        return resp
+
+    # id/created_at are always loaded: they make up the cursor
+    columns = {"id", "created_at", *fields}
+    q = TrackedEvent.query.options(load_only(*[getattr(TrackedEvent, c) for c in columns]))
+
+    if cursor:
+        try:
+            c_created, c_id = _decode_cursor(cursor)
+        except (ValueError, TypeError):
+            return jsonify({"ok": False, "error": "invalid cursor"}), 400
+        q = q.filter(or_(
+            TrackedEvent.created_at < c_created,
+            and_(TrackedEvent.created_at == c_created, TrackedEvent.id < c_id),
+        ))
+
+    rows = q.order_by(TrackedEvent.created_at.desc(), TrackedEvent.id.desc()).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    resp = jsonify({
         "ok": True,
-        "tracked": [r.to_dict() for r in rows]
-    }), 200
+        "tracked": [r.to_dict(fields) for r in rows],
+        "next_cursor": _encode_cursor(rows[-1]) if has_more else None,
+    })
+    resp.set_etag(etag, weak=True)
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp, 200
 
 
 @tracked_bp.route("/tracked", methods=["POST"])
 def add_tracked():
     data = request.get_json(silent=True) or {}
-    
-    name = (data.get("name") or "").strip()
-    if not name:
-        return jsonify({"ok": False, "error": "name is required"}), 400
-
-    existing = TrackedEvent.query.filter(
-        TrackedEvent.name == name,
-        TrackedEvent.event_date == data.get("event_date"),
-        TrackedEvent.venue == data.get("venue")
-    ).first()
-    
-    if existing:
-        return jsonify({"ok": True, "tracked": existing.to_dict(), "message": "already tracked"}), 200
-
-    row = TrackedEvent(
-        name=name,
-        event_date=data.get("event_date"),
-        venue=data.get("venue"),
-        price=data.get("price"),
-        min_price=data.get("min_price"),
-        max_price=data.get("max_price"),
-        url=data.get("url"),
-        platform=data.get("platform"),
-        image=data.get("image"),
-        created_at=datetime.now(timezone.utc)
-    )
-    db.session.add(row)
-    db.session.commit()
 
-    return jsonify({"ok": True, "tracked": row.to_dict()}), 201
+    ok, cleaned, error = validate_tracked_event_request(data)
+    if not ok:
+        return jsonify({"ok": False, "error": error}), 400
+
+    rows, created = upsert_tracked_events([cleaned])
+    if not created[0]:
+        return jsonify({"ok": True, "tracked": rows[0].to_dict(), "message": "already tracked"}), 200
+
+    return jsonify({"ok": True, "tracked": rows[0].to_dict()}), 201
+
+
+@tracked_bp.route("/tracked/bulk", methods=["POST"])
+def add_tracked_bulk():
+    """
+    Track many events in one request / one transaction.
+    Body:
+      { "events": [ {event}, {event}, ... ] }   (max 500)
+    Invalid entries are reported in "errors" and skipped.
+    """
+    data = request.get_json(silent=True) or {}
+    events = data.get("events")
+    if not isinstance(events, list) or not events:
+        return jsonify({"ok": False, "error": "events must be a non-empty list"}), 400
+    if len(events) > MAX_BULK_EVENTS:
+        return jsonify({"ok": False, "error": f"at most {MAX_BULK_EVENTS} events per request"}), 400
+
+    valid, errors = [], []
+    for i, item in enumerate(events):
+        ok, cleaned, error = validate_tracked_event_request(item)
+        if ok:
+            valid.append(cleaned)
+        else:
+            errors.append({"index": i, "error": error})
+
+    rows, created = upsert_tracked_events(valid)
+
+    return jsonify({
+        "ok": True,
+        "tracked": [r.to_dict() for r in rows],
+        "created": sum(created),
+        "existing": len(created) - sum(created),
+        "errors": errors,
+    }), 201 if any(created) else 200
 
 
 @tracked_bp.route("/tracked/<int:tracked_id>", methods=["DELETE"])
@@ -57,7 +143,9 @@ def delete_tracked(tracked_id: int):
     if not row:
         return jsonify({"ok": False, "error": "tracked item not found"}), 404
 
+    PriceAlert.query.filter(PriceAlert.tracked_event_id == tracked_id).delete()
     db.session.delete(row)
+    bump_table_version(TrackedEvent.__tablename__)
     db.session.commit()
 
     return jsonify({"ok": True, "deleted_id": tracked_id}), 200
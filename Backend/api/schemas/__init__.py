@@ -2,3 +2,4 @@ from .scrape_request_schema import validate_scrape_request
 from .ticket_listing_schema import normalize_ticket_listing, normalize_ticket_listings
 from .ticket_results_schema import normalize_ticket_results_response
 from .tracked_artist_schema import validate_tracked_artist_request
+from .tracked_event_schema import validate_tracked_event_request
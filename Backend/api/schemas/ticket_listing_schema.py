@@ -1,5 +1,5 @@
 from typing import Any, Dict, List, Optional
-from utils.price import safe_price
+from utils.price import BASE_CURRENCY, safe_price, safe_prices
 
 
 def normalize_ticket_listing(item: Dict[str, Any], default_artist: Optional[str] = None, default_source: Optional[str] = None) -> Optional[Dict[str, Any]]:
@@ -18,14 +18,16 @@ def normalize_ticket_listing(item: Dict[str, Any], default_artist: Optional[str]
     """
     if not isinstance(item, dict):
         return None
+    return _normalize(item, safe_price(item.get("price"), base_currency=BASE_CURRENCY), default_artist, default_source)
 
+
+def _normalize(item: Dict[str, Any], price_num: Optional[float], default_artist: Optional[str], default_source: Optional[str]) -> Optional[Dict[str, Any]]:
     name = (item.get("name") or item.get("event_name") or "").strip()
     url = (item.get("url") or "").strip()
 
     artist = (item.get("artist") or default_artist or "").strip()
     source = (item.get("source") or default_source or "").strip()
 
-    price_num = safe_price(item.get("price"))
     if not url or price_num is None:
         return None
 
@@ -47,9 +49,9 @@ def normalize_ticket_listings(items: List[Dict[str, Any]], default_artist: Optio
     Normalize a list of listings, dropping invalid rows.
     """
     out: List[Dict[str, Any]] = []
-    for it in items or []:
-        norm = normalize_ticket_listing(
-            it, default_artist=default_artist, default_source=default_source)
+    rows = [it for it in items or [] if isinstance(it, dict)]
+    for it, price_num in zip(rows, safe_prices((it.get("price") for it in rows), base_currency=BASE_CURRENCY)):
+        norm = _normalize(it, price_num, default_artist, default_source)
         if norm:
             out.append(norm)
     return out
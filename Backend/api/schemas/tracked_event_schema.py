@@ -0,0 +1,44 @@
+from typing import Any, Dict, Optional, Tuple
+
+from core.events import event_key
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    return float(value)
+
+
+def validate_tracked_event_request(payload: Dict[str, Any]) -> Tuple[bool, Dict[str, Any], str]:
+    """
+    Validates one event for POST /api/tracked and POST /api/tracked/bulk
+    Expected (search result shape):
+      { "name": "...", "event_date": "...", "venue": "...", "price": 89.5, ... }
+
+    Returns:
+      (ok, cleaned_payload, error_message)
+    cleaned_payload includes the normalized "event_key".
+    """
+    if not isinstance(payload, dict):
+        return False, {}, "Invalid JSON payload"
+
+    name = (payload.get("name") or "").strip()
+    if not name:
+        return False, {}, "name is required"
+
+    try:
+        prices = {f: _optional_float(payload.get(f)) for f in ("price", "min_price", "max_price")}
+    except (TypeError, ValueError):
+        return False, {}, "price, min_price and max_price must be numbers"
+
+    cleaned = {
+        "name": name,
+        "event_date": payload.get("event_date"),
+        "venue": payload.get("venue"),
+        "url": payload.get("url"),
+        "platform": payload.get("platform"),
+        "image": payload.get("image"),
+        **prices,
+    }
+    cleaned["event_key"] = event_key(name, cleaned["event_date"], cleaned["venue"])
+    return True, cleaned, ""
@@ -2,12 +2,18 @@
 
 import os
 from datetime import datetime, timezone
+from functools import partial
 
 from flask import Flask, jsonify, request, send_from_directory
 from flask_cors import CORS
 
 from models import db
+from models.database import configure_sqlite
+from models.migrations import run_migrations
 from api import register_api
+from core.search import set_results_hook
+from services.observations import observe_results
+from utils.http import init_http
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(BASE_DIR, "instance", "database.db")
@@ -17,17 +23,25 @@ FRONTEND_BUILD = os.path.join(os.path.dirname(BASE_DIR), "Frontend", "build")
 def create_app():
     app = Flask(__name__, static_folder=FRONTEND_BUILD, static_url_path="")
     CORS(app)
+    init_http(app)
 
     os.makedirs(os.path.join(BASE_DIR, "instance"), exist_ok=True)
+    # Provider rate limits are shared by every worker process on the machine
+    os.environ.setdefault("RATE_LIMIT_URL", f"sqlite:///{os.path.join(BASE_DIR, 'instance', 'rate_limits.db')}")
 
-    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{DB_PATH}"
+    app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("TICKETS_DATABASE_URI", f"sqlite:///{DB_PATH}")
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    # Bearer token for the maintenance endpoints (cache warm, compaction, retention)
+    app.config["ADMIN_TOKEN"] = os.environ.get("ADMIN_TOKEN", "")
 
     db.init_app(app)
     register_api(app)
+    set_results_hook(partial(observe_results, app))
 
     with app.app_context():
+        configure_sqlite(db.engine)
         db.create_all()
+        run_migrations()
 
     return app
 
@@ -0,0 +1,90 @@
+"""
+Cold-start cost of the Vercel search function (api/search.py).
+
+Each sample starts a fresh interpreter, so nothing is cached between runs.
+"first response" imports the function and serves one /api/search/tickets
+request through its WSGI app with provider keys unset (no network), which is
+the serverless time-to-first-byte minus the provider round trips.
+
+Run from Backend/:
+    python -m benchmarks.bench_coldstart [runs]
+    python -m benchmarks.bench_coldstart --importtime [top]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+API_DIR = os.path.join(REPO_ROOT, "api")
+
+FIRST_REQUEST = """
+import io, search
+environ = {
+    "REQUEST_METHOD": "GET", "PATH_INFO": "/api/search/tickets",
+    "QUERY_STRING": "artist=Calvin+Harris&city=Boston", "SERVER_NAME": "localhost",
+    "SERVER_PORT": "80", "wsgi.url_scheme": "http", "wsgi.input": io.BytesIO(),
+    "wsgi.errors": io.StringIO(), "wsgi.version": (1, 0), "wsgi.multithread": False,
+    "wsgi.multiprocess": False, "wsgi.run_once": True,
+}
+body = b"".join(search.app(environ, lambda status, headers, exc_info=None: None))
+assert b'"ok":true' in body, body[:80]
+"""
+
+
+def _env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env["TICKETMASTER_API_KEY"] = ""
+    env["SEATGEEK_CLIENT_ID"] = ""
+    return env
+
+
+def _wall_ms(code: str, cwd: str = API_DIR) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], cwd=cwd, env=_env(), check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def importtime_report(module: str = "search", cwd: str = API_DIR) -> List[Tuple[str, int, int]]:
+    """
+    Run `python -X importtime -c "import <module>"` and return
+    (module, self_us, cumulative_us) rows, slowest cumulative first.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, env=_env(), check=True, capture_output=True, text=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cum_us)))
+    rows.sort(key=lambda r: r[2], reverse=True)
+    return rows
+
+
+def main(runs: int = 10):
+    baseline = statistics.median(_wall_ms("pass") for _ in range(runs))
+    imported = statistics.median(_wall_ms("import search") for _ in range(runs))
+    served = statistics.median(_wall_ms(FIRST_REQUEST) for _ in range(runs))
+    print(f"bare interpreter: {baseline:7.1f} ms (median of {runs})")
+    print(f"import search:    {imported:7.1f} ms  (+{imported - baseline:.1f} ms)")
+    print(f"first response:   {served:7.1f} ms  (+{served - baseline:.1f} ms)")
+
+
+def print_importtime(top: int = 25):
+    rows = importtime_report()
+    print(f"{'cumulative ms':>13}  {'self ms':>8}  module")
+    for name, self_us, cum_us in rows[:top]:
+        print(f"{cum_us / 1000:13.1f}  {self_us / 1000:8.1f}  {name}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if args and args[0] == "--importtime":
+        print_importtime(int(args[1]) if len(args) > 1 else 25)
+    else:
+        main(int(args[0]) if args else 10)
@@ -0,0 +1,168 @@
+"""
+Concurrent load test of GET /api/search/tickets against local provider stand-ins.
+
+Starts benchmarks/mock_providers.py and the Flask app (dev server and/or
+gunicorn) as subprocesses on a throwaway database, then runs each scenario
+and reports throughput and p50/p95/p99 latency:
+
+    cache-cold       a new artist every request, no city
+    cache-warm       one artist, already cached
+    city-fallback    a new artist every request in a city with no events
+                     (Boston), so the nearby-city fallback runs
+    provider-outage  Ticketmaster answers 503; a new artist every request
+
+Run from Backend/:
+    python -m benchmarks.bench_load [--server dev|gunicorn|both] [--requests 300] [--concurrency 16]
+"""
+import argparse
+import http.client
+import itertools
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+from urllib.parse import quote
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for(port: int, path: str, timeout: float = 20) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+            conn.request("GET", path)
+            if conn.getresponse().status < 500:
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"nothing answering on :{port}{path}")
+
+
+def request(port: int, method: str, path: str, body: bytes = b"") -> Tuple[int, float]:
+    start = time.perf_counter()
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    try:
+        conn.request(method, path, body=body or None, headers={"Content-Type": "application/json"})
+        resp = conn.getresponse()
+        resp.read()
+        return resp.status, time.perf_counter() - start
+    finally:
+        conn.close()
+
+
+def configure_mock(port: int, **config) -> None:
+    request(port, "POST", "/_config", json.dumps(config).encode("utf-8"))
+
+
+def start_app(kind: str, port: int, env: Dict[str, str], workers: int) -> subprocess.Popen:
+    if kind == "gunicorn":
+        cmd = ["gunicorn", "-w", str(workers), "--threads", "4", "-b", f"127.0.0.1:{port}", "app:app"]
+    else:
+        cmd = [sys.executable, "-c",
+               f"from app import app; app.run(host='127.0.0.1', port={port}, threaded=True, debug=False)"]
+    proc = subprocess.Popen(cmd, cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    wait_for(port, "/api/health")
+    return proc
+
+
+def run_scenario(port: int, paths: List[str], concurrency: int) -> Dict[str, float]:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda p: request(port, "GET", p), paths))
+    wall = time.perf_counter() - start
+
+    latencies = sorted(t * 1000 for _, t in results)
+    q = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        "rps": len(paths) / wall,
+        "p50": q[49],
+        "p95": q[94],
+        "p99": q[98],
+        "errors": sum(1 for status, _ in results if status >= 400),
+    }
+
+
+def scenarios(n: int):
+    counter = itertools.count()
+
+    def fresh(city: str = "") -> List[str]:
+        suffix = f"&city={quote(city)}" if city else ""
+        return [f"/api/search/tickets?artist={quote(f'Load Artist {next(counter)}')}{suffix}" for _ in range(n)]
+
+    warm = ["/api/search/tickets?artist=Calvin%20Harris"] * n
+    return [
+        ("cache-cold", {"down": []}, fresh(), None),
+        ("cache-warm", {"down": []}, warm, warm[0]),
+        ("city-fallback", {"down": []}, fresh("Boston"), None),
+        ("provider-outage", {"down": ["ticketmaster"]}, fresh(), None),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--server", choices=["dev", "gunicorn", "both"], default="both")
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=4, help="gunicorn worker processes")
+    parser.add_argument("--latency-ms", type=float, default=60, help="mock provider latency")
+    args = parser.parse_args()
+
+    mock_port = free_port()
+    mock = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.mock_providers", "--port", str(mock_port),
+         "--latency-ms", str(args.latency_ms)],
+        cwd=BACKEND_DIR, stdout=subprocess.DEVNULL,
+    )
+    kinds = ["dev", "gunicorn"] if args.server == "both" else [args.server]
+    try:
+        wait_for(mock_port, "/2/events")
+        print(f"{args.requests} requests per scenario, concurrency {args.concurrency}, "
+              f"mock provider latency {args.latency_ms:.0f} ms")
+        print(f"{'server':<9} {'scenario':<16} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+        for kind in kinds:
+            tmp = tempfile.mkdtemp()
+            env = dict(os.environ)
+            env.update({
+                "TICKETS_DATABASE_URI": f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+                "SEARCH_CACHE_URL": f"sqlite:///{os.path.join(tmp, 'cache.db')}",
+                "RATE_LIMIT_URL": "memory://",
+                "TICKETMASTER_RATE_LIMIT": "100000/s",
+                "SEATGEEK_RATE_LIMIT": "100000/s",
+                "TICKETMASTER_API_KEY": "bench",
+                "SEATGEEK_CLIENT_ID": "bench",
+                "TICKETMASTER_BASE_URL": f"http://127.0.0.1:{mock_port}",
+                "SEATGEEK_BASE_URL": f"http://127.0.0.1:{mock_port}",
+            })
+            port = free_port()
+            app = start_app(kind, port, env, args.workers)
+            try:
+                for name, mock_config, paths, warm_path in scenarios(args.requests):
+                    configure_mock(mock_port, **mock_config)
+                    if warm_path:
+                        request(port, "GET", warm_path)
+                    r = run_scenario(port, paths, args.concurrency)
+                    print(f"{kind:<9} {name:<16} {r['rps']:8.1f} {r['p50']:8.1f} {r['p95']:8.1f} "
+                          f"{r['p99']:8.1f} {r['errors']:7d}")
+            finally:
+                app.terminate()
+                app.wait(timeout=10)
+    finally:
+        mock.terminate()
+        mock.wait(timeout=10)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Micro-benchmark: per-value safe_price vs batch safe_prices.
+
+Run from Backend/:
+    python -m benchmarks.bench_price [count]
+"""
+import random
+import sys
+import time
+
+from utils.price import _parse_str, parse_price, safe_price, safe_prices
+
+# (raw, expected parse_price) - checked before timing
+CASES = (
+    (120, (120.0, None)),
+    ("$1,200", (1200.0, "USD")),
+    ("CA$ 145.00", (145.0, "CAD")),
+    ("1.200,50 €", (1200.5, "EUR")),
+    ("99-120", (99.0, None)),
+    ("$.99", (0.99, "USD")),
+    ("2 tickets from $99", (99.0, "USD")),
+    ("145 CAD", (145.0, "CAD")),
+    ("N/A", (None, None)),
+)
+
+FORMATS = (
+    lambda p: p,
+    lambda p: f"{p}",
+    lambda p: f"${p:,.2f}",
+    lambda p: f"CA$ {p:.2f}",
+    lambda p: f"from ${p:,.0f}",
+    lambda p: f"€{p:.2f}".replace(".", ","),
+    lambda p: f"£{p:,.2f}",
+    lambda p: f"{p:.0f}-{p * 2:.0f}",
+    lambda p: f"${p % 1:.2f}".replace("$0.", "$."),
+    lambda p: f"2 tickets from ${p:,.2f}",
+    lambda p: "N/A",
+)
+
+
+def synthetic_prices(count: int, seed: int = 42):
+    rnd = random.Random(seed)
+    out = []
+    for _ in range(count):
+        # Provider prices cluster on a limited set of values, like real listings
+        price = round(rnd.choice((rnd.uniform(20, 400), rnd.randint(20, 2500))), 2)
+        out.append(rnd.choice(FORMATS)(price))
+    return out
+
+
+def _time(label: str, fn, values):
+    _parse_str.cache_clear()
+    start = time.perf_counter()
+    result = fn(values)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed:8.3f}s  {len(values) / elapsed / 1e6:6.2f} M values/s")
+    return result
+
+
+def check_cases():
+    for raw, expected in CASES:
+        got = parse_price(raw)
+        assert got == expected, f"parse_price({raw!r}) = {got}, expected {expected}"
+
+
+def main(count: int = 1_000_000):
+    check_cases()
+    values = synthetic_prices(count)
+    print(f"{count:,} synthetic prices, {len(set(map(str, values))):,} distinct")
+
+    loop = _time("safe_price (per value)", lambda vs: [safe_price(v) for v in vs], values)
+    batch = _time("safe_prices (batch)", safe_prices, values)
+    _time("safe_prices (batch, to USD)", lambda vs: safe_prices(vs, base_currency="USD"), values)
+
+    assert loop == batch, "batch and per-value results differ"
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,100 @@
+"""
+p50 latency and bytes on the wire for GET /api/search/tickets with a typical
+result set, across JSON encoders, Accept-Encoding and by_platform formats.
+Providers are replaced with synthetic listings; nothing goes over the network.
+
+Run from Backend/:
+    python -m benchmarks.bench_responses [requests_per_case]
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("TICKETS_DATABASE_URI", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+# Measure the full pipeline on every request, not search cache hits
+os.environ.setdefault("SEARCH_CACHE_URL", "none")
+
+from flask.json.provider import DefaultJSONProvider
+
+import core.providers as providers
+from core.listing import Listing
+from utils.http import FastJSONProvider, brotli, orjson
+from app import app
+
+VENUES = ["Scotiabank Arena, Toronto, ON", "Bell Centre, Montreal, QC", "Rogers Arena, Vancouver, BC",
+          "Madison Square Garden, New York, NY", "United Center, Chicago, IL"]
+
+
+def synthetic_listings(platform: str, count: int, seed: int):
+    rnd = random.Random(seed)
+    out = []
+    for i in range(count):
+        price = round(rnd.uniform(40, 400), 2)
+        out.append(Listing(
+            name="Calvin Harris" if i % 3 else "Calvin Harris with Special Guests",
+            event_date=f"2026-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d} 19:30:00",
+            venue=rnd.choice(VENUES),
+            price=price,
+            min_price=price,
+            max_price=round(price * 3, 2),
+            url=f"https://www.{platform.lower()}.com/calvin-harris-tickets/event/{rnd.getrandbits(40):x}",
+            platform=platform,
+            image=f"https://s1.ticketm.net/dam/a/{rnd.getrandbits(64):x}/calvin-harris_RETINA_PORTRAIT_16_9.jpg",
+        ))
+    return out
+
+
+def install_fake_providers(count: int = 20):
+    providers.TICKETMASTER_API_KEY = providers.TICKETMASTER_API_KEY or "bench"
+    providers.SEATGEEK_CLIENT_ID = providers.SEATGEEK_CLIENT_ID or "bench"
+    tm = synthetic_listings("Ticketmaster", count, 1)
+    sg = synthetic_listings("SeatGeek", count, 2)
+    providers.search_ticketmaster = lambda artist, city=None, **kw: [Listing.from_dict(x.to_dict()) for x in tm]
+    providers.search_seatgeek = lambda artist, city=None, **kw: [Listing.from_dict(x.to_dict()) for x in sg]
+
+
+def run_case(client, n: int, encoding: str, query: str):
+    headers = {"Accept-Encoding": encoding} if encoding else {}
+    timings, size = [], 0
+    for _ in range(n):
+        start = time.perf_counter()
+        resp = client.get(f"/api/search/tickets?artist=Calvin%20Harris{query}", headers=headers)
+        timings.append((time.perf_counter() - start) * 1000)
+        size = len(resp.get_data())
+    return statistics.median(timings), size
+
+
+def main(n: int = 200):
+    install_fake_providers()
+    client = app.test_client()
+
+    encoders = [("stdlib json", DefaultJSONProvider)]
+    if orjson is not None:
+        encoders.append(("orjson", FastJSONProvider))
+    encodings = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+
+    # Serialization alone, without the request/DB overhead
+    payload = client.get("/api/search/tickets?artist=Calvin%20Harris").get_json()
+    with app.app_context():
+        for enc_label, provider in encoders:
+            json_provider = provider(app)
+            start = time.perf_counter()
+            for _ in range(n):
+                json_provider.response(payload)
+            print(f"{enc_label:<12} serialize only: {(time.perf_counter() - start) * 1000 / n:.3f} ms/response")
+    print()
+
+    print(f"{'encoder':<12} {'by_platform':<11} {'encoding':<9} {'p50 ms':>8} {'bytes':>8}")
+    for enc_label, provider in encoders:
+        app.json = provider(app)
+        for query, fmt in (("", "full"), ("&by_platform=refs", "refs")):
+            for encoding in encodings:
+                p50, size = run_case(client, n, encoding, query)
+                print(f"{enc_label:<12} {fmt:<11} {encoding:<9} {p50:8.2f} {size:8d}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
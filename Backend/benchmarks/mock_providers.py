@@ -0,0 +1,191 @@
+"""
+Local stand-in for the Ticketmaster Discovery and SeatGeek event search APIs.
+
+Replays the responses in benchmarks/fixtures/, with the searched keyword
+substituted for the artist name and events filtered by the requested city,
+after a configurable latency. Point the app at it with
+TICKETMASTER_BASE_URL / SEATGEEK_BASE_URL.
+
+    python -m benchmarks.mock_providers --port 8099 --latency-ms 80 --error-rate 0.05
+
+Behaviour can be changed while running:
+    POST /_config {"latency_ms": 120, "error_rate": 0, "down": ["ticketmaster"]}
+
+Date and price filters (startDateTime / endDateTime, datetime_local.gte/lte,
+lowest_price.gte/lte) are honoured. Both endpoints page like the real APIs (Ticketmaster `page` from 0, SeatGeek
+`page` from 1); "copies" repeats the fixture events to make deep result sets.
+"""
+import argparse
+import copy
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FIXTURE_ARTIST = "Calvin Harris"
+
+
+def _load(name: str) -> Dict[str, Any]:
+    with open(os.path.join(FIXTURES, name)) as f:
+        return json.load(f)
+
+
+class MockConfig:
+    def __init__(self, latency_ms: float = 50, jitter_ms: float = 20, error_rate: float = 0.0, down=(), copies: int = 1):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        # providers answering 503 to everything
+        self.down = set(down)
+        # each fixture event is served this many times
+        self.copies = copies
+        self.lock = threading.Lock()
+
+    def update(self, data: Dict[str, Any]) -> None:
+        with self.lock:
+            for field in ("latency_ms", "jitter_ms", "error_rate"):
+                if field in data:
+                    setattr(self, field, float(data[field]))
+            if "down" in data:
+                self.down = set(data["down"])
+            if "copies" in data:
+                self.copies = max(1, int(data["copies"]))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"latency_ms": self.latency_ms, "jitter_ms": self.jitter_ms,
+                "error_rate": self.error_rate, "down": sorted(self.down), "copies": self.copies}
+
+
+def _ticketmaster(fixture: Dict[str, Any], params: Dict[str, str], copies: int = 1) -> Dict[str, Any]:
+    keyword = params.get("keyword") or FIXTURE_ARTIST
+    city = (params.get("city") or "").lower()
+    events = []
+    for event in fixture["_embedded"]["events"] * copies:
+        venue_city = event["_embedded"]["venues"][0]["city"]["name"]
+        if city and venue_city.lower() != city:
+            continue
+        day = event["dates"]["start"].get("localDate", "")
+        if day < params.get("startDateTime", "")[:10] or day > (params.get("endDateTime") or "9999")[:10]:
+            continue
+        event = copy.deepcopy(event)
+        event["name"] = event["name"].replace(FIXTURE_ARTIST, keyword)
+        events.append(event)
+    size = int(params.get("size") or 20)
+    number = int(params.get("page") or 0)
+    page = {"size": size, "totalElements": len(events), "totalPages": -(-len(events) // size), "number": number}
+    events = events[number * size:(number + 1) * size]
+    return {"_embedded": {"events": events}, "page": page} if events else {"page": page}
+
+
+def _seatgeek(fixture: Dict[str, Any], params: Dict[str, str], copies: int = 1) -> Dict[str, Any]:
+    keyword = params.get("q") or FIXTURE_ARTIST
+    city = (params.get("venue.city") or "").lower()
+    events = []
+    for event in fixture["events"] * copies:
+        if city and event["venue"]["city"].lower() != city:
+            continue
+        day = event.get("datetime_local", "")[:10]
+        if day < params.get("datetime_local.gte", "")[:10] or day > (params.get("datetime_local.lte") or "9999")[:10]:
+            continue
+        price = event["stats"].get("lowest_price")
+        if ("lowest_price.gte" in params or "lowest_price.lte" in params) and price is None:
+            continue
+        if price is not None and not (float(params.get("lowest_price.gte", "-inf")) <= price <= float(params.get("lowest_price.lte", "inf"))):
+            continue
+        event = copy.deepcopy(event)
+        event["title"] = event["title"].replace(FIXTURE_ARTIST, keyword)
+        events.append(event)
+    per_page = int(params.get("per_page") or 20)
+    page = int(params.get("page") or 1)
+    return {
+        "events": events[(page - 1) * per_page:page * per_page],
+        "meta": {"total": len(events), "per_page": per_page, "page": page},
+    }
+
+
+ROUTES = {
+    "/discovery/v2/events.json": ("ticketmaster", "ticketmaster_events.json", _ticketmaster),
+    "/2/events": ("seatgeek", "seatgeek_events.json", _seatgeek),
+}
+
+
+def make_handler(config: MockConfig):
+    fixtures = {path: _load(name) for path, (_, name, _) in ROUTES.items()}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status: int, payload: Dict[str, Any]) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            route = ROUTES.get(url.path)
+            if route is None:
+                return self._send(404, {"error": "not found"})
+            provider, _, render = route
+            params = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+            with config.lock:
+                latency = max(0.0, config.latency_ms + random.uniform(-1, 1) * config.jitter_ms) / 1000
+                failing = provider in config.down or random.random() < config.error_rate
+                copies = config.copies
+            time.sleep(latency)
+            if failing:
+                return self._send(503, {"error": f"{provider} unavailable"})
+            self._send(200, render(fixtures[url.path], params, copies))
+
+        def do_POST(self):
+            if self.path != "/_config":
+                return self._send(404, {"error": "not found"})
+            length = int(self.headers.get("Content-Length") or 0)
+            config.update(json.loads(self.rfile.read(length) or b"{}"))
+            self._send(200, config.to_dict())
+
+    return Handler
+
+
+def start_mock_server(port: int = 0, config: Optional[MockConfig] = None) -> Tuple[ThreadingHTTPServer, MockConfig]:
+    """Serve in a background thread; returns (server, config). server.server_port has the bound port."""
+    config = config or MockConfig()
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(config))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="mock-providers", daemon=True).start()
+    return server, config
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--jitter-ms", type=float, default=20)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--down", action="append", default=[], help="provider to answer 503 (repeatable)")
+    parser.add_argument("--copies", type=int, default=1, help="serve each fixture event this many times")
+    args = parser.parse_args()
+
+    config = MockConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.down, args.copies)
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(config))
+    server.daemon_threads = True
+    print(f"mock providers on http://127.0.0.1:{server.server_port} {config.to_dict()}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+"""
+Search core shared by the Flask backend and the Vercel function (api/search.py).
+
+Stdlib-only: no Flask, no SQLAlchemy, no requests (providers use urllib).
+Keep it that way - the Vercel function pays for every import on each cold
+start. benchmarks/bench_coldstart.py --importtime shows where it goes.
+"""
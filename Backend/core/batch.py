@@ -0,0 +1,62 @@
+"""
+Multi-artist search: fan a list of (artist, city) queries out over the cached
+search functions.
+
+Queries that normalize to the same search cache key run once. Searches from
+every batch in the process share BATCH_CONCURRENCY slots, so a few large
+batches can't monopolize the provider rate limits that single searches rely on.
+"""
+import os
+import threading
+from contextvars import copy_context
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from core.filters import NO_FILTERS, SearchFilters
+from core.search import cached_search_all_platforms, cached_search_near_city, search_cache_key
+
+BATCH_MAX_QUERIES = int(os.environ.get("BATCH_MAX_QUERIES", "50"))
+BATCH_CONCURRENCY = int(os.environ.get("BATCH_CONCURRENCY", "8"))
+
+_slots = threading.BoundedSemaphore(BATCH_CONCURRENCY)
+
+
+def _search(artist: str, city: Optional[str], max_pages: int, filters: SearchFilters) -> Dict[str, Any]:
+    with _slots:
+        if city:
+            return cached_search_near_city(artist, city, max_pages=max_pages, filters=filters)
+        return cached_search_all_platforms(artist, city, max_pages=max_pages, filters=filters)
+
+
+def run_batch(
+    queries: List[Tuple[str, Optional[str]]],
+    max_pages: int = 1,
+    filters: SearchFilters = NO_FILTERS,
+) -> Iterator[Tuple[List[int], Optional[Dict[str, Any]], Optional[Exception]]]:
+    """
+    Run each distinct query once, in parallel. Yields (query indexes, results,
+    error) as searches complete; every index in `queries` appears exactly once.
+    """
+    groups: Dict[str, List[int]] = {}
+    first: Dict[str, Tuple[str, Optional[str]]] = {}
+    for i, (artist, city) in enumerate(queries):
+        key = ("near:" if city else "") + search_cache_key(artist, city, max_pages, filters)
+        groups.setdefault(key, []).append(i)
+        first.setdefault(key, (artist, city))
+
+    if not groups:
+        return
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    with ThreadPoolExecutor(max_workers=min(len(groups), BATCH_CONCURRENCY)) as executor:
+        # copy_context: provider and cache spans still count toward this request
+        futures = {
+            executor.submit(copy_context().run, _search, artist, city, max_pages, filters): key
+            for key, (artist, city) in first.items()
+        }
+        for future in as_completed(futures):
+            indexes = groups[futures[future]]
+            try:
+                yield indexes, future.result(), None
+            except Exception as e:
+                yield indexes, None, e
@@ -0,0 +1,164 @@
+"""
+Per-provider circuit breakers.
+
+closed     calls go through; outcomes are kept for the last `window` seconds.
+           Once there are at least `min_calls` and the failure rate reaches
+           `failure_rate`, the breaker opens.
+open       calls fail instantly with CircuitOpen for `open_seconds`
+           (doubling on each failed probe, up to `max_open_seconds`).
+half_open  one probe call is let through: success closes the breaker,
+           failure opens it again.
+
+State is per process; each serverless instance learns a provider is down
+from its own first few failures.
+"""
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULT_WINDOW = float(os.environ.get("BREAKER_WINDOW", "60"))
+DEFAULT_MIN_CALLS = int(os.environ.get("BREAKER_MIN_CALLS", "5"))
+DEFAULT_FAILURE_RATE = float(os.environ.get("BREAKER_FAILURE_RATE", "0.5"))
+DEFAULT_OPEN_SECONDS = float(os.environ.get("BREAKER_OPEN_SECONDS", "30"))
+MAX_OPEN_SECONDS = 300.0
+
+
+class CircuitOpen(Exception):
+    """Raised instead of calling a provider whose breaker is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"{name} temporarily disabled after repeated failures, retrying in {retry_in:.0f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        window: float = DEFAULT_WINDOW,
+        min_calls: int = DEFAULT_MIN_CALLS,
+        failure_rate: float = DEFAULT_FAILURE_RATE,
+        open_seconds: float = DEFAULT_OPEN_SECONDS,
+        max_open_seconds: float = MAX_OPEN_SECONDS,
+    ):
+        self.name = name
+        self.window = window
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.open_for = open_seconds
+        self.probe_in_flight = False
+        self.last_error: Optional[str] = None
+        # (timestamp, ok) for calls made while closed
+        self._calls: "deque[Tuple[float, bool]]" = deque()
+        self._lock = threading.Lock()
+
+    def _trim(self, now: float) -> None:
+        while self._calls and self._calls[0][0] < now - self.window:
+            self._calls.popleft()
+
+    def _open(self, now: float) -> None:
+        self.state = OPEN
+        self.opened_at = now
+        self._calls.clear()
+
+    def allow(self) -> bool:
+        """Whether a call may go ahead now. In half_open, only one probe at a time."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            now = time.time()
+            if self.state == OPEN and now >= self.opened_at + self.open_for:
+                self.state = HALF_OPEN
+                self.probe_in_flight = False
+            if self.state == HALF_OPEN and not self.probe_in_flight:
+                self.probe_in_flight = True
+                return True
+            return False
+
+    def retry_in(self) -> float:
+        return max(0.0, self.opened_at + self.open_for - time.time())
+
+    def record(self, ok: Optional[bool], error: Optional[str] = None) -> None:
+        """
+        Record a call outcome. ok=None means "not the provider's fault"
+        (e.g. shed by our own rate limiter): frees a probe slot, counts nothing.
+        """
+        with self._lock:
+            now = time.time()
+            if ok is False:
+                self.last_error = error
+
+            if self.state == HALF_OPEN:
+                self.probe_in_flight = False
+                if ok is True:
+                    self.state = CLOSED
+                    self.open_for = self.open_seconds
+                elif ok is False:
+                    self.open_for = min(self.open_for * 2, self.max_open_seconds)
+                    self._open(now)
+                return
+
+            if self.state != CLOSED or ok is None:
+                return
+            self._calls.append((now, ok))
+            self._trim(now)
+            failures = sum(1 for _, good in self._calls if not good)
+            if len(self._calls) >= self.min_calls and failures / len(self._calls) >= self.failure_rate:
+                self._open(now)
+
+    def call(self, func: Callable[..., Any], *args: Any, neutral: Tuple[Type[BaseException], ...] = (), **kwargs: Any) -> Any:
+        """
+        Run func through the breaker. Raises CircuitOpen without calling it
+        when open; exceptions in `neutral` are re-raised without counting.
+        """
+        if not self.allow():
+            raise CircuitOpen(self.name, self.retry_in())
+        try:
+            result = func(*args, **kwargs)
+        except neutral:
+            self.record(None)
+            raise
+        except Exception as e:
+            self.record(False, str(e))
+            raise
+        self.record(True)
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.time()
+            self._trim(now)
+            failures = sum(1 for _, good in self._calls if not good)
+            return {
+                "state": self.state,
+                "calls_in_window": len(self._calls),
+                "failures_in_window": failures,
+                "retry_in": round(self.retry_in(), 1) if self.state != CLOSED else 0,
+                "last_error": self.last_error,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Process-wide breaker for a provider, created on first use."""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.setdefault(name, CircuitBreaker(name))
+    return breaker
+
@@ -0,0 +1,456 @@
+"""
+Search result cache with a pluggable shared store.
+
+Vercel instances are short-lived, so an in-process cache rarely survives long
+enough to help; point SEARCH_CACHE_URL at a shared store instead:
+
+    memory://                  per-process (default)
+    sqlite:///path/cache.db    shared by processes on one machine / local testing
+    redis://[:password@]host:port/db
+    none                       disable caching
+
+Entries are served fresh for `ttl` seconds, then stale for another `stale_ttl`
+seconds while one background refresh recomputes them (stale-while-revalidate).
+Empty results are cached for a short negative TTL instead. Shared stores get
+an in-process memory tier in front of them.
+Stores only ever hold bytes; values must be JSON-serializable. sqlite3 and
+socket are imported by the store that needs them, not at module import.
+"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+DEFAULT_TTL = int(os.environ.get("SEARCH_CACHE_TTL", "300"))
+DEFAULT_STALE_TTL = int(os.environ.get("SEARCH_CACHE_STALE_TTL", "3600"))
+# Empty results ("no events") are common and cheap to re-check later
+DEFAULT_NEGATIVE_TTL = int(os.environ.get("SEARCH_CACHE_NEGATIVE_TTL", "120"))
+# Upper bound on how long the in-process L1 serves an entry without the shared store
+DEFAULT_LOCAL_TTL = 30
+REFRESH_LOCK_TTL = 30
+
+
+class CacheStore:
+    """Byte store with per-key expiry. Subclasses must be thread-safe."""
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        raise NotImplementedError
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        """Set only if absent; True if stored. Used as a short-lived lock."""
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+
+class MemoryStore(CacheStore):
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _live(self, key: str, now: float) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= now:
+            del self._data[key]
+            return None
+        return entry[1]
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._live(key, time.time())
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.time() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        with self._lock:
+            now = time.time()
+            if self._live(key, now) is not None:
+                return False
+            self._data[key] = (now + ttl, value)
+            return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+
+class SQLiteStore(CacheStore):
+    """One SQLite file shared by every process on the machine (WAL mode)."""
+
+    PRUNE_EVERY = 200
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._writes = 0
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn().execute(
+            "CREATE TABLE IF NOT EXISTS search_cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            import sqlite3
+
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = self._conn().execute(
+            "SELECT value FROM search_cache WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        conn = self._conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO search_cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, time.time() + ttl),
+        )
+        self._writes += 1
+        if self._writes % self.PRUNE_EVERY == 0:
+            conn.execute("DELETE FROM search_cache WHERE expires_at <= ?", (time.time(),))
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        now = time.time()
+        cur = self._conn().execute(
+            "INSERT INTO search_cache (key, value, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at "
+            "WHERE search_cache.expires_at <= ?",
+            (key, value, now + ttl, now),
+        )
+        return cur.rowcount == 1
+
+    def delete(self, key: str) -> None:
+        self._conn().execute("DELETE FROM search_cache WHERE key = ?", (key,))
+
+
+class RedisError(Exception):
+    pass
+
+
+class RedisStore(CacheStore):
+    """
+    Minimal RESP client - just the commands the cache needs, so the serverless
+    bundle doesn't pull in redis-py. One socket, reconnected on failure.
+    """
+
+    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0,
+                 password: Optional[str] = None, timeout: float = 1.0):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self._sock = None
+        self._file = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> None:
+        import socket
+
+        self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._file = self._sock.makefile("rb")
+        if self.password:
+            self._call("AUTH", self.password)
+        if self.db:
+            self._call("SELECT", str(self.db))
+
+    def _close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._file = None
+
+    def _read_reply(self) -> Any:
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("redis connection closed")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest.decode()
+        if kind == b"-":
+            raise RedisError(rest.decode())
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            size = int(rest)
+            if size < 0:
+                return None
+            data = self._file.read(size + 2)
+            return data[:-2]
+        if kind == b"*":
+            size = int(rest)
+            return None if size < 0 else [self._read_reply() for _ in range(size)]
+        raise RedisError(f"unexpected reply {line!r}")
+
+    def _call(self, *args: Any) -> Any:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        self._sock.sendall(b"".join(parts))
+        return self._read_reply()
+
+    def command(self, *args: Any) -> Any:
+        with self._lock:
+            for attempt in (0, 1):
+                try:
+                    if self._sock is None:
+                        self._connect()
+                    return self._call(*args)
+                except (OSError, ConnectionError):
+                    self._close()
+                    if attempt:
+                        raise
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.command("GET", key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.command("SET", key, value, "PX", max(1, int(ttl * 1000)))
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        return self.command("SET", key, value, "PX", max(1, int(ttl * 1000)), "NX") == "OK"
+
+    def delete(self, key: str) -> None:
+        self.command("DEL", key)
+
+
+def store_from_url(url: str) -> Optional[CacheStore]:
+    """Build a store from a SEARCH_CACHE_URL-style string; None disables caching."""
+    url = (url or "").strip()
+    if not url or url.lower() in ("none", "off", "0"):
+        return None
+    parsed = urlparse(url)
+    if parsed.scheme == "memory":
+        return MemoryStore()
+    if parsed.scheme == "sqlite":
+        path = url[len("sqlite:///"):] if url.startswith("sqlite:///") else parsed.path
+        return SQLiteStore(path or "search_cache.db")
+    if parsed.scheme in ("redis", "tcp"):
+        db = (parsed.path or "/0").lstrip("/") or "0"
+        return RedisStore(
+            host=parsed.hostname or "localhost",
+            port=parsed.port or 6379,
+            db=int(db),
+            password=unquote(parsed.password) if parsed.password else None,
+        )
+    raise ValueError(f"unsupported cache url: {url}")
+
+
+class SWRCache:
+    """
+    Stale-while-revalidate cache over a CacheStore.
+
+    get_or_compute() answers from the store when it can: fresh entries as-is,
+    stale ones immediately while a background thread refreshes them (one
+    refresher per key across processes, via store.add as a lock). Store errors
+    never fail the caller - the value is just computed.
+
+    Values `negative` flags (e.g. "no events") are kept for negative_ttl
+    only, with no stale window. With `local`, entries are also kept in an
+    in-process L1 for up to local_ttl seconds, so hot keys skip the shared
+    store round trip.
+    """
+
+    def __init__(self, store: CacheStore, ttl: float = DEFAULT_TTL, stale_ttl: float = DEFAULT_STALE_TTL,
+                 namespace: str = "search", negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+                 local: Optional[MemoryStore] = None, local_ttl: float = DEFAULT_LOCAL_TTL):
+        self.store = store
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.namespace = namespace
+        self.negative_ttl = negative_ttl
+        self.local = local
+        self.local_ttl = local_ttl
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _get_raw(self, key: str) -> Optional[bytes]:
+        if self.local is not None:
+            raw = self.local.get(key)
+            if raw is not None:
+                return raw
+        raw = self.store.get(key)
+        if raw is not None and self.local is not None:
+            self._fill_local(key, raw, json.loads(raw)["stale_until"])
+        return raw
+
+    def _fill_local(self, key: str, raw: bytes, stale_until: float) -> None:
+        ttl = min(self.local_ttl, stale_until - time.time())
+        if ttl > 0:
+            self.local.set(key, raw, ttl)
+
+    def _entry(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            raw = self._get_raw(self._key(key))
+        except Exception as e:
+            print(f"cache get error: {e}")
+            return None
+        return None if raw is None else json.loads(raw)
+
+    def get(self, key: str) -> Tuple[Optional[Any], str]:
+        """(value, "fresh" | "stale" | "miss")"""
+        entry = self._entry(key)
+        if entry is None:
+            return None, "miss"
+        state = "fresh" if entry["fresh_until"] > time.time() else "stale"
+        return entry["value"], state
+
+    def fresh_for(self, key: str) -> float:
+        """Seconds until the entry goes stale; 0 when it is stale or missing."""
+        entry = self._entry(key)
+        return 0.0 if entry is None else max(0.0, entry["fresh_until"] - time.time())
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, stale_ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        stale_ttl = self.stale_ttl if stale_ttl is None else stale_ttl
+        now = time.time()
+        entry = {"fresh_until": now + ttl, "stale_until": now + ttl + stale_ttl, "value": value}
+        raw = json.dumps(entry, separators=(",", ":"), default=str).encode("utf-8")
+        key = self._key(key)
+        if self.local is not None:
+            self._fill_local(key, raw, entry["stale_until"])
+        try:
+            self.store.set(key, raw, ttl + stale_ttl)
+        except Exception as e:
+            print(f"cache set error: {e}")
+
+    def delete(self, key: str) -> None:
+        key = self._key(key)
+        if self.local is not None:
+            self.local.delete(key)
+        try:
+            self.store.delete(key)
+        except Exception as e:
+            print(f"cache delete error: {e}")
+
+    def _store(self, key: str, value: Any, ttl: Optional[float], stale_ttl: Optional[float],
+               cacheable: Optional[Callable[[Any], bool]], negative: Optional[Callable[[Any], bool]]) -> None:
+        if cacheable is not None and not cacheable(value):
+            return
+        if negative is not None and negative(value):
+            self.set(key, value, self.negative_ttl, 0)
+        else:
+            self.set(key, value, ttl, stale_ttl)
+
+    def _refresh(self, key: str, compute: Callable[[], Any], store_args: Tuple) -> None:
+        lock_key = self._key(f"refresh:{key}")
+        try:
+            if not self.store.add(lock_key, b"1", REFRESH_LOCK_TTL):
+                return
+        except Exception as e:
+            print(f"cache lock error: {e}")
+            return
+
+        def run():
+            try:
+                self._store(key, compute(), *store_args)
+            except Exception as e:
+                print(f"cache refresh error for {key}: {e}")
+            finally:
+                try:
+                    self.store.delete(lock_key)
+                except Exception as e:
+                    print(f"cache unlock error: {e}")
+
+        threading.Thread(target=run, name=f"cache-refresh-{key}", daemon=True).start()
+
+    def refresh(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+        negative: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """Compute and store the value now, whatever is cached (for warming ahead of demand)."""
+        value = compute()
+        self._store(key, value, ttl, stale_ttl, cacheable, negative)
+        return value
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+        negative: Optional[Callable[[Any], bool]] = None,
+    ) -> Tuple[Any, str]:
+        """
+        (value, state) where state is "fresh", "stale" (refresh started) or
+        "miss" (computed now). Results failing `cacheable` aren't stored;
+        results matching `negative` are stored for negative_ttl.
+        """
+        store_args = (ttl, stale_ttl, cacheable, negative)
+        value, state = self.get(key)
+        if state == "fresh":
+            return value, state
+        if state == "stale":
+            self._refresh(key, compute, store_args)
+            return value, state
+
+        value = compute()
+        self._store(key, value, *store_args)
+        return value, "miss"
+
+
+_search_cache: Optional[SWRCache] = None
+_search_cache_ready = False
+_search_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> Optional[SWRCache]:
+    """Process-wide search cache from SEARCH_CACHE_URL (default memory://), or None if disabled."""
+    global _search_cache, _search_cache_ready
+    if not _search_cache_ready:
+        with _search_cache_lock:
+            if not _search_cache_ready:
+                store = store_from_url(os.environ.get("SEARCH_CACHE_URL", "memory://"))
+                if store is None:
+                    _search_cache = None
+                elif isinstance(store, MemoryStore):
+                    _search_cache = SWRCache(store)
+                else:
+                    _search_cache = SWRCache(store, local=MemoryStore(max_entries=256))
+                _search_cache_ready = True
+    return _search_cache
+
+
+def set_search_cache(cache: Optional[SWRCache]) -> None:
+    """Replace the process-wide search cache (tests, benchmarks)."""
+    global _search_cache, _search_cache_ready
+    with _search_cache_lock:
+        _search_cache = cache
+        _search_cache_ready = True
@@ -0,0 +1,198 @@
+import math
+import os
+import struct
+from typing import Dict, List, Optional, Tuple
+
+from core.metrics import span
+
+# Precompiled city table: coordinates plus every city's neighbors sorted by
+# distance, so lookups never rebuild the dict or run haversine per request.
+# Regenerate after editing core/city_data.py:
+#     python -m core.cities
+CITIES_BIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cities.bin")
+
+# magic, format version, city count
+_HEADER = struct.Struct("<4sHH")
+_MAGIC = b"CITY"
+_VERSION = 1
+_COORDS = struct.Struct("<dd")
+_NAMES_LEN = struct.Struct("<I")
+# neighbor index, distance in tenths of a mile
+_NEIGHBOR = struct.Struct("<HI")
+
+
+class CityTable:
+    """
+    names[i] / coords[i] per city; neighbors[i] is [(j, tenths_of_mile), ...]
+    for every city (i itself first), nearest first.
+    """
+
+    __slots__ = ("names", "coords", "neighbors", "index")
+
+    def __init__(self, names: List[str], coords: List[Tuple[float, float]],
+                 neighbors: List[List[Tuple[int, int]]]):
+        self.names = names
+        self.coords = coords
+        self.neighbors = neighbors
+        self.index = {name.lower(): i for i, name in enumerate(names)}
+
+
+def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Calculate the distance between two points on Earth in miles."""
+    R = 3959
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    delta_lat = math.radians(lat2 - lat1)
+    delta_lon = math.radians(lon2 - lon1)
+    
+    a = math.sin(delta_lat / 2) ** 2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    
+    return R * c
+
+
+def build_city_table(cities: Dict[str, Tuple[float, float]]) -> CityTable:
+    """Compute the neighbor table from a {name: (lat, lon)} dict."""
+    names = list(cities)
+    coords = [cities[name] for name in names]
+    neighbors = []
+    for lat, lon in coords:
+        row = [(j, int(round(haversine_distance(lat, lon, lat2, lon2) * 10)))
+               for j, (lat2, lon2) in enumerate(coords)]
+        row.sort(key=lambda x: (x[1], x[0]))
+        neighbors.append(row)
+    return CityTable(names, coords, neighbors)
+
+
+def dump_city_table(table: CityTable) -> bytes:
+    n = len(table.names)
+    names = "\n".join(table.names).encode("utf-8")
+    parts = [_HEADER.pack(_MAGIC, _VERSION, n)]
+    parts.extend(_COORDS.pack(lat, lon) for lat, lon in table.coords)
+    parts.append(_NAMES_LEN.pack(len(names)))
+    parts.append(names)
+    for row in table.neighbors:
+        parts.extend(_NEIGHBOR.pack(j, tenths) for j, tenths in row)
+    return b"".join(parts)
+
+
+def load_city_table(data: bytes) -> CityTable:
+    magic, version, n = _HEADER.unpack_from(data, 0)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("unsupported city table format")
+    off = _HEADER.size
+    coords = list(_COORDS.iter_unpack(data[off:off + _COORDS.size * n]))
+    off += _COORDS.size * n
+    (names_len,) = _NAMES_LEN.unpack_from(data, off)
+    off += _NAMES_LEN.size
+    names = data[off:off + names_len].decode("utf-8").split("\n")
+    off += names_len
+    pairs = list(_NEIGHBOR.iter_unpack(data[off:off + _NEIGHBOR.size * n * n]))
+    neighbors = [pairs[i * n:(i + 1) * n] for i in range(n)]
+    return CityTable(names, coords, neighbors)
+
+
+_table: Optional[CityTable] = None
+
+
+def get_city_table() -> CityTable:
+    """
+    The city table, read from CITIES_BIN on first use.
+    Falls back to computing it from core.city_data if the file is missing.
+    """
+    global _table
+    if _table is None:
+        try:
+            with open(CITIES_BIN, "rb") as f:
+                _table = load_city_table(f.read())
+        except (OSError, ValueError, struct.error):
+            from core.city_data import MAJOR_CITIES
+            _table = build_city_table(MAJOR_CITIES)
+    return _table
+
+
+def _find_city(city_name: str) -> Optional[int]:
+    table = get_city_table()
+    city_lower = city_name.lower().strip()
+    i = table.index.get(city_lower)
+    if i is not None:
+        return i
+    for i, city in enumerate(table.names):
+        if city_lower in city.lower() or city.lower() in city_lower:
+            return i
+    return None
+
+
+def get_city_coordinates(city_name: str) -> Optional[Tuple[float, float]]:
+    """Get coordinates for a city name (case-insensitive)."""
+    i = _find_city(city_name)
+    return None if i is None else get_city_table().coords[i]
+
+
+def get_nearby_cities(city_name: str, max_distance: float = 500, limit: int = 5) -> List[Dict]:
+    """Get nearby cities sorted by distance."""
+    table = get_city_table()
+    i = _find_city(city_name)
+    if i is None:
+        return table.names[:limit]
+
+    city_lower = city_name.lower()
+    cities_with_distance = []
+    for j, tenths in table.neighbors[i]:
+        distance = tenths / 10
+        if distance > max_distance or len(cities_with_distance) >= limit:
+            break
+        if table.names[j].lower() != city_lower:
+            cities_with_distance.append({"city": table.names[j], "distance": distance})
+    return cities_with_distance
+
+
+def _step(step: str, search_func, artist: str, city: Optional[str]) -> Dict:
+    with span("city_fallback", step=step) as s:
+        results = search_func(artist, city)
+        s["status"] = "found" if results.get("total_results", 0) > 0 else "empty"
+    return results
+
+
+def find_nearest_city_with_events(original_city: str, search_func, artist: str) -> Dict:
+    """
+    If no events in original city, search nearby cities.
+    Returns results from the nearest city with events.
+    """
+    results = _step("city", search_func, artist, original_city)
+    
+    if results.get("total_results", 0) > 0:
+        results["original_city"] = original_city
+        return results
+    
+    nearby_cities = get_nearby_cities(original_city, max_distance=500, limit=8)
+    
+    for city_info in nearby_cities:
+        city = city_info["city"]
+        city_results = _step("nearby", search_func, artist, city)
+        
+        if city_results.get("total_results", 0) > 0:
+            city_results["original_city"] = original_city
+            city_results["nearest_city"] = city
+            city_results["city"] = city
+            city_results["distance_miles"] = city_info["distance"]
+            city_results["city_suggestion"] = f"No events found in {original_city}. Showing results from {city} ({city_info['distance']} miles away)."
+            return city_results
+    
+    results_no_city = _step("anywhere", search_func, artist, None)
+    results_no_city["original_city"] = original_city
+    results_no_city["city"] = None
+    if results_no_city.get("total_results", 0) > 0:
+        results_no_city["city_suggestion"] = f"No events found near {original_city}. Showing all available events."
+    else:
+        results_no_city["city_suggestion"] = f"No events found for this artist."
+    
+    return results_no_city
+
+
+if __name__ == "__main__":
+    from core.city_data import MAJOR_CITIES
+
+    with open(CITIES_BIN, "wb") as f:
+        f.write(dump_city_table(build_city_table(MAJOR_CITIES)))
+    print(f"wrote {len(MAJOR_CITIES)} cities to {CITIES_BIN}")
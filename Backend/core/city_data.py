@@ -0,0 +1,59 @@
+"""
+Source data for the city table. Edit here, then rebuild core/cities.bin:
+    python -m core.cities
+"""
+
+MAJOR_CITIES = {
+    "New York": (40.7128, -74.0060),
+    "Los Angeles": (34.0522, -118.2437),
+    "Chicago": (41.8781, -87.6298),
+    "Houston": (29.7604, -95.3698),
+    "Phoenix": (33.4484, -112.0740),
+    "Philadelphia": (39.9526, -75.1652),
+    "San Antonio": (29.4241, -98.4936),
+    "San Diego": (32.7157, -117.1611),
+    "Dallas": (32.7767, -96.7970),
+    "San Jose": (37.3382, -121.8863),
+    "Austin": (30.2672, -97.7431),
+    "Jacksonville": (30.3322, -81.6557),
+    "Fort Worth": (32.7555, -97.3308),
+    "Columbus": (39.9612, -82.9988),
+    "Charlotte": (35.2271, -80.8431),
+    "San Francisco": (37.7749, -122.4194),
+    "Indianapolis": (39.7684, -86.1581),
+    "Seattle": (47.6062, -122.3321),
+    "Denver": (39.7392, -104.9903),
+    "Washington": (38.9072, -77.0369),
+    "Boston": (42.3601, -71.0589),
+    "Nashville": (36.1627, -86.7816),
+    "Detroit": (42.3314, -83.0458),
+    "Portland": (45.5152, -122.6784),
+    "Las Vegas": (36.1699, -115.1398),
+    "Memphis": (35.1495, -90.0490),
+    "Louisville": (38.2527, -85.7585),
+    "Baltimore": (39.2904, -76.6122),
+    "Milwaukee": (43.0389, -87.9065),
+    "Albuquerque": (35.0844, -106.6504),
+    "Tucson": (32.2226, -110.9747),
+    "Fresno": (36.7378, -119.7871),
+    "Sacramento": (38.5816, -121.4944),
+    "Kansas City": (39.0997, -94.5786),
+    "Atlanta": (33.7490, -84.3880),
+    "Miami": (25.7617, -80.1918),
+    "Raleigh": (35.7796, -78.6382),
+    "Omaha": (41.2565, -95.9345),
+    "Minneapolis": (44.9778, -93.2650),
+    "Cleveland": (41.4993, -81.6944),
+    "Tampa": (27.9506, -82.4572),
+    "St. Louis": (38.6270, -90.1994),
+    "Pittsburgh": (40.4406, -79.9959),
+    "Cincinnati": (39.1031, -84.5120),
+    "Orlando": (28.5383, -81.3792),
+    "New Orleans": (29.9511, -90.0715),
+    "Toronto": (43.6532, -79.3832),
+    "Montreal": (45.5017, -73.5673),
+    "Vancouver": (49.2827, -123.1207),
+    "Calgary": (51.0447, -114.0719),
+    "Ottawa": (45.4215, -75.6972),
+    "Edmonton": (53.5461, -113.4938),
+}
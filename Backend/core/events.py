@@ -0,0 +1,41 @@
+import hashlib
+import re
+import unicodedata
+from typing import Any, Optional
+
+# Any run of non-letters/digits, in any script
+_NON_WORD_RE = re.compile(r"[\W_]+")
+_DAY_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+
+def normalize_text(value: Any) -> str:
+    """
+    Casefold, strip accents and punctuation, collapse whitespace.
+    Letters of every script are kept, so non-Latin names stay distinct.
+    "Beyoncé — Renaissance Tour!" -> "beyonce renaissance tour"
+    """
+    if not value or not isinstance(value, str):
+        return ""
+    s = unicodedata.normalize("NFKD", value)
+    s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    return _NON_WORD_RE.sub(" ", s.casefold()).strip()
+
+
+def event_day(event_date: Optional[str]) -> str:
+    """
+    Reduce provider date strings ("2026-05-01 19:30:00", "2026-05-01T19:30") to the day.
+    """
+    if not event_date or not isinstance(event_date, str):
+        return ""
+    s = event_date.strip()
+    m = _DAY_RE.match(s)
+    return m.group(0) if m else normalize_text(s)
+
+
+def event_key(name: Optional[str], event_date: Optional[str] = None, venue: Optional[str] = None) -> str:
+    """
+    Stable, provider-independent key for an event observation.
+    Same name/day/venue (after normalization) -> same key.
+    """
+    raw = "|".join([normalize_text(name), event_day(event_date), normalize_text(venue)])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20]
@@ -0,0 +1,172 @@
+"""
+Search filters and sort orders for GET /api/search/tickets.
+
+    date_from / date_to   inclusive "YYYY-MM-DD" bounds on the event date
+    min_price / max_price inclusive bounds on the listing price
+    platforms             lowercased platform names to search ("seatgeek", ...)
+    sort                  "price", "date" or "distance" (from the searched city)
+
+Date and price bounds are pushed down into the provider queries where the API
+supports them, and applied again to what comes back; a platform filter skips
+the other providers entirely. Sorting happens per request, on cached results.
+"""
+from collections import namedtuple
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.cities import get_city_coordinates, haversine_distance
+from core.matching import venue_city
+
+SearchFilters = namedtuple(
+    "SearchFilters",
+    ["date_from", "date_to", "min_price", "max_price", "platforms", "sort"],
+    defaults=(None, None, None, None, frozenset(), None),
+)
+
+NO_FILTERS = SearchFilters()
+
+SORT_KEYS = ("price", "date", "distance")
+PLATFORMS = ("ticketmaster", "seatgeek")
+
+
+def parse_filters(get: Callable[[str], Optional[str]]) -> SearchFilters:
+    """
+    Build SearchFilters from query params; `get(name)` returns the raw value
+    or None. Raises ValueError with a client-facing message on bad input.
+    """
+    def text(name: str) -> Optional[str]:
+        value = (get(name) or "").strip()
+        return value or None
+
+    def day(name: str) -> Optional[str]:
+        value = text(name)
+        if value is None:
+            return None
+        try:
+            return date.fromisoformat(value[:10]).isoformat()
+        except ValueError:
+            raise ValueError(f"{name} must be a YYYY-MM-DD date") from None
+
+    def price(name: str) -> Optional[float]:
+        value = text(name)
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            raise ValueError(f"{name} must be a number") from None
+
+    platforms = frozenset(p.strip().lower() for p in (text("platforms") or "").split(",") if p.strip())
+    unknown = platforms - set(PLATFORMS)
+    if unknown:
+        raise ValueError(f"unknown platforms: {', '.join(sorted(unknown))}")
+
+    sort = (text("sort") or "").lower() or None
+    if sort is not None and sort not in SORT_KEYS:
+        raise ValueError(f"sort must be one of: {', '.join(SORT_KEYS)}")
+
+    return SearchFilters(
+        date_from=day("date_from"),
+        date_to=day("date_to"),
+        min_price=price("min_price"),
+        max_price=price("max_price"),
+        platforms=platforms,
+        sort=sort,
+    )
+
+
+def filters_cache_key(filters: SearchFilters) -> str:
+    """The part of the filters that changes what is fetched (not the sort)."""
+    if filters._replace(sort=None) == NO_FILTERS:
+        return ""
+    return "|f:{}:{}:{}:{}:{}".format(
+        filters.date_from or "",
+        filters.date_to or "",
+        "" if filters.min_price is None else filters.min_price,
+        "" if filters.max_price is None else filters.max_price,
+        ",".join(sorted(filters.platforms)),
+    )
+
+
+def wants_platform(filters: SearchFilters, platform: str) -> bool:
+    return not filters.platforms or platform.lower() in filters.platforms
+
+
+def matches(item: Any, filters: SearchFilters) -> bool:
+    """Whether a listing passes the date and price bounds."""
+    if filters.date_from or filters.date_to:
+        day = (item.get("event_date") or "")[:10]
+        if not day:
+            return False
+        if filters.date_from and day < filters.date_from:
+            return False
+        if filters.date_to and day > filters.date_to:
+            return False
+    if filters.min_price is not None or filters.max_price is not None:
+        price = item.get("price")
+        if not isinstance(price, (int, float)):
+            return False
+        if filters.min_price is not None and price < filters.min_price:
+            return False
+        if filters.max_price is not None and price > filters.max_price:
+            return False
+    return True
+
+
+def _distance_from(origin: Optional[Tuple[float, float]]) -> Callable[[Any], float]:
+    cache: Dict[str, float] = {}
+
+    def distance(item: Any) -> float:
+        city = venue_city(item.get("venue"))
+        if city not in cache:
+            coords = get_city_coordinates(city) if city and origin else None
+            cache[city] = haversine_distance(*origin, *coords) if coords else float("inf")
+        return cache[city]
+    return distance
+
+
+def sort_results(results: Dict[str, Any], sort: Optional[str], origin_city: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Reorder results["listings"] by price, date or distance from origin_city
+    (listings missing the sort field go last, ties keep provider order).
+    Event listing indexes are renumbered and events follow their listings.
+    """
+    listings = results.get("listings") or []
+    if not sort or not listings:
+        return results
+
+    if sort == "price":
+        def key(item):
+            price = item.get("price")
+            return (0, price) if isinstance(price, (int, float)) else (1, 0)
+    elif sort == "date":
+        def key(item):
+            day = item.get("event_date") or ""
+            return (0, day) if day else (1, "")
+    else:
+        distance = _distance_from(get_city_coordinates(origin_city) if origin_city else None)
+
+        def key(item):
+            return (distance(item), item.get("event_date") or "")
+
+    order = sorted(range(len(listings)), key=lambda i: key(listings[i]))
+    new_index = {old: new for new, old in enumerate(order)}
+
+    events: List[Dict[str, Any]] = []
+    for event in results.get("events") or []:
+        cheapest_index = event.get("cheapest_index")
+        events.append({
+            **event,
+            "listing_indexes": sorted(new_index[i] for i in event.get("listing_indexes", [])),
+            "cheapest_index": new_index[cheapest_index] if cheapest_index is not None else None,
+        })
+    events.sort(key=lambda e: e["listing_indexes"][0] if e["listing_indexes"] else len(listings))
+
+    out = dict(results)
+    out["listings"] = [listings[i] for i in order]
+    out["events"] = events
+    out["by_platform"] = {
+        p: sorted(items, key=key) for p, items in (results.get("by_platform") or {}).items()
+    }
+    out["sort"] = sort
+    return out
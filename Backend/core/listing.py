@@ -0,0 +1,62 @@
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Optional
+
+
+@dataclass(slots=True)
+class Listing:
+    """
+    One provider event listing, as it flows through the search pipeline.
+
+    Slotted to keep per-listing memory small and avoid rebuilding dicts at every
+    stage; converted to a dict once, when the response is serialized.
+    Also supports item.get("field") / item["field"] so helpers shared with
+    dict-based code (ranking, matching, price history) accept either.
+    """
+    name: str = ""
+    event_date: str = ""
+    venue: str = ""
+    price: Optional[float] = None
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    url: str = ""
+    platform: str = ""
+    image: str = ""
+
+    # Filled in later in the pipeline
+    event_key: Optional[str] = None
+    event_id: Optional[int] = None
+
+    def get(self, field: str, default: Any = None) -> Any:
+        value = getattr(self, field, None)
+        return default if value is None else value
+
+    def __getitem__(self, field: str) -> Any:
+        try:
+            return getattr(self, field)
+        except AttributeError:
+            raise KeyError(field) from None
+
+    def __setitem__(self, field: str, value: Any) -> None:
+        setattr(self, field, value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        out = {
+            "name": self.name,
+            "event_date": self.event_date,
+            "venue": self.venue,
+            "price": self.price,
+            "min_price": self.min_price,
+            "max_price": self.max_price,
+            "url": self.url,
+            "platform": self.platform,
+            "image": self.image,
+        }
+        if self.event_key is not None:
+            out["event_key"] = self.event_key
+        if self.event_id is not None:
+            out["event_id"] = self.event_id
+        return out
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Listing":
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
@@ -0,0 +1,137 @@
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from core.events import normalize_text, event_day, event_key
+
+# Words providers sprinkle into titles that say nothing about the event itself
+NAME_STOPWORDS = frozenset({
+    "the", "a", "an", "and", "with", "w", "feat", "ft", "featuring", "plus",
+    "special", "guest", "guests", "tickets", "ticket", "live", "in", "at",
+    "concert", "tour", "presents", "show", "vs", "of",
+})
+
+VENUE_STOPWORDS = frozenset({
+    "the", "at", "of", "arena", "center", "centre", "stadium", "theatre",
+    "theater", "hall", "amphitheatre", "amphitheater", "park", "field",
+})
+
+NAME_MATCH_THRESHOLD = 0.5
+VENUE_MATCH_THRESHOLD = 0.34
+
+
+def name_tokens(name: Optional[str]) -> FrozenSet[str]:
+    tokens = normalize_text(name).split()
+    kept = frozenset(t for t in tokens if t not in NAME_STOPWORDS)
+    return kept or frozenset(tokens)
+
+
+def venue_tokens(venue: Optional[str]) -> FrozenSet[str]:
+    """
+    Venue tokens from "Scotiabank Arena, Toronto, ON"-style strings.
+    """
+    return frozenset(t for t in normalize_text(venue).split() if t not in VENUE_STOPWORDS)
+
+
+def venue_city(venue: Optional[str]) -> str:
+    """
+    Providers format venues as "<name>, <city>, <state>"; return the city part.
+    """
+    parts = [p.strip() for p in (venue or "").split(",")]
+    return normalize_text(parts[1]) if len(parts) >= 2 else ""
+
+
+def _jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _same_event(a: Tuple, b: Tuple) -> bool:
+    _, a_name, a_venue, a_city = a
+    _, b_name, b_venue, b_city = b
+
+    # "Calvin Harris" vs "Calvin Harris with Special Guest X"
+    if not (a_name <= b_name or b_name <= a_name or _jaccard(a_name, b_name) >= NAME_MATCH_THRESHOLD):
+        return False
+
+    if a_city and b_city and a_city != b_city:
+        return False
+    return bool(a_city and a_city == b_city) or _jaccard(a_venue, b_venue) >= VENUE_MATCH_THRESHOLD
+
+
+def _blocking_keys(day: str, venue: FrozenSet[str], city: str) -> List[Tuple[str, str]]:
+    keys = [(day, "c:" + city)] if city else []
+    keys.extend((day, "v:" + t) for t in venue)
+    return keys or [(day, "")]
+
+
+def group_listings(listings: List[Dict[str, Any]]) -> List[List[int]]:
+    """
+    Group provider listings that describe the same event.
+
+    Listings are bucketed by blocking keys (event day + venue city, event day +
+    venue token) and only compared inside a bucket, so the work stays close to
+    linear in the number of listings instead of all-pairs.
+
+    Returns groups of listing indexes, in order of first appearance.
+    """
+    parent = list(range(len(listings)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    blocks: Dict[Tuple[str, str], List[int]] = {}
+    features: List[Tuple] = []
+
+    for i, item in enumerate(listings):
+        day = event_day(item.get("event_date"))
+        feat = (day, name_tokens(item.get("name")), venue_tokens(item.get("venue")), venue_city(item.get("venue")))
+        features.append(feat)
+
+        # Listings without a date can't be matched safely
+        if not day:
+            continue
+
+        for block_key in _blocking_keys(day, feat[2], feat[3]):
+            members = blocks.setdefault(block_key, [])
+            for j in members:
+                if find(i) != find(j) and _same_event(feat, features[j]):
+                    parent[find(i)] = find(j)
+            members.append(i)
+
+    groups: Dict[int, List[int]] = {}
+    for i in range(len(listings)):
+        groups.setdefault(find(i), []).append(i)
+    return sorted(groups.values(), key=lambda g: g[0])
+
+
+def build_events(listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Canonical event view over provider listings.
+
+    Each event references its listings by index into `listings` and carries the
+    cheapest one, so "cheapest per event" is a lookup rather than a rescan.
+    Also stamps each listing with its own "event_key".
+    """
+    for item in listings:
+        item["event_key"] = event_key(item.get("name"), item.get("event_date"), item.get("venue"))
+
+    events = []
+    for group in group_listings(listings):
+        first = listings[group[0]]
+        priced = [i for i in group if listings[i].get("price") is not None]
+        cheapest = min(priced, key=lambda i: listings[i]["price"]) if priced else None
+
+        events.append({
+            "name": first.get("name"),
+            "event_date": first.get("event_date"),
+            "venue": first.get("venue"),
+            "event_keys": sorted({listings[i]["event_key"] for i in group}),
+            "platforms": sorted({listings[i].get("platform") for i in group if listings[i].get("platform")}),
+            "listing_indexes": group,
+            "cheapest_index": cheapest,
+            "min_price": listings[cheapest]["price"] if cheapest is not None else None,
+        })
+    return events
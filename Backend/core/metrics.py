@@ -0,0 +1,138 @@
+"""
+Latency spans, Prometheus histograms and Server-Timing.
+
+    with span("provider", provider="ticketmaster") as s:
+        ...
+        s["status"] = "empty"     # optional; defaults to "ok", or "error" on exception
+
+Each span is observed into the histogram for its kind (SPANS) and, inside a
+request started with start_timing(), summed into that request's Server-Timing
+entries. Metrics are per process (each gunicorn worker / serverless instance
+exports its own).
+"""
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PREFIX = "tickets_"
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str], buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # label values -> [per-bucket counts..., +Inf count, sum]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += 1
+            series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted(self._series.items())
+        for key, series in items:
+            base = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(self.labelnames, key))
+            sep = "," if base else ""
+            for bound, count in zip(self.buckets, series):
+                lines.append(f'{self.name}_bucket{{{base}{sep}le="{bound}"}} {count}')
+            lines.append(f'{self.name}_bucket{{{base}{sep}le="+Inf"}} {series[-2]}')
+            lines.append(f"{self.name}_sum{{{base}}} {series[-1]:.6f}")
+            lines.append(f"{self.name}_count{{{base}}} {series[-2]}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+# span kind -> histogram; the first label names the Server-Timing entry
+SPANS: Dict[str, Histogram] = {
+    "provider": Histogram(f"{PREFIX}provider_request_seconds", "Upstream provider call latency",
+                          ("provider", "status")),
+    "city_fallback": Histogram(f"{PREFIX}city_fallback_step_seconds", "City fallback search step latency",
+                               ("step", "status")),
+    "cache": Histogram(f"{PREFIX}search_cache_seconds", "Search cache lookup (and compute on miss)",
+                       ("kind", "status")),
+    "db": Histogram(f"{PREFIX}db_write_seconds", "Database write latency", ("op", "status")),
+    "serialize": Histogram(f"{PREFIX}serialize_seconds", "Response serialization latency", ("step", "status")),
+}
+
+REQUESTS = Histogram(f"{PREFIX}http_request_seconds", "HTTP request latency", ("method", "route", "status"))
+
+# Server-Timing entries of the current request: {"provider-ticketmaster": seconds}
+_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("server_timings", default=None)
+
+
+@contextmanager
+def span(kind: str, /, **labels: str) -> Iterator[Dict[str, str]]:
+    hist = SPANS[kind]
+    labels.setdefault("status", "ok")
+    start = time.perf_counter()
+    try:
+        yield labels
+    except BaseException:
+        if labels["status"] == "ok":
+            labels["status"] = "error"
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        hist.observe(elapsed, **labels)
+        timings = _timings.get()
+        if timings is not None:
+            entry = f"{kind}-{labels.get(hist.labelnames[0], '')}".rstrip("-")
+            timings[entry] = timings.get(entry, 0.0) + elapsed
+
+
+def start_timing() -> Dict[str, float]:
+    """Begin collecting Server-Timing entries for the current request."""
+    timings: Dict[str, float] = {}
+    _timings.set(timings)
+    return timings
+
+
+def current_timings() -> Dict[str, float]:
+    return _timings.get() or {}
+
+
+def server_timing_header(timings: Dict[str, float], total: Optional[float] = None) -> str:
+    parts = [f"{name};dur={seconds * 1000:.1f}" for name, seconds in timings.items()]
+    if total is not None:
+        parts.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(parts)
+
+
+def render_metrics() -> str:
+    """All histograms in the Prometheus text exposition format."""
+    lines: List[str] = []
+    for hist in (*SPANS.values(), REQUESTS):
+        lines.extend(hist.render())
+    return "\n".join(lines) + "\n"
+
+
+def timed(kind: str, /, **labels: str):
+    """Decorator form of span()."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(kind, **labels):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,272 @@
+import json
+import os
+from typing import Any, Callable, List, Dict, Optional
+from urllib.parse import urlencode
+from datetime import datetime
+
+from core.listing import Listing
+from core.ratelimit import get_rate_limiter
+
+TICKETMASTER_API_KEY = os.environ.get("TICKETMASTER_API_KEY", "")
+SEATGEEK_CLIENT_ID = os.environ.get("SEATGEEK_CLIENT_ID", "")
+
+# Overridable so benchmarks can point at a local stand-in (benchmarks/mock_providers.py)
+TICKETMASTER_BASE_URL = os.environ.get("TICKETMASTER_BASE_URL", "https://app.ticketmaster.com").rstrip("/")
+SEATGEEK_BASE_URL = os.environ.get("SEATGEEK_BASE_URL", "https://api.seatgeek.com").rstrip("/")
+
+# One page of PAGE_SIZE by default; deep searches fetch up to max_pages pages
+# of DEEP_PAGE_SIZE, all but the first in parallel
+PAGE_SIZE = 20
+DEEP_PAGE_SIZE = 100
+MAX_PAGES = int(os.environ.get("PROVIDER_MAX_PAGES", "5"))
+PAGE_WORKERS = 4
+
+
+def provider_api_keys() -> Dict[str, str]:
+    """Provider name (as used by core.ratelimit) -> configured API key."""
+    return {
+        "ticketmaster": TICKETMASTER_API_KEY,
+        "seatgeek": SEATGEEK_CLIENT_ID,
+    }
+
+
+def check_api_keys_configured() -> Dict[str, bool]:
+    """Check which API keys are configured."""
+    return {
+        "ticketmaster": bool(TICKETMASTER_API_KEY),
+        "seatgeek": bool(SEATGEEK_CLIENT_ID),
+    }
+
+
+def get_missing_api_keys() -> List[str]:
+    """Return list of missing API keys."""
+    missing = []
+    if not TICKETMASTER_API_KEY:
+        missing.append("TICKETMASTER_API_KEY")
+    if not SEATGEEK_CLIENT_ID:
+        missing.append("SEATGEEK_CLIENT_ID")
+    return missing
+
+
+def _get_json(url: str, params: Dict[str, Any], timeout: float = 10) -> Dict[str, Any]:
+    """
+    GET url?params and decode the JSON body. Raises on non-2xx responses.
+    Uses urllib rather than requests: requests alone costs ~60 ms of import
+    time on a serverless cold start, which is longer than some API calls.
+    """
+    from urllib.request import Request, urlopen
+
+    req = Request(f"{url}?{urlencode(params)}", headers={"Accept": "application/json"})
+    with urlopen(req, timeout=timeout) as response:
+        return json.load(response)
+
+
+def _fetch_pages(fetch_page: Callable[[int], Dict[str, Any]], first_page: int, pages: int) -> List[Dict[str, Any]]:
+    """
+    Fetch `pages` pages starting at first_page: the first one alone (its
+    response says how many exist), the rest concurrently.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if pages <= 1:
+        return [fetch_page(first_page)]
+    with ThreadPoolExecutor(max_workers=min(PAGE_WORKERS, pages)) as executor:
+        return list(executor.map(fetch_page, range(first_page, first_page + pages)))
+
+
+def _parse_ticketmaster(data: Dict[str, Any]) -> List[Listing]:
+    events = data.get("_embedded", {}).get("events", [])
+    results = []
+    
+    for event in events:
+        price_ranges = event.get("priceRanges", [])
+        min_price = None
+        max_price = None
+        
+        if price_ranges:
+            min_price = price_ranges[0].get("min")
+            max_price = price_ranges[0].get("max")
+        
+        venue_info = ""
+        venues = event.get("_embedded", {}).get("venues", [])
+        if venues:
+            venue = venues[0]
+            venue_name = venue.get("name", "")
+            city_name = venue.get("city", {}).get("name", "")
+            state = venue.get("state", {}).get("stateCode", "")
+            venue_info = f"{venue_name}, {city_name}, {state}" if city_name else venue_name
+        
+        event_date = ""
+        dates = event.get("dates", {}).get("start", {})
+        if dates.get("localDate"):
+            event_date = dates.get("localDate")
+            if dates.get("localTime"):
+                event_date += f" {dates.get('localTime')}"
+        
+        results.append(Listing(
+            name=event.get("name", ""),
+            event_date=event_date,
+            venue=venue_info,
+            price=min_price,
+            min_price=min_price,
+            max_price=max_price,
+            url=event.get("url", ""),
+            platform="Ticketmaster",
+            image=event.get("images", [{}])[0].get("url", "") if event.get("images") else "",
+        ))
+    return results
+
+
+def search_ticketmaster(
+    artist: str,
+    city: Optional[str] = None,
+    max_pages: int = 1,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+) -> List[Listing]:
+    """
+    Search Ticketmaster Discovery API for events.
+    Free API with generous rate limits.
+    With max_pages > 1, fetches up to that many pages of DEEP_PAGE_SIZE.
+    date_from / date_to ("YYYY-MM-DD") are sent as startDateTime / endDateTime;
+    Discovery has no price filter, so min_price / max_price are left to the caller.
+    """
+    if not TICKETMASTER_API_KEY:
+        return []
+
+    base_url = f"{TICKETMASTER_BASE_URL}/discovery/v2/events.json"
+    size = PAGE_SIZE if max_pages <= 1 else DEEP_PAGE_SIZE
+    
+    params = {
+        "apikey": TICKETMASTER_API_KEY,
+        "keyword": artist,
+        "size": size,
+        "sort": "date,asc",
+    }
+    
+    if city:
+        params["city"] = city
+    if date_from:
+        params["startDateTime"] = f"{date_from}T00:00:00Z"
+    if date_to:
+        params["endDateTime"] = f"{date_to}T23:59:59Z"
+
+    def fetch_page(page: int) -> Dict[str, Any]:
+        # Raises RateLimited (reported as a failed platform) when over quota
+        get_rate_limiter().acquire("ticketmaster", TICKETMASTER_API_KEY)
+        return _get_json(base_url, {**params, "page": page})
+
+    try:
+        first = fetch_page(0)
+        # Discovery refuses to page past the 1000th result (size * page < 1000)
+        total_pages = min(first.get("page", {}).get("totalPages") or 1, max_pages, 1000 // size)
+        pages = [first] + (_fetch_pages(fetch_page, 1, total_pages - 1) if total_pages > 1 else [])
+
+        results = []
+        for data in pages:
+            results.extend(_parse_ticketmaster(data))
+        return results
+        
+    except Exception as e:
+        # Re-raised so search_all_platforms reports it and the breaker counts it
+        print(f"Ticketmaster API error: {e}")
+        raise
+
+
+def _parse_seatgeek(data: Dict[str, Any]) -> List[Listing]:
+    events = data.get("events", [])
+    results = []
+    
+    for event in events:
+        stats = event.get("stats", {})
+        lowest_price = stats.get("lowest_price")
+        highest_price = stats.get("highest_price")
+        
+        venue = event.get("venue", {})
+        venue_info = f"{venue.get('name', '')}, {venue.get('city', '')}, {venue.get('state', '')}"
+        
+        event_date = event.get("datetime_local", "")
+        if event_date:
+            try:
+                dt = datetime.fromisoformat(event_date.replace("Z", "+00:00"))
+                event_date = dt.strftime("%Y-%m-%d %H:%M")
+            except:
+                pass
+        
+        performers = event.get("performers", [])
+        image = performers[0].get("image", "") if performers else ""
+        
+        results.append(Listing(
+            name=event.get("title", ""),
+            event_date=event_date,
+            venue=venue_info,
+            price=lowest_price,
+            min_price=lowest_price,
+            max_price=highest_price,
+            url=event.get("url", ""),
+            platform="SeatGeek",
+            image=image,
+        ))
+    return results
+
+
+def search_seatgeek(
+    artist: str,
+    city: Optional[str] = None,
+    max_pages: int = 1,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+) -> List[Listing]:
+    """
+    Search SeatGeek API for events.
+    Free API.
+    With max_pages > 1, fetches up to that many pages of DEEP_PAGE_SIZE.
+    Date ("YYYY-MM-DD") and price bounds are sent as datetime_local.gte/lte
+    and lowest_price.gte/lte.
+    """
+    if not SEATGEEK_CLIENT_ID:
+        return []
+
+    base_url = f"{SEATGEEK_BASE_URL}/2/events"
+    per_page = PAGE_SIZE if max_pages <= 1 else DEEP_PAGE_SIZE
+    
+    params = {
+        "client_id": SEATGEEK_CLIENT_ID,
+        "q": artist,
+        "per_page": per_page,
+        "sort": "datetime_local.asc",
+    }
+    
+    if city:
+        params["venue.city"] = city
+    if date_from:
+        params["datetime_local.gte"] = f"{date_from}T00:00:00"
+    if date_to:
+        params["datetime_local.lte"] = f"{date_to}T23:59:59"
+    if min_price is not None:
+        params["lowest_price.gte"] = min_price
+    if max_price is not None:
+        params["lowest_price.lte"] = max_price
+
+    def fetch_page(page: int) -> Dict[str, Any]:
+        get_rate_limiter().acquire("seatgeek", SEATGEEK_CLIENT_ID)
+        return _get_json(base_url, {**params, "page": page})
+
+    try:
+        first = fetch_page(1)
+        total = first.get("meta", {}).get("total") or 0
+        total_pages = min(-(-total // per_page) or 1, max_pages)
+        pages = [first] + (_fetch_pages(fetch_page, 2, total_pages - 1) if total_pages > 1 else [])
+
+        results = []
+        for data in pages:
+            results.extend(_parse_seatgeek(data))
+        return results
+        
+    except Exception as e:
+        print(f"SeatGeek API error: {e}")
+        raise
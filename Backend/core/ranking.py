@@ -0,0 +1,63 @@
+import heapq
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+PriceFn = Callable[[Dict[str, Any]], Optional[float]]
+
+
+def _listing_price(item: Dict[str, Any]) -> Optional[float]:
+    price = item.get("price")
+    return price if isinstance(price, (int, float)) else None
+
+
+def cheapest_k(
+    listings: Iterable[Dict[str, Any]],
+    k: int = 1,
+    price: PriceFn = _listing_price,
+) -> List[Dict[str, Any]]:
+    """
+    The k cheapest listings, cheapest first. Listings without a price are skipped.
+
+    Streams over `listings` with a bounded heap: O(n log k) time, O(k) memory.
+    Ties keep input order.
+    """
+    if k <= 0:
+        return []
+    priced = ((p, i, item) for i, item in enumerate(listings) if (p := price(item)) is not None)
+    if k == 1:
+        best = min(priced, default=None)
+        return [best[2]] if best else []
+    return [item for _, _, item in heapq.nsmallest(k, priced)]
+
+
+def cheapest(listings: Iterable[Dict[str, Any]], price: PriceFn = _listing_price) -> Optional[Dict[str, Any]]:
+    best = cheapest_k(listings, 1, price)
+    return best[0] if best else None
+
+
+def cheapest_k_by_source(
+    listings: Iterable[Dict[str, Any]],
+    k: int = 1,
+    source_key: str = "platform",
+    price: PriceFn = _listing_price,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    cheapest_k per source (grouped by listing[source_key]), in one pass with one heap per source.
+    """
+    if k <= 0:
+        return {}
+    heaps: Dict[str, List] = {}
+    for i, item in enumerate(listings):
+        p = price(item)
+        if p is None:
+            continue
+        heap = heaps.setdefault(item.get(source_key) or "unknown", [])
+        # Max-heap of size k via negated price; ties prefer earlier input
+        entry = (-p, -i, item)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+    return {
+        source: [item for _, _, item in sorted(heap, reverse=True)]
+        for source, heap in heaps.items()
+    }
@@ -0,0 +1,260 @@
+"""
+Token-bucket rate limits for upstream provider APIs.
+
+Each provider has one or more buckets per API key (e.g. 5/s burst plus
+5000/d quota). A call takes one token from every bucket atomically; when a
+bucket is short the caller waits for the refill if that's under max_wait,
+otherwise the call is shed with RateLimited.
+
+Bucket state lives in a backend picked by RATE_LIMIT_URL, so limits hold
+across threads and processes:
+
+    memory://                  one process (default)
+    sqlite:///path/limits.db   every process on the machine
+    redis://host:port/db       every instance
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import namedtuple
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+# spec is the human-readable form, e.g. "5/s"
+Limit = namedtuple("Limit", ["spec", "rate", "capacity"])
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# Ticketmaster Discovery documents 5 requests/second and 5000/day per key.
+# SeatGeek publishes no numbers; stay well under anything plausible.
+DEFAULT_LIMITS = {
+    "ticketmaster": "5/s,5000/d",
+    "seatgeek": "10/s,10000/d",
+}
+
+DEFAULT_MAX_WAIT = float(os.environ.get("RATE_LIMIT_MAX_WAIT", "2"))
+
+
+class RateLimited(Exception):
+    """Raised when a provider call is shed because its quota is exhausted."""
+
+    def __init__(self, provider: str, retry_after: float):
+        super().__init__(f"{provider} rate limit reached, retry in {retry_after:.0f}s")
+        self.provider = provider
+        self.retry_after = retry_after
+
+
+def parse_limits(spec: str) -> List[Limit]:
+    """"5/s,5000/d" -> [Limit("5/s", 5.0, 5), Limit("5000/d", 0.0578.., 5000)]"""
+    limits = []
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        count, _, period = part.partition("/")
+        capacity = int(count)
+        seconds = PERIODS[period.strip().lower()[:1] or "s"]
+        limits.append(Limit(part, capacity / seconds, capacity))
+    return limits
+
+
+def _refill(tokens: float, updated_at: float, now: float, limit: Limit) -> float:
+    return min(limit.capacity, tokens + max(0.0, now - updated_at) * limit.rate)
+
+
+def _take(state: List[Optional[Tuple[float, float]]], limits: Sequence[Limit], cost: float, now: float) -> Tuple[float, List[float]]:
+    """
+    Shared token-bucket step. state[i] is (tokens, updated_at) or None.
+    Returns (wait_seconds, tokens_after); tokens are only spent when wait == 0.
+    """
+    tokens = []
+    wait = 0.0
+    for current, limit in zip(state, limits):
+        t = limit.capacity if current is None else _refill(current[0], current[1], now, limit)
+        tokens.append(t)
+        if t < cost:
+            wait = max(wait, (cost - t) / limit.rate)
+    if wait == 0:
+        tokens = [t - cost for t in tokens]
+    return wait, tokens
+
+
+class MemoryBuckets:
+    def __init__(self):
+        self._state: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def take(self, keys: Sequence[str], limits: Sequence[Limit], cost: float, now: float) -> Tuple[float, List[float]]:
+        with self._lock:
+            wait, tokens = _take([self._state.get(k) for k in keys], limits, cost, now)
+            for k, t in zip(keys, tokens):
+                self._state[k] = (t, now)
+            return wait, tokens
+
+
+class SQLiteBuckets:
+    """Bucket rows updated under BEGIN IMMEDIATE, so processes serialize on the write lock."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn().execute(
+            "CREATE TABLE IF NOT EXISTS rate_buckets ("
+            "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            import sqlite3
+
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def take(self, keys: Sequence[str], limits: Sequence[Limit], cost: float, now: float) -> Tuple[float, List[float]]:
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = dict(
+                (k, (t, u)) for k, t, u in conn.execute(
+                    f"SELECT key, tokens, updated_at FROM rate_buckets WHERE key IN ({','.join('?' * len(keys))})",
+                    list(keys),
+                )
+            )
+            wait, tokens = _take([rows.get(k) for k in keys], limits, cost, now)
+            conn.executemany(
+                "INSERT OR REPLACE INTO rate_buckets (key, tokens, updated_at) VALUES (?, ?, ?)",
+                [(k, t, now) for k, t in zip(keys, tokens)],
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return wait, tokens
+
+
+# Same step as _take(), run atomically inside Redis.
+# KEYS: bucket keys; ARGV: now, cost, then rate/capacity per key.
+_REDIS_TAKE = """
+local now = tonumber(ARGV[1])
+local cost = tonumber(ARGV[2])
+local tokens = {}
+local wait = 0
+for i, key in ipairs(KEYS) do
+  local rate = tonumber(ARGV[1 + 2 * i])
+  local cap = tonumber(ARGV[2 + 2 * i])
+  local s = redis.call('HMGET', key, 't', 'u')
+  local t = cap
+  if s[1] then t = math.min(cap, tonumber(s[1]) + math.max(0, now - tonumber(s[2])) * rate) end
+  tokens[i] = t
+  if t < cost then wait = math.max(wait, (cost - t) / rate) end
+end
+local out = {tostring(wait)}
+for i, key in ipairs(KEYS) do
+  if wait == 0 then tokens[i] = tokens[i] - cost end
+  redis.call('HSET', key, 't', tostring(tokens[i]), 'u', tostring(now))
+  redis.call('EXPIRE', key, 172800)
+  out[#out + 1] = tostring(tokens[i])
+end
+return out
+"""
+
+
+class RedisBuckets:
+    def __init__(self, redis):
+        # core.cache.RedisStore - reused for its RESP connection
+        self.redis = redis
+
+    def take(self, keys: Sequence[str], limits: Sequence[Limit], cost: float, now: float) -> Tuple[float, List[float]]:
+        args = [repr(now), repr(cost)]
+        for limit in limits:
+            args.extend([repr(limit.rate), str(limit.capacity)])
+        reply = self.redis.command("EVAL", _REDIS_TAKE, len(keys), *keys, *args)
+        return float(reply[0]), [float(x) for x in reply[1:]]
+
+
+def buckets_from_url(url: str):
+    parsed = urlparse((url or "memory://").strip())
+    if parsed.scheme == "memory":
+        return MemoryBuckets()
+    if parsed.scheme == "sqlite":
+        path = url[len("sqlite:///"):] if url.startswith("sqlite:///") else parsed.path
+        return SQLiteBuckets(path or "rate_limits.db")
+    if parsed.scheme in ("redis", "tcp"):
+        from core.cache import store_from_url
+
+        return RedisBuckets(store_from_url(url))
+    raise ValueError(f"unsupported rate limit url: {url}")
+
+
+class RateLimiter:
+    def __init__(self, buckets, limits: Optional[Dict[str, List[Limit]]] = None, max_wait: float = DEFAULT_MAX_WAIT):
+        self.buckets = buckets
+        self.limits = limits if limits is not None else {
+            provider: parse_limits(os.environ.get(f"{provider.upper()}_RATE_LIMIT", spec))
+            for provider, spec in DEFAULT_LIMITS.items()
+        }
+        self.max_wait = max_wait
+
+    def _keys(self, provider: str, api_key: str) -> List[str]:
+        # Quotas are per API key; don't put the key itself in shared storage
+        key_id = hashlib.sha1((api_key or "").encode("utf-8")).hexdigest()[:12]
+        return [f"ratelimit:{provider}:{key_id}:{limit.spec}" for limit in self.limits[provider]]
+
+    def acquire(self, provider: str, api_key: str, max_wait: Optional[float] = None) -> float:
+        """
+        Take one token for a call to `provider`, sleeping while the bucket
+        refills if that takes at most max_wait seconds. Returns seconds waited.
+        Raises RateLimited when the call is shed.
+        """
+        limits = self.limits.get(provider)
+        if not limits:
+            return 0.0
+        max_wait = self.max_wait if max_wait is None else max_wait
+        keys = self._keys(provider, api_key)
+        waited = 0.0
+        while True:
+            wait, _ = self.buckets.take(keys, limits, 1, time.time())
+            if wait == 0:
+                return waited
+            if waited + wait > max_wait:
+                raise RateLimited(provider, wait)
+            time.sleep(wait)
+            waited += wait
+
+    def quota(self, provider: str, api_key: str) -> Dict[str, Dict[str, float]]:
+        """Remaining tokens per limit, e.g. {"5000/d": {"remaining": 4990, "capacity": 5000}}."""
+        limits = self.limits.get(provider) or []
+        if not limits:
+            return {}
+        _, tokens = self.buckets.take(self._keys(provider, api_key), limits, 0, time.time())
+        return {
+            limit.spec: {"remaining": int(t), "capacity": limit.capacity}
+            for limit, t in zip(limits, tokens)
+        }
+
+
+_limiter: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Process-wide limiter from RATE_LIMIT_URL (default memory://)."""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = RateLimiter(buckets_from_url(os.environ.get("RATE_LIMIT_URL", "memory://")))
+    return _limiter
+
+
+def set_rate_limiter(limiter: Optional[RateLimiter]) -> None:
+    """Replace the process-wide limiter (tests, benchmarks); None rebuilds it from the environment."""
+    global _limiter
+    with _limiter_lock:
+        _limiter = limiter
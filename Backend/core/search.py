@@ -0,0 +1,325 @@
+from contextvars import copy_context
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from core import providers
+from core.breaker import CircuitOpen, get_breaker
+from core.cache import get_search_cache
+from core.cities import find_nearest_city_with_events
+from core.events import normalize_text
+from core.filters import NO_FILTERS, SearchFilters, filters_cache_key, matches, wants_platform
+from core.matching import build_events
+from core.metrics import span
+from core.ranking import cheapest
+from core.ratelimit import RateLimited
+from core.serialize import dump_results, load_results
+
+
+def _timed(provider: str, func: Callable) -> Callable:
+    def call(artist: str, city: Optional[str]):
+        with span("provider", provider=provider) as s:
+            try:
+                return func(artist, city)
+            except CircuitOpen:
+                s["status"] = "open"
+                raise
+            except RateLimited:
+                s["status"] = "rate_limited"
+                raise
+    return call
+
+
+def _run_providers(
+    calls: Dict[str, Callable], artist: str, city: Optional[str]
+) -> Iterator[Tuple[str, List[Any], Optional[Exception]]]:
+    """
+    Call each provider through its circuit breaker, in parallel when there is
+    more than one. Yields (platform, results, error) as calls complete.
+    """
+    calls = {
+        platform: _timed(platform.lower(), partial(get_breaker(platform.lower()).call, func, neutral=(RateLimited,)))
+        for platform, func in calls.items()
+    }
+    if len(calls) <= 1:
+        for platform, func in calls.items():
+            try:
+                yield platform, func(artist, city), None
+            except Exception as e:
+                yield platform, [], e
+        return
+
+    # Deferred: only needed when several providers are configured
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        # copy_context: spans in worker threads still land in this request's Server-Timing
+        futures = {
+            executor.submit(copy_context().run, func, artist, city): platform
+            for platform, func in calls.items()
+        }
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result(), None
+            except Exception as e:
+                yield futures[future], [], e
+
+
+def search_all_platforms(
+    artist: str,
+    city: Optional[str] = None,
+    max_pages: int = 1,
+    filters: SearchFilters = NO_FILTERS,
+) -> Dict[str, Any]:
+    """
+    Search all ticket platforms in parallel and return combined results.
+    listings / cheapest / by_platform hold Listing objects; serialize with
+    core.serialize.serialize_search_response.
+    max_pages > 1 fetches up to that many upstream pages per provider.
+    filters (core.filters) pick the platforms, are pushed down into the
+    provider queries and applied again to the listings that come back.
+    Note: Gametime does not offer a public API, so it cannot be integrated.
+    """
+    api_status = providers.check_api_keys_configured()
+    
+    all_results = []
+    platform_results = {}
+    warnings = []
+    failed = []
+    
+    want_tm = wants_platform(filters, "Ticketmaster")
+    want_sg = wants_platform(filters, "SeatGeek")
+    if want_tm and not api_status["ticketmaster"]:
+        warnings.append("Ticketmaster API key not configured - Ticketmaster results unavailable")
+    if want_sg and not api_status["seatgeek"]:
+        warnings.append("SeatGeek API key not configured - SeatGeek results unavailable")
+    
+    calls = {}
+    if want_tm and api_status["ticketmaster"]:
+        calls["Ticketmaster"] = providers.search_ticketmaster
+    if want_sg and api_status["seatgeek"]:
+        calls["SeatGeek"] = providers.search_seatgeek
+
+    kwargs = {}
+    if max_pages > 1:
+        kwargs["max_pages"] = max_pages
+    if filters != NO_FILTERS:
+        kwargs.update(
+            date_from=filters.date_from,
+            date_to=filters.date_to,
+            min_price=filters.min_price,
+            max_price=filters.max_price,
+        )
+    if kwargs:
+        calls = {platform: partial(func, **kwargs) for platform, func in calls.items()}
+
+    for platform, results, error in _run_providers(calls, artist, city):
+        if error is not None:
+            print(f"{platform} search error: {error}")
+            platform_results[platform] = []
+            failed.append(platform)
+            warnings.append(f"{platform} search failed: {str(error)}")
+            continue
+        if filters != NO_FILTERS:
+            # Providers only support part of the filters (Discovery has no
+            # price bounds), so apply all of them to what came back
+            results = [x for x in results if matches(x, filters)]
+        platform_results[platform] = results
+        all_results.extend(results)
+
+    # Same concert from several providers -> one event entry
+    events = build_events(all_results)
+    
+    return {
+        "artist": artist,
+        "city": city,
+        "total_results": len(all_results),
+        "cheapest": cheapest(all_results),
+        "listings": all_results,
+        "events": events,
+        "by_platform": platform_results,
+        "api_configured": api_status,
+        "warnings": warnings,
+        "failed_platforms": failed,
+    }
+
+
+def search_cache_key(
+    artist: str, city: Optional[str] = None, max_pages: int = 1, filters: SearchFilters = NO_FILTERS
+) -> str:
+    key = f"v1:{normalize_text(artist)}|{normalize_text(city)}"
+    if max_pages > 1:
+        key = f"{key}|p{max_pages}"
+    return key + filters_cache_key(filters)
+
+
+_results_hook: Optional[Callable[[Dict[str, Any]], None]] = None
+
+
+def set_results_hook(hook: Optional[Callable[[Dict[str, Any]], None]]) -> None:
+    """
+    Call hook(results) with every search result fetched from the providers:
+    cache misses, stale-while-revalidate refreshes and warmer runs alike, so
+    fresh data is observed exactly once however it was fetched. The Flask app
+    records price history and evaluates alerts here. None removes the hook.
+    """
+    global _results_hook
+    _results_hook = hook
+
+
+def _observed(compute: Callable[[], Dict[str, Any]]) -> Callable[[], Dict[str, Any]]:
+    def run() -> Dict[str, Any]:
+        results = compute()
+        hook = _results_hook
+        if hook is not None:
+            try:
+                hook(results)
+            except Exception as e:
+                print(f"search results hook error: {e}")
+        return results
+    return run
+
+
+def _is_empty(data: Dict[str, Any]) -> bool:
+    return not data.get("total_results")
+
+
+def _no_failures(data: Dict[str, Any]) -> bool:
+    return not data.get("failed_platforms")
+
+
+def _through_cache(kind: str, key: str, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Run a search through the shared search cache (core.cache). Empty results
+    are negatively cached, results where a provider call failed aren't cached.
+    Adds "cache": "fresh" | "stale" | "miss" so callers can tell whether they
+    got new data.
+    """
+    cache = get_search_cache()
+    if cache is None:
+        results = compute()
+        results["cache"] = "miss"
+        return results
+
+    with span("cache", kind=kind) as s:
+        data, state = cache.get_or_compute(
+            key,
+            lambda: dump_results(compute()),
+            cacheable=_no_failures,
+            negative=_is_empty,
+        )
+        s["status"] = state
+    results = load_results(data)
+    results["cache"] = state
+    return results
+
+
+def _search_job(
+    artist: str,
+    city: Optional[str],
+    max_pages: int = 1,
+    filters: SearchFilters = NO_FILTERS,
+    near: bool = False,
+) -> Tuple[str, str, Callable[[], Dict[str, Any]]]:
+    """
+    (cache kind, cache key, compute) for a search; compute passes its results
+    to the results hook (set_results_hook). With near=True, the whole
+    nearest-city fallback is cached as one entry: an artist with no events
+    anywhere near `city` otherwise costs the full fallback sequence of
+    provider calls on every request.
+    """
+    key = search_cache_key(artist, city, max_pages, filters)
+    if not near:
+        return "search", key, _observed(lambda: search_all_platforms(artist, city, max_pages, filters))
+
+    def compute():
+        failed = set()
+
+        def search(a, c):
+            results = search_all_platforms(a, c, max_pages, filters)
+            failed.update(results.get("failed_platforms") or [])
+            return results
+
+        results = find_nearest_city_with_events(city, search, artist)
+        results["failed_platforms"] = sorted(failed)
+        return results
+
+    return "near", f"near:{key}", _observed(compute)
+
+
+def cached_search_all_platforms(
+    artist: str, city: Optional[str] = None, max_pages: int = 1, filters: SearchFilters = NO_FILTERS
+) -> Dict[str, Any]:
+    """search_all_platforms through the search cache."""
+    return _through_cache(*_search_job(artist, city, max_pages, filters))
+
+
+def cached_search_near_city(
+    artist: str, city: str, max_pages: int = 1, filters: SearchFilters = NO_FILTERS
+) -> Dict[str, Any]:
+    """find_nearest_city_with_events through the search cache, cached as a whole."""
+    return _through_cache(*_search_job(artist, city, max_pages, filters, near=True))
+
+
+def search_fresh_for(artist: str, city: Optional[str] = None) -> float:
+    """Seconds until the cached search goes stale (inf with no cache, 0 when missing or stale)."""
+    cache = get_search_cache()
+    if cache is None:
+        return float("inf")
+    return cache.fresh_for(_search_job(artist, city or None, near=bool(city))[1])
+
+
+def warm_search(artist: str, city: Optional[str] = None, refresh_within: float = 0) -> str:
+    """
+    Refresh a search's cache entry ahead of demand if it is missing, stale or
+    goes stale within refresh_within seconds. Returns "fresh" (left alone),
+    "warmed", or "failed" (a provider call failed, so nothing was cached).
+    """
+    cache = get_search_cache()
+    if cache is None:
+        return "fresh"
+    kind, key, compute = _search_job(artist, city or None, near=bool(city))
+    if cache.fresh_for(key) > refresh_within:
+        return "fresh"
+    with span("cache", kind=kind, status="warm"):
+        data = cache.refresh(key, lambda: dump_results(compute()), cacheable=_no_failures, negative=_is_empty)
+    return "warmed" if _no_failures(data) else "failed"
+
+
+def paginate_results(results: Dict[str, Any], page: int, limit: int) -> Dict[str, Any]:
+    """
+    One page of `limit` listings out of a (cached) search result, so paging
+    through a deep search never goes back to the providers. total_results and
+    cheapest still describe the whole result; by_platform and events are cut
+    down to the listings on the page, with event listing indexes renumbered.
+    """
+    listings = results.get("listings") or []
+    total_pages = max(1, -(-len(listings) // limit))
+    start = (page - 1) * limit
+    page_listings = listings[start:start + limit]
+    on_page = {id(x) for x in page_listings}
+
+    events = []
+    for event in results.get("events") or []:
+        indexes = [i - start for i in event.get("listing_indexes", []) if start <= i < start + limit]
+        if not indexes:
+            continue
+        cheapest_index = event.get("cheapest_index")
+        events.append({
+            **event,
+            "listing_indexes": indexes,
+            "cheapest_index": cheapest_index - start if cheapest_index is not None and start <= cheapest_index < start + limit else None,
+        })
+
+    out = dict(results)
+    out["listings"] = page_listings
+    out["events"] = events
+    out["by_platform"] = {
+        p: [x for x in items if id(x) in on_page] for p, items in (results.get("by_platform") or {}).items()
+    }
+    out["pagination"] = {
+        "page": page,
+        "limit": limit,
+        "total_pages": total_pages,
+        "has_more": page < total_pages,
+    }
+    return out
@@ -0,0 +1,72 @@
+from typing import Any, Dict
+
+
+def serialize_search_response(results: Dict[str, Any], platform_refs: bool = False) -> Dict[str, Any]:
+    """
+    Turn search_all_platforms output (Listing objects) into the JSON body for
+    GET /api/search/tickets. Each listing is converted to a dict exactly once.
+
+    With platform_refs=True, by_platform holds indexes into "listings" instead
+    of repeating the listing objects:
+      "by_platform": {"SeatGeek": [0, 3], "Ticketmaster": [1, 2]}
+    top / top_by_platform are always inline: they are ranked over the whole
+    result, so with a paginated response most of them aren't in "listings".
+    """
+    listings = results.get("listings") or []
+    dicts = [x.to_dict() if hasattr(x, "to_dict") else x for x in listings]
+    index_of = {id(x): i for i, x in enumerate(listings)}
+
+    def one(item):
+        if item is None:
+            return None
+        i = index_of.get(id(item))
+        if i is not None:
+            return dicts[i]
+        return item.to_dict() if hasattr(item, "to_dict") else item
+
+    def many(items):
+        if platform_refs:
+            return [index_of[id(x)] for x in items if id(x) in index_of]
+        return [one(x) for x in items]
+
+    out = dict(results)
+    out["listings"] = dicts
+    out["cheapest"] = one(results.get("cheapest"))
+    out["by_platform"] = {p: many(items) for p, items in (results.get("by_platform") or {}).items()}
+    if "top" in results:
+        out["top"] = [one(x) for x in results["top"]]
+    if "top_by_platform" in results:
+        out["top_by_platform"] = {p: [one(x) for x in items] for p, items in results["top_by_platform"].items()}
+    if platform_refs:
+        out["by_platform_format"] = "refs"
+    return out
+
+
+def dump_results(results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    JSON-safe copy of search_all_platforms output for caching: listings become
+    dicts, and cheapest / by_platform become indexes into them.
+    """
+    listings = results.get("listings") or []
+    index_of = {id(x): i for i, x in enumerate(listings)}
+    out = dict(results)
+    out["listings"] = [x.to_dict() if hasattr(x, "to_dict") else x for x in listings]
+    out["cheapest"] = index_of.get(id(results.get("cheapest")))
+    out["by_platform"] = {
+        p: [index_of[id(x)] for x in items if id(x) in index_of]
+        for p, items in (results.get("by_platform") or {}).items()
+    }
+    return out
+
+
+def load_results(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of dump_results: rebuild Listing objects and the references to them."""
+    from core.listing import Listing
+
+    listings = [Listing.from_dict(x) for x in data.get("listings") or []]
+    out = dict(data)
+    out["listings"] = listings
+    cheapest = data.get("cheapest")
+    out["cheapest"] = listings[cheapest] if cheapest is not None else None
+    out["by_platform"] = {p: [listings[i] for i in idx] for p, idx in (data.get("by_platform") or {}).items()}
+    return out
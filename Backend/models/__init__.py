@@ -1,5 +1,10 @@
 from .database import db
-from .artist_search import ArtistSearch
+from .artist_search import ArtistSearch, ArtistSearchRollup
 from .ticket_listing import TicketListing
 from .tracked_artist import TrackedArtist
 from .tracked_event import TrackedEvent
+from .price_history import PricePoint, PriceRollup
+from .event import Event, EventAlias
+from .price_alert import PriceAlert
+from .table_version import TableVersion, get_table_version, bump_table_version
+from .job_watermark import JobWatermark, get_watermark, set_watermark
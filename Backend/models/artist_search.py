@@ -10,13 +10,47 @@ class ArtistSearch(db.Model):
     # What the user searched, e.g. "Calvin Harris"
     artist = db.Column(db.String(200), nullable=False, index=True)
 
-    # When the search happened
-    created_at = db.Column(db.DateTime, nullable=False,
+    # City searched in, if any; lets the cache warmer keep (artist, city) searches hot
+    city = db.Column(db.String(200), nullable=True)
+
+    # When the search happened; indexed for the retention job
+    created_at = db.Column(db.DateTime, nullable=False, index=True,
                            default=lambda: datetime.now(timezone.utc))
 
     def to_dict(self):
         return {
             "id": self.id,
             "artist": self.artist,
+            "city": self.city,
             "created_at": self.created_at.isoformat() if self.created_at else None,
         }
+
+
+class ArtistSearchRollup(db.Model):
+    """
+    Searches per (normalized artist, hour), updated with every ArtistSearch
+    insert so analytics never scan raw searches (which are eventually deleted).
+    """
+    __tablename__ = "artist_search_rollups"
+    __table_args__ = (
+        # Window queries: bucket range scan, grouped by artist, count from the index
+        db.Index("ix_artist_search_rollups_bucket_artist", "bucket_ts", "artist_key", "count"),
+    )
+
+    # core.events.normalize_text(artist)
+    artist_key = db.Column(db.String(200), primary_key=True)
+
+    # Hour start (unix seconds, UTC)
+    bucket_ts = db.Column(db.Integer, primary_key=True)
+
+    # Most recent spelling searched in this hour, for display
+    artist = db.Column(db.String(200), nullable=False)
+
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+    def to_dict(self):
+        return {
+            "artist": self.artist,
+            "ts": self.bucket_ts,
+            "count": self.count,
+        }
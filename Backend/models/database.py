@@ -1,3 +1,25 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
 
 db = SQLAlchemy()
+
+# How long a connection waits on a locked database before "database is locked"
+SQLITE_BUSY_TIMEOUT_MS = 5000
+
+
+def _sqlite_pragmas(dbapi_conn, connection_record) -> None:
+    cursor = dbapi_conn.cursor()
+    # WAL: readers (long exports, analytics) no longer block writers or vice versa
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.close()
+
+
+def configure_sqlite(engine) -> None:
+    """
+    Set WAL mode and a busy timeout on every new SQLite connection.
+    Call before the engine's first connection.
+    """
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _sqlite_pragmas)
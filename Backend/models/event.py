@@ -0,0 +1,42 @@
+from .database import db
+
+
+class Event(db.Model):
+    """
+    Canonical event, shared by every provider listing that describes it.
+    """
+    __tablename__ = "events"
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(300), nullable=False)
+
+    # Day of the event, "YYYY-MM-DD"
+    event_date = db.Column(db.String(10), nullable=True, index=True)
+
+    venue = db.Column(db.String(300), nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False)
+
+    aliases = db.relationship("EventAlias", backref="event", lazy="select",
+                              cascade="all, delete-orphan")
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "name": self.name,
+            "event_date": self.event_date,
+            "venue": self.venue,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
+
+
+class EventAlias(db.Model):
+    """
+    Maps a provider listing's event_key (core.events.event_key) to its canonical Event.
+    """
+    __tablename__ = "event_aliases"
+
+    event_key = db.Column(db.String(40), primary_key=True)
+    event_id = db.Column(db.Integer, db.ForeignKey("events.id"), nullable=False, index=True)
+
+    # Platform the alias was first seen on
+    platform = db.Column(db.String(50), nullable=True)
@@ -0,0 +1,35 @@
+from datetime import datetime, timezone
+
+from sqlalchemy.dialects.sqlite import insert
+
+from .database import db
+
+
+class JobWatermark(db.Model):
+    """
+    How far an incremental maintenance job got: the highest row id it has
+    fully processed, so the next run only looks at newer rows.
+    """
+    __tablename__ = "job_watermarks"
+
+    name = db.Column(db.String(100), primary_key=True)
+    value = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=True)
+
+
+def get_watermark(name: str) -> int:
+    row = db.session.get(JobWatermark, name)
+    return row.value if row else 0
+
+
+def set_watermark(name: str, value: int) -> None:
+    """
+    Record `value` for job `name`. Does not commit.
+    """
+    now = datetime.now(timezone.utc)
+    stmt = insert(JobWatermark).values(name=name, value=value, updated_at=now)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["name"],
+        set_={"value": stmt.excluded.value, "updated_at": stmt.excluded.updated_at},
+    )
+    db.session.execute(stmt)
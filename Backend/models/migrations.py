@@ -0,0 +1,107 @@
+from sqlalchemy import inspect, text
+
+from .database import db
+
+
+def _add_tracked_event_key(engine) -> None:
+    """
+    tracked_events.event_key: add, backfill, and fold duplicate rows into the
+    oldest one so the unique index can be built.
+    """
+    from core.events import event_key
+
+    columns = {c["name"] for c in inspect(engine).get_columns("tracked_events")}
+    if "event_key" in columns:
+        return
+
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE tracked_events ADD COLUMN event_key VARCHAR(40)"))
+        rows = conn.execute(text("SELECT id, name, event_date, venue FROM tracked_events ORDER BY id")).all()
+
+        keep = {}
+        for row_id, name, event_date, venue in rows:
+            key = event_key(name, event_date, venue)
+            if key not in keep:
+                keep[key] = row_id
+                conn.execute(text("UPDATE tracked_events SET event_key = :k WHERE id = :id"), {"k": key, "id": row_id})
+                continue
+            conn.execute(text("UPDATE price_alerts SET tracked_event_id = :keep WHERE tracked_event_id = :id"),
+                         {"keep": keep[key], "id": row_id})
+            conn.execute(text("DELETE FROM tracked_events WHERE id = :id"), {"id": row_id})
+
+
+def _add_ticket_listing_intervals(engine) -> None:
+    """ticket_listings.last_seen_at / observations, for compacted price runs."""
+    columns = {c["name"] for c in inspect(engine).get_columns("ticket_listings")}
+    with engine.begin() as conn:
+        if "last_seen_at" not in columns:
+            conn.execute(text("ALTER TABLE ticket_listings ADD COLUMN last_seen_at DATETIME"))
+        if "observations" not in columns:
+            conn.execute(text("ALTER TABLE ticket_listings ADD COLUMN observations INTEGER NOT NULL DEFAULT 1"))
+
+
+def _add_artist_search_city(engine) -> None:
+    """artist_searches.city, for warming the (artist, city) searches users make."""
+    columns = {c["name"] for c in inspect(engine).get_columns("artist_searches")}
+    if "city" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE artist_searches ADD COLUMN city VARCHAR(200)"))
+
+
+def _backfill_artist_search_rollups(engine) -> None:
+    """
+    artist_search_rollups: count the searches logged before the rollup
+    existed. Only runs while the rollup table is empty.
+    """
+    from datetime import datetime, timezone
+
+    from core.events import normalize_text
+
+    with engine.begin() as conn:
+        if conn.execute(text("SELECT 1 FROM artist_search_rollups LIMIT 1")).first():
+            return
+        rows = conn.execute(text(
+            "SELECT artist, strftime('%Y-%m-%d %H:00:00', created_at) AS hour, COUNT(*) "
+            "FROM artist_searches GROUP BY artist, hour"
+        )).all()
+
+        counts = {}
+        for artist, hour, count in rows:
+            key = normalize_text(artist)
+            if not key or hour is None:
+                continue
+            ts = int(datetime.fromisoformat(hour).replace(tzinfo=timezone.utc).timestamp())
+            name, total = counts.get((key, ts), (artist.strip(), 0))
+            counts[(key, ts)] = (name, total + count)
+
+        if counts:
+            conn.execute(
+                text("INSERT INTO artist_search_rollups (artist_key, bucket_ts, artist, count) "
+                     "VALUES (:key, :ts, :artist, :count)"),
+                [{"key": key, "ts": ts, "artist": name, "count": total}
+                 for (key, ts), (name, total) in counts.items()],
+            )
+
+
+def run_migrations() -> None:
+    """
+    Bring an existing SQLite file up to date with the models.
+    db.create_all() only creates missing tables, so columns and indexes added
+    to existing tables are handled here. Safe to run on every startup.
+    """
+    engine = db.engine
+    existing = set(inspect(engine).get_table_names())
+
+    if "tracked_events" in existing:
+        _add_tracked_event_key(engine)
+    if "artist_searches" in existing:
+        _add_artist_search_city(engine)
+        _backfill_artist_search_rollups(engine)
+    if "ticket_listings" in existing:
+        _add_ticket_listing_intervals(engine)
+
+    for table in db.metadata.sorted_tables:
+        if table.name not in existing:
+            continue
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
@@ -0,0 +1,56 @@
+from .database import db
+
+
+class PriceAlert(db.Model):
+    """
+    Watch rule on a tracked event: fire when a new observation is at or below
+    a target price, or a percentage below the price at the time it was set.
+    """
+    __tablename__ = "price_alerts"
+    __table_args__ = (
+        # Evaluator lookup: active rules for the observed events whose threshold is reachable
+        db.Index("ix_price_alerts_key_active_trigger", "event_key", "active", "trigger_cents"),
+        db.Index("ix_price_alerts_event_active_trigger", "event_id", "active", "trigger_cents"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    tracked_event_id = db.Column(db.Integer, db.ForeignKey("tracked_events.id"), nullable=False, index=True)
+
+    # core.events.event_key of the tracked event
+    event_key = db.Column(db.String(40), nullable=False)
+
+    # Canonical Event id, if the tracked event has been matched to one
+    event_id = db.Column(db.Integer, nullable=True)
+
+    target_price = db.Column(db.Float, nullable=True)
+    drop_pct = db.Column(db.Float, nullable=True)
+    baseline_price = db.Column(db.Float, nullable=True)
+
+    # Precomputed threshold in cents: fire when observed price <= trigger_cents
+    trigger_cents = db.Column(db.Integer, nullable=False)
+
+    active = db.Column(db.Boolean, nullable=False, default=True)
+
+    # Optional per-alert webhook; falls back to ALERT_WEBHOOK_URL
+    webhook_url = db.Column(db.String(500), nullable=True)
+
+    last_triggered_at = db.Column(db.DateTime, nullable=True)
+    last_triggered_price = db.Column(db.Float, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False)
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "tracked_event_id": self.tracked_event_id,
+            "event_key": self.event_key,
+            "event_id": self.event_id,
+            "target_price": self.target_price,
+            "drop_pct": self.drop_pct,
+            "baseline_price": self.baseline_price,
+            "trigger_price": self.trigger_cents / 100.0,
+            "active": self.active,
+            "webhook_url": self.webhook_url,
+            "last_triggered_at": self.last_triggered_at.isoformat() if self.last_triggered_at else None,
+            "last_triggered_price": self.last_triggered_price,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
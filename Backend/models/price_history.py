@@ -0,0 +1,63 @@
+from .database import db
+
+
+class PricePoint(db.Model):
+    """
+    One raw price observation. Compact: integer cents + epoch seconds.
+    """
+    __tablename__ = "price_history"
+    __table_args__ = (
+        # Newest points of an event across sources, without sorting its history
+        db.Index("ix_price_history_key_ts", "event_key", "ts"),
+    )
+
+    # core.events.event_key(name, event_date, venue)
+    event_key = db.Column(db.String(40), primary_key=True)
+
+    # ticketmaster / seatgeek / gametime
+    source = db.Column(db.String(50), primary_key=True)
+
+    # Observation time (unix seconds, UTC)
+    ts = db.Column(db.Integer, primary_key=True)
+
+    price_cents = db.Column(db.Integer, nullable=False)
+
+    def to_dict(self):
+        return {
+            "event_key": self.event_key,
+            "source": self.source,
+            "ts": self.ts,
+            "price": self.price_cents / 100.0,
+        }
+
+
+class PriceRollup(db.Model):
+    """
+    Hourly / daily min-max-last per (event, source), updated on every insert
+    into price_history so charts never have to scan raw points.
+    """
+    __tablename__ = "price_rollups"
+
+    event_key = db.Column(db.String(40), primary_key=True)
+    source = db.Column(db.String(50), primary_key=True)
+
+    # "hour" / "day"
+    resolution = db.Column(db.String(8), primary_key=True)
+
+    # Bucket start (unix seconds, UTC)
+    bucket_ts = db.Column(db.Integer, primary_key=True)
+
+    min_cents = db.Column(db.Integer, nullable=False)
+    max_cents = db.Column(db.Integer, nullable=False)
+    last_cents = db.Column(db.Integer, nullable=False)
+    last_ts = db.Column(db.Integer, nullable=False)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+    def to_dict(self):
+        return {
+            "ts": self.bucket_ts,
+            "min": self.min_cents / 100.0,
+            "max": self.max_cents / 100.0,
+            "last": self.last_cents / 100.0,
+            "count": self.count,
+        }
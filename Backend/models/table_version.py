@@ -0,0 +1,31 @@
+from sqlalchemy.dialects.sqlite import insert
+
+from .database import db
+
+
+class TableVersion(db.Model):
+    """
+    Monotonic change counter per table. Bumped in the same transaction as the
+    write, so readers can build cache validators (ETags) without scanning.
+    """
+    __tablename__ = "table_versions"
+
+    name = db.Column(db.String(100), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+
+def get_table_version(name: str) -> int:
+    row = db.session.get(TableVersion, name)
+    return row.version if row else 0
+
+
+def bump_table_version(name: str) -> None:
+    """
+    Increment the counter for `name`. Does not commit.
+    """
+    stmt = insert(TableVersion).values(name=name, version=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["name"],
+        set_={"version": TableVersion.version + 1},
+    )
+    db.session.execute(stmt)
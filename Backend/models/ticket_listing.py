@@ -3,6 +3,10 @@ from .database import db
 
 class TicketListing(db.Model):
     __tablename__ = "ticket_listings"
+    __table_args__ = (
+        # One price series per listing, in time order (services.listing_retention compaction)
+        db.Index("ix_ticket_listings_series", "artist", "source", "name", "url", "created_at"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
 
@@ -24,6 +28,12 @@ class TicketListing(db.Model):
     # When this price was recorded
     created_at = db.Column(db.DateTime, nullable=False, index=True)
 
+    # After compaction (services.listing_retention) one row can stand for a run
+    # of identical consecutive observations: seen from created_at until
+    # last_seen_at, `observations` times. Null / 1 for a single observation.
+    last_seen_at = db.Column(db.DateTime, nullable=True)
+    observations = db.Column(db.Integer, nullable=False, default=1, server_default="1")
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -33,4 +43,6 @@ class TicketListing(db.Model):
             "price": float(self.price),
             "url": self.url,
             "created_at": self.created_at.isoformat() if self.created_at else None,
+            "last_seen_at": (self.last_seen_at or self.created_at).isoformat() if self.created_at else None,
+            "observations": self.observations or 1,
         }
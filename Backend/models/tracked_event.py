@@ -3,9 +3,25 @@ from .database import db
 
 class TrackedEvent(db.Model):
     __tablename__ = "tracked_events"
+    __table_args__ = (
+        # Keyset pagination for GET /api/tracked (newest first)
+        db.Index("ix_tracked_events_created_at_id", "created_at", "id"),
+        # One row per normalized (name, day, venue); target of INSERT ... ON CONFLICT
+        db.Index("ux_tracked_events_event_key", "event_key", unique=True),
+    )
+
+    # Everything to_dict() can return, in output order
+    FIELDS = (
+        "id", "name", "event_date", "venue", "price", "min_price", "max_price",
+        "url", "platform", "image", "created_at",
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(300), nullable=False)
+
+    # core.events.event_key(name, event_date, venue)
+    event_key = db.Column(db.String(40), nullable=True)
+
     event_date = db.Column(db.String(100), nullable=True)
     venue = db.Column(db.String(300), nullable=True)
     price = db.Column(db.Float, nullable=True)
@@ -16,17 +32,14 @@ class TrackedEvent(db.Model):
     image = db.Column(db.String(500), nullable=True)
     created_at = db.Column(db.DateTime, nullable=False)
 
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "name": self.name,
-            "event_date": self.event_date,
-            "venue": self.venue,
-            "price": self.price,
-            "min_price": self.min_price,
-            "max_price": self.max_price,
-            "url": self.url,
-            "platform": self.platform,
-            "image": self.image,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
+    def to_dict(self, fields=None):
+        """
+        Serialize the row. `fields` limits the output to a subset of FIELDS.
+        """
+        out = {}
+        for field in fields or self.FIELDS:
+            value = getattr(self, field)
+            if field == "created_at":
+                value = value.isoformat() if value else None
+            out[field] = value
+        return out
@@ -0,0 +1,149 @@
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
+
+from sqlalchemy import or_
+
+from core.events import event_key
+from models.event import EventAlias
+from models.price_alert import PriceAlert
+from models.tracked_event import TrackedEvent
+from models import db
+from services.notifiers import get_notifier
+from services.price_history import to_cents
+from core.metrics import timed
+
+
+def _trigger_cents(target_price: Optional[float], drop_pct: Optional[float], baseline: Optional[float]) -> Optional[int]:
+    """
+    Either condition fires the alert, so the effective threshold is the higher one.
+    """
+    thresholds = []
+    if target_price is not None:
+        thresholds.append(target_price)
+    if drop_pct is not None and baseline is not None:
+        thresholds.append(baseline * (1 - drop_pct / 100.0))
+    if not thresholds:
+        return None
+    return int(round(max(thresholds) * 100))
+
+
+def create_alert(
+    tracked: TrackedEvent,
+    target_price: Optional[float] = None,
+    drop_pct: Optional[float] = None,
+    webhook_url: Optional[str] = None,
+) -> Tuple[Optional[PriceAlert], str]:
+    """
+    Create a watch rule for a tracked event.
+    Returns (alert, error_message).
+    """
+    if target_price is None and drop_pct is None:
+        return None, "target_price or drop_pct is required"
+    if target_price is not None and target_price <= 0:
+        return None, "target_price must be positive"
+    if drop_pct is not None and not 0 < drop_pct < 100:
+        return None, "drop_pct must be between 0 and 100"
+
+    baseline = tracked.price if tracked.price is not None else tracked.min_price
+    if drop_pct is not None and baseline is None:
+        return None, "tracked event has no price to measure a drop from"
+
+    key = tracked.event_key or event_key(tracked.name, tracked.event_date, tracked.venue)
+    alias = EventAlias.query.get(key)
+
+    alert = PriceAlert(
+        tracked_event_id=tracked.id,
+        event_key=key,
+        event_id=alias.event_id if alias else None,
+        target_price=target_price,
+        drop_pct=drop_pct,
+        baseline_price=baseline,
+        trigger_cents=_trigger_cents(target_price, drop_pct, baseline),
+        active=True,
+        webhook_url=webhook_url,
+        created_at=datetime.now(timezone.utc),
+    )
+    db.session.add(alert)
+    db.session.commit()
+    return alert, ""
+
+
+@timed("db", op="alerts")
+def evaluate_listings(listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Check freshly ingested listings against active alerts.
+
+    Only rules for the observed events are read (indexed on event key / event id
+    plus threshold), so the cost grows with the size of the batch, not with the
+    number of rules. Fired alerts are deactivated and handed to the notifier.
+
+    Returns the notifications that were sent.
+    """
+    best_by_key: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+    best_by_event: Dict[int, Tuple[int, Dict[str, Any]]] = {}
+    event_by_key: Dict[str, int] = {}
+
+    for item in listings or []:
+        cents = to_cents(item.get("price"))
+        if cents is None:
+            continue
+        key = item.get("event_key") or event_key(item.get("name"), item.get("event_date"), item.get("venue"))
+        if key not in best_by_key or cents < best_by_key[key][0]:
+            best_by_key[key] = (cents, item)
+        ev_id = item.get("event_id")
+        if ev_id is not None:
+            event_by_key[key] = ev_id
+        if ev_id is not None and (ev_id not in best_by_event or cents < best_by_event[ev_id][0]):
+            best_by_event[ev_id] = (cents, item)
+
+    if not best_by_key:
+        return []
+
+    floor = min(c for c, _ in best_by_key.values())
+    match = [PriceAlert.event_key.in_(list(best_by_key))]
+    if best_by_event:
+        match.append(PriceAlert.event_id.in_(list(best_by_event)))
+
+    candidates = PriceAlert.query.filter(
+        PriceAlert.active.is_(True),
+        PriceAlert.trigger_cents >= floor,
+        or_(*match),
+    ).all()
+
+    now = datetime.now(timezone.utc)
+    fired: List[Dict[str, Any]] = []
+    for alert in candidates:
+        # Rules created before their event was matched learn the canonical id here
+        if alert.event_id is None and alert.event_key in event_by_key:
+            alert.event_id = event_by_key[alert.event_key]
+
+        hits = [best_by_key.get(alert.event_key), best_by_event.get(alert.event_id)]
+        hits = [h for h in hits if h is not None and h[0] <= alert.trigger_cents]
+        if not hits:
+            continue
+
+        cents, item = min(hits, key=lambda h: h[0])
+        alert.active = False
+        alert.last_triggered_at = now
+        alert.last_triggered_price = cents / 100.0
+        fired.append({
+            "alert_id": alert.id,
+            "tracked_event_id": alert.tracked_event_id,
+            "name": item.get("name"),
+            "event_date": item.get("event_date"),
+            "venue": item.get("venue"),
+            "platform": item.get("platform") or item.get("source"),
+            "url": item.get("url"),
+            "price": cents / 100.0,
+            "trigger_price": alert.trigger_cents / 100.0,
+            "baseline_price": alert.baseline_price,
+            "webhook_url": alert.webhook_url,
+            "triggered_at": now.isoformat(),
+        })
+
+    if fired:
+        db.session.commit()
+        notifier = get_notifier()
+        for payload in fired:
+            notifier.notify(payload)
+    return fired
@@ -0,0 +1,86 @@
+from typing import Any, Dict, Iterable, List
+from datetime import datetime, timezone
+
+from sqlalchemy.dialects.sqlite import insert
+
+from core.events import event_day
+from models.event import Event, EventAlias
+from models import db
+from core.metrics import timed
+
+
+def _aliases(keys: Iterable[str]) -> Dict[str, int]:
+    keys = set(keys)
+    if not keys:
+        return {}
+    return {
+        a.event_key: a.event_id
+        for a in EventAlias.query.filter(EventAlias.event_key.in_(keys)).all()
+    }
+
+
+@timed("db", op="events")
+def link_events(events: List[Dict[str, Any]], listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Attach a persistent canonical event id to each matched event group
+    (from core.matching.build_events) and its listings.
+
+    Listing keys already seen map through EventAlias, so the same concert keeps
+    the same id across searches even when only one provider returns it.
+    New aliases are written with INSERT ... ON CONFLICT DO NOTHING and read
+    back, so concurrent first searches for an event agree on one id instead of
+    failing on the unique event_key.
+    """
+    if not events:
+        return events
+
+    known = _aliases(k for ev in events for k in ev.get("event_keys", []))
+
+    now = datetime.now(timezone.utc)
+    for ev in events:
+        keys = ev.get("event_keys", [])
+        event_id = next((known[k] for k in keys if k in known), None)
+        new_keys = [k for k in keys if k not in known]
+
+        created = None
+        if event_id is None:
+            res = db.session.execute(insert(Event).values(
+                name=ev.get("name") or "",
+                event_date=event_day(ev.get("event_date")) or None,
+                venue=ev.get("venue"),
+                created_at=now,
+            ))
+            created = event_id = res.inserted_primary_key[0]
+
+        if new_keys:
+            platform_by_key = {
+                listings[i].get("event_key"): listings[i].get("platform")
+                for i in ev.get("listing_indexes", [])
+            }
+            db.session.execute(
+                insert(EventAlias)
+                .values([
+                    {"event_key": k, "event_id": event_id, "platform": platform_by_key.get(k)}
+                    for k in new_keys
+                ])
+                .on_conflict_do_nothing(index_elements=["event_key"])
+            )
+            linked = _aliases(new_keys)
+            known.update(linked)
+
+            # Another request linked one of these keys first: join its event
+            winner = next((linked[k] for k in new_keys if linked.get(k) not in (None, event_id)), None)
+            if created is not None and winner is not None:
+                EventAlias.query.filter(EventAlias.event_id == created).update(
+                    {"event_id": winner}, synchronize_session=False
+                )
+                Event.query.filter(Event.id == created).delete(synchronize_session=False)
+                known.update({k: winner for k, v in known.items() if v == created})
+                event_id = winner
+
+        ev["event_id"] = event_id
+        for i in ev.get("listing_indexes", []):
+            listings[i]["event_id"] = event_id
+
+    db.session.commit()
+    return events
@@ -0,0 +1,266 @@
+"""
+Streaming exports of ticket_listings and price_history.
+
+Rows are read in keyset-paginated chunks (EXPORT_CHUNK_ROWS), each in its own
+short read, and encoded chunk by chunk, so memory stays constant however big
+the export is and no read transaction is held open between chunks - writers
+are never blocked (the database runs in WAL mode, see models.database).
+
+Formats: csv, ndjson, and - with the optional pyarrow package - parquet
+(one row group per chunk) and arrow (IPC stream).
+"""
+import csv
+import io
+import json
+import os
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select, tuple_
+
+from models.price_history import PricePoint
+from models.ticket_listing import TicketListing
+from models import db
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # csv / ndjson only
+    pyarrow = None
+
+EXPORT_CHUNK_ROWS = int(os.environ.get("EXPORT_CHUNK_ROWS", "5000"))
+
+FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+LISTING_COLUMNS = ("id", "artist", "name", "source", "price", "url", "created_at", "last_seen_at", "observations")
+PRICE_COLUMNS = ("event_key", "source", "ts", "price")
+
+Chunk = List[Tuple[Any, ...]]
+
+
+def available_formats() -> List[str]:
+    return [f for f in FORMATS if pyarrow is not None or f in ("csv", "ndjson")]
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # created_at is stored as naive UTC
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def listing_chunks(
+    artist: Optional[str] = None,
+    source: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    include_archive: bool = False,
+    chunk_rows: int = EXPORT_CHUNK_ROWS,
+) -> Iterator[Chunk]:
+    """
+    ticket_listings rows (LISTING_COLUMNS) matching the filters, in id order,
+    chunk_rows at a time. artist matches as a case-insensitive substring, like
+    GET /api/results/tickets; start / end bound created_at. With
+    include_archive, archived rows (services.listing_retention) come first.
+    """
+    start, end = _naive_utc(start), _naive_utc(end)
+    if include_archive:
+        yield from _archived_listing_chunks(artist, source, start, end, chunk_rows)
+
+    table = TicketListing.__table__
+    query = select(*(table.c[name] for name in LISTING_COLUMNS))
+    if artist:
+        query = query.where(table.c.artist.ilike(f"%{artist}%"))
+    if source:
+        query = query.where(table.c.source == source)
+    if start is not None:
+        query = query.where(table.c.created_at >= start)
+    if end is not None:
+        query = query.where(table.c.created_at <= end)
+
+    last_id = 0
+    while True:
+        with db.engine.connect() as conn:
+            rows = conn.execute(query.where(table.c.id > last_id).order_by(table.c.id).limit(chunk_rows)).all()
+        if not rows:
+            return
+        yield [tuple(r) for r in rows]
+        last_id = rows[-1][0]
+
+
+def _archived_listing_chunks(
+    artist: Optional[str],
+    source: Optional[str],
+    start: Optional[datetime],
+    end: Optional[datetime],
+    chunk_rows: int,
+) -> Iterator[Chunk]:
+    from services.listing_retention import iter_archived_listings
+
+    needle = (artist or "").lower()
+    lo = start.strftime("%Y-%m-%d %H:%M:%S.%f") if start else None
+    hi = end.strftime("%Y-%m-%d %H:%M:%S.%f") if end else None
+
+    chunk: Chunk = []
+    for row in iter_archived_listings(start=start, end=end):
+        created = row.get("created_at") or ""
+        if needle and needle not in (row.get("artist") or "").lower():
+            continue
+        if source and row.get("source") != source:
+            continue
+        if (lo and created < lo) or (hi and created > hi):
+            continue
+        chunk.append(tuple(_parse_archived(name, row.get(name)) for name in LISTING_COLUMNS))
+        if len(chunk) >= chunk_rows:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _parse_archived(name: str, value: Any) -> Any:
+    if name in ("created_at", "last_seen_at") and isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+def price_chunks(
+    event_key: Optional[str] = None,
+    source: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    chunk_rows: int = EXPORT_CHUNK_ROWS,
+) -> Iterator[Chunk]:
+    """
+    Raw price_history points (PRICE_COLUMNS, price in dollars) in primary key
+    order, chunk_rows at a time.
+    """
+    table = PricePoint.__table__
+    key = (table.c.event_key, table.c.source, table.c.ts)
+    query = select(table.c.event_key, table.c.source, table.c.ts, table.c.price_cents)
+    if event_key:
+        query = query.where(table.c.event_key == event_key)
+    if source:
+        query = query.where(table.c.source == source)
+    if start is not None:
+        query = query.where(table.c.ts >= int(_aware(start).timestamp()))
+    if end is not None:
+        query = query.where(table.c.ts <= int(_aware(end).timestamp()))
+
+    last = None
+    while True:
+        page = query if last is None else query.where(tuple_(*key) > tuple_(*last))
+        with db.engine.connect() as conn:
+            rows = conn.execute(page.order_by(*key).limit(chunk_rows)).all()
+        if not rows:
+            return
+        yield [(k, s, ts, cents / 100.0) for k, s, ts, cents in rows]
+        last = rows[-1][:3]
+
+
+def _aware(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _plain(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def encode_csv(columns: Sequence[str], chunks: Iterable[Chunk]) -> Iterator[bytes]:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(columns)
+    for chunk in chunks:
+        writer.writerows([_plain(v) for v in row] for row in chunk)
+        yield buf.getvalue().encode("utf-8")
+        buf.seek(0)
+        buf.truncate()
+    if buf.tell():
+        yield buf.getvalue().encode("utf-8")
+
+
+def encode_ndjson(
+    columns: Sequence[str], chunks: Iterable[Chunk], dumps: Callable[[Any], str] = json.dumps
+) -> Iterator[bytes]:
+    for chunk in chunks:
+        lines = [dumps({c: _plain(v) for c, v in zip(columns, row)}) for row in chunk]
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+class _Drain:
+    """Write-only file object whose contents are taken after each row group."""
+
+    def __init__(self):
+        self.parts: List[bytes] = []
+        self.closed = False
+        self._pos = 0
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.parts.append(data)
+        self._pos += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def take(self) -> bytes:
+        data = b"".join(self.parts)
+        self.parts = []
+        return data
+
+
+def _arrow_schema(columns: Sequence[str]):
+    types = {
+        "id": pyarrow.int64(), "observations": pyarrow.int32(), "ts": pyarrow.int64(),
+        "price": pyarrow.float64(),
+        "created_at": pyarrow.timestamp("us", tz="UTC"), "last_seen_at": pyarrow.timestamp("us", tz="UTC"),
+    }
+    return pyarrow.schema([(c, types.get(c, pyarrow.string())) for c in columns])
+
+
+def _arrow_batch(schema, columns: Sequence[str], chunk: Chunk):
+    arrays = [
+        pyarrow.array([row[i] for row in chunk], type=schema.field(c).type)
+        for i, c in enumerate(columns)
+    ]
+    return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def encode_arrow(columns: Sequence[str], chunks: Iterable[Chunk], parquet: bool = False) -> Iterator[bytes]:
+    """Parquet (one row group per chunk) or an Arrow IPC stream (one batch per chunk)."""
+    if pyarrow is None:
+        raise RuntimeError("parquet / arrow export needs the pyarrow package")
+    schema = _arrow_schema(columns)
+    sink = _Drain()
+    if parquet:
+        writer = pyarrow.parquet.ParquetWriter(sink, schema, compression="zstd")
+        write = lambda batch: writer.write_table(pyarrow.Table.from_batches([batch]))
+    else:
+        writer = pyarrow.ipc.new_stream(sink, schema)
+        write = writer.write_batch
+    for chunk in chunks:
+        write(_arrow_batch(schema, columns, chunk))
+        yield sink.take()
+    writer.close()
+    yield sink.take()
+
+
+def encode(fmt: str, columns: Sequence[str], chunks: Iterable[Chunk], dumps: Callable[[Any], str] = json.dumps) -> Iterator[bytes]:
+    if fmt == "csv":
+        return encode_csv(columns, chunks)
+    if fmt == "ndjson":
+        return encode_ndjson(columns, chunks, dumps)
+    return encode_arrow(columns, chunks, parquet=fmt == "parquet")
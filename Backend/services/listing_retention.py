@@ -0,0 +1,349 @@
+"""
+Retention for ticket_listings: keep the live table small and hot.
+
+    compact   collapse runs of identical consecutive prices per listing
+              (artist, source, name, url) into one interval row
+              (created_at .. last_seen_at, `observations` times); only
+              listings with rows added since the last run are read
+    archive   move rows last seen more than LISTINGS_ARCHIVE_AFTER_DAYS ago
+              into compressed blocks in an attached SQLite file
+    optimize  ANALYZE, plus VACUUM once enough pages are free
+
+    python -m services.listing_retention [compact|archive|optimize|all]
+
+or POST /api/maintenance/listings from a cron job.
+
+Archive blocks are zstd-compressed when the optional `zstandard` package is
+installed, zlib otherwise; read them back with iter_archived_listings().
+"""
+import json
+import os
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from core.metrics import timed
+from models import db
+from models.job_watermark import get_watermark, set_watermark
+
+try:
+    import zstandard
+except ImportError:  # zlib fallback
+    zstandard = None
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LISTINGS_ARCHIVE_PATH = os.environ.get(
+    "LISTINGS_ARCHIVE_PATH", os.path.join(BASE_DIR, "instance", "listings_archive.db")
+)
+LISTINGS_ARCHIVE_AFTER_DAYS = int(os.environ.get("LISTINGS_ARCHIVE_AFTER_DAYS", "180"))
+# VACUUM once this share of the database file is free pages
+VACUUM_FREE_RATIO = float(os.environ.get("VACUUM_FREE_RATIO", "0.2"))
+
+# Series compacted / rows archived per transaction, so writers aren't blocked for long
+COMPACT_BATCH = 1000
+ARCHIVE_BLOCK_ROWS = 5000
+ZSTD_LEVEL = 9
+
+ARCHIVE_COLUMNS = ("id", "artist", "name", "source", "price", "url", "created_at", "last_seen_at", "observations")
+
+# Rows up to this id have been compacted (models.job_watermark)
+COMPACT_WATERMARK = "ticket_listings.compact"
+
+# Next batch of listing series (artist, source, name, url) with rows added
+# since the last compaction, in key order
+_SERIES_SQL = """
+SELECT DISTINCT artist, source, name, url
+FROM ticket_listings
+WHERE id > :low AND id <= :high {after}
+ORDER BY artist, source, name, url
+LIMIT :limit
+"""
+_SERIES_AFTER = "AND (artist, source, name, url) > (:artist, :source, :name, :url)"
+
+# For a batch of series (JSON [[artist, source, name, url], ...]): one row per
+# run of 2+ identical consecutive prices - the row to keep (the run's first),
+# when the run was last seen, total observations, and the ids to fold into it.
+# Series are read through ix_ticket_listings_series (pinned: without ANALYZE
+# stats SQLite picks the low-selectivity source index); compacted history
+# is short, so whole series are cheap to re-read.
+_RUNS_SQL = """
+WITH batch AS (
+    SELECT json_extract(value, '$[0]') AS artist, json_extract(value, '$[1]') AS source,
+           json_extract(value, '$[2]') AS name, json_extract(value, '$[3]') AS url
+    FROM json_each(:series)
+), marked AS (
+    SELECT t.id, t.artist, t.source, t.name, t.url, t.created_at,
+           COALESCE(t.last_seen_at, t.created_at) AS seen_until, t.observations,
+           CASE WHEN t.price = LAG(t.price) OVER series THEN 0 ELSE 1 END AS starts_run
+    FROM batch b
+    JOIN ticket_listings t INDEXED BY ix_ticket_listings_series
+      ON t.artist = b.artist AND t.source = b.source AND t.name = b.name AND t.url = b.url
+    WHERE t.id <= :high
+    WINDOW series AS (PARTITION BY t.artist, t.source, t.name, t.url ORDER BY t.created_at, t.id)
+), numbered AS (
+    SELECT *, SUM(starts_run) OVER series AS run
+    FROM marked
+    WINDOW series AS (PARTITION BY artist, source, name, url ORDER BY created_at, id)
+), runs AS (
+    SELECT *, FIRST_VALUE(id) OVER (PARTITION BY artist, source, name, url, run ORDER BY created_at, id) AS keep_id
+    FROM numbered
+)
+SELECT keep_id, MAX(seen_until), SUM(observations), GROUP_CONCAT(id)
+FROM runs
+GROUP BY keep_id
+HAVING COUNT(*) > 1
+"""
+
+
+@timed("db", op="compact_listings")
+def compact_listings(batch: int = COMPACT_BATCH) -> Dict[str, int]:
+    """
+    Collapse runs of unchanged prices in the series that gained rows since the
+    last compaction, `batch` series per transaction.
+    Returns {"series": .., "runs": .., "rows_removed": ..}.
+    """
+    low = get_watermark(COMPACT_WATERMARK)
+    high = db.session.execute(text("SELECT MAX(id) FROM ticket_listings")).scalar() or 0
+
+    series_seen = runs_seen = removed = 0
+    after = None
+    while high > low:
+        params = {"low": low, "high": high, "limit": batch}
+        if after is not None:
+            params.update(zip(("artist", "source", "name", "url"), after))
+        series = db.session.execute(
+            text(_SERIES_SQL.format(after=_SERIES_AFTER if after is not None else "")), params
+        ).all()
+        if not series:
+            break
+        after = tuple(series[-1])
+
+        runs = db.session.execute(
+            text(_RUNS_SQL), {"series": json.dumps([list(s) for s in series]), "high": high}
+        ).all()
+        for keep_id, seen_until, observations, ids in runs:
+            drop = [int(i) for i in ids.split(",") if int(i) != keep_id]
+            db.session.execute(
+                text("UPDATE ticket_listings SET last_seen_at = :seen, observations = :obs WHERE id = :id"),
+                {"seen": seen_until, "obs": observations, "id": keep_id},
+            )
+            db.session.execute(
+                text("DELETE FROM ticket_listings WHERE id IN (SELECT value FROM json_each(:ids))"),
+                {"ids": json.dumps(drop)},
+            )
+            removed += len(drop)
+        series_seen += len(series)
+        runs_seen += len(runs)
+        db.session.commit()
+
+    if high > low:
+        set_watermark(COMPACT_WATERMARK, high)
+        db.session.commit()
+    return {"series": series_seen, "runs": runs_seen, "rows_removed": removed}
+
+
+def _compress(data: bytes) -> Tuple[str, bytes]:
+    if zstandard is not None:
+        return "zstd", zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return "zlib", zlib.compress(data, 9)
+
+
+def _decompress(codec: str, payload: bytes) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("archive block is zstd-compressed; install zstandard to read it")
+        return zstandard.ZstdDecompressor().decompress(payload)
+    return zlib.decompress(payload)
+
+
+def _attach(conn, path: str) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    conn.exec_driver_sql("ATTACH DATABASE ? AS archive", (path,))
+    has_ids = conn.exec_driver_sql(
+        "SELECT 1 FROM archive.sqlite_master WHERE name = 'ticket_listing_archived_ids'"
+    ).first()
+    conn.exec_driver_sql(
+        "CREATE TABLE IF NOT EXISTS archive.ticket_listing_blocks ("
+        " id INTEGER PRIMARY KEY,"
+        " first_seen TEXT NOT NULL,"
+        " last_seen TEXT NOT NULL,"
+        " row_count INTEGER NOT NULL,"
+        " codec TEXT NOT NULL,"
+        " columns TEXT NOT NULL,"
+        " payload BLOB NOT NULL)"
+    )
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS archive.ix_ticket_listing_blocks_seen"
+        " ON ticket_listing_blocks (first_seen, last_seen)"
+    )
+    # Every archived row id, so a block whose rows weren't deleted (see
+    # archive_listings) is never written twice
+    conn.exec_driver_sql("CREATE TABLE IF NOT EXISTS archive.ticket_listing_archived_ids (id INTEGER PRIMARY KEY)")
+    if not has_ids:
+        # Archives written before the id table existed
+        for codec, payload in conn.exec_driver_sql("SELECT codec, payload FROM archive.ticket_listing_blocks").all():
+            conn.exec_driver_sql(
+                "INSERT OR IGNORE INTO archive.ticket_listing_archived_ids (id)"
+                " SELECT json_extract(value, '$[0]') FROM json_each(?)",
+                (_decompress(codec, payload).decode("utf-8"),),
+            )
+    conn.commit()
+
+
+@timed("db", op="archive_listings")
+def archive_listings(
+    older_than_days: int = LISTINGS_ARCHIVE_AFTER_DAYS,
+    path: str = LISTINGS_ARCHIVE_PATH,
+    block_rows: int = ARCHIVE_BLOCK_ROWS,
+) -> Dict[str, int]:
+    """
+    Move rows last seen before the cutoff into compressed blocks in the
+    archive file.
+
+    The main database runs in WAL mode, where SQLite doesn't commit a
+    transaction across ATTACHed files atomically, so each block takes two
+    single-file commits: the block and its row ids go into the archive first,
+    then the rows whose ids the archive holds are deleted from
+    ticket_listings. A crash in between leaves rows that are already
+    archived; the next run deletes them without archiving them again.
+    """
+    # created_at is stored as naive UTC
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=older_than_days)).replace(tzinfo=None)
+    cutoff = cutoff.strftime("%Y-%m-%d %H:%M:%S.%f")
+    columns = ", ".join(ARCHIVE_COLUMNS)
+
+    rows_moved = blocks = raw_bytes = stored_bytes = 0
+    with db.engine.connect() as conn:
+        _attach(conn, path)
+        try:
+            while True:
+                rows = conn.exec_driver_sql(
+                    f"SELECT {columns} FROM ticket_listings"
+                    " WHERE created_at < ? AND COALESCE(last_seen_at, created_at) < ?"
+                    " ORDER BY created_at, id LIMIT ?",
+                    (cutoff, cutoff, block_rows),
+                ).all()
+                if not rows:
+                    break
+                ids = json.dumps([r[0] for r in rows])
+                done = {
+                    row_id for (row_id,) in conn.exec_driver_sql(
+                        "SELECT id FROM archive.ticket_listing_archived_ids"
+                        " WHERE id IN (SELECT value FROM json_each(?))",
+                        (ids,),
+                    )
+                }
+                rows = [r for r in rows if r[0] not in done]
+
+                if rows:
+                    data = json.dumps([list(r) for r in rows], separators=(",", ":"), default=str).encode("utf-8")
+                    codec, payload = _compress(data)
+                    conn.exec_driver_sql(
+                        "INSERT INTO archive.ticket_listing_blocks"
+                        " (first_seen, last_seen, row_count, codec, columns, payload) VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            str(rows[0][6]),
+                            str(max(r[7] or r[6] for r in rows)),
+                            len(rows),
+                            codec,
+                            json.dumps(ARCHIVE_COLUMNS),
+                            payload,
+                        ),
+                    )
+                    conn.exec_driver_sql(
+                        "INSERT OR IGNORE INTO archive.ticket_listing_archived_ids (id)"
+                        " SELECT value FROM json_each(?)",
+                        (json.dumps([r[0] for r in rows]),),
+                    )
+                    conn.commit()
+                    rows_moved += len(rows)
+                    blocks += 1
+                    raw_bytes += len(data)
+                    stored_bytes += len(payload)
+
+                conn.exec_driver_sql(
+                    "DELETE FROM ticket_listings WHERE id IN ("
+                    " SELECT id FROM archive.ticket_listing_archived_ids"
+                    " WHERE id IN (SELECT value FROM json_each(?)))",
+                    (ids,),
+                )
+                conn.commit()
+        finally:
+            conn.rollback()
+            conn.exec_driver_sql("DETACH DATABASE archive")
+    return {"rows_archived": rows_moved, "blocks": blocks, "raw_bytes": raw_bytes, "stored_bytes": stored_bytes}
+
+
+def iter_archived_listings(
+    path: str = LISTINGS_ARCHIVE_PATH,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Archived rows as dicts, oldest block first, one block in memory at a
+    time. start / end (naive UTC) skip blocks entirely outside the range.
+    """
+    import sqlite3
+
+    if not os.path.exists(path):
+        return
+    conn = sqlite3.connect(path)
+    try:
+        sql = "SELECT codec, columns, payload FROM ticket_listing_blocks WHERE 1 = 1"
+        params: List[Any] = []
+        if start is not None:
+            sql += " AND last_seen >= ?"
+            params.append(start.strftime("%Y-%m-%d %H:%M:%S.%f"))
+        if end is not None:
+            sql += " AND first_seen <= ?"
+            params.append(end.strftime("%Y-%m-%d %H:%M:%S.%f"))
+        for codec, columns, payload in conn.execute(sql + " ORDER BY first_seen, id", params):
+            names = json.loads(columns)
+            for row in json.loads(_decompress(codec, payload)):
+                yield dict(zip(names, row))
+    finally:
+        conn.close()
+
+
+@timed("db", op="optimize")
+def optimize_database(vacuum_free_ratio: float = VACUUM_FREE_RATIO) -> Dict[str, Any]:
+    """
+    ANALYZE (fresh planner statistics), then VACUUM when free pages reach
+    vacuum_free_ratio of the file - e.g. after compaction or archiving.
+    """
+    with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("ANALYZE")
+        pages = conn.exec_driver_sql("PRAGMA page_count").scalar() or 0
+        free = conn.exec_driver_sql("PRAGMA freelist_count").scalar() or 0
+        vacuumed = bool(pages) and free / pages >= vacuum_free_ratio
+        if vacuumed:
+            conn.exec_driver_sql("VACUUM")
+            pages = conn.exec_driver_sql("PRAGMA page_count").scalar() or 0
+    return {"vacuumed": vacuumed, "free_pages": free, "page_count": pages}
+
+
+def run_maintenance(steps: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Run the given steps (default: compact, archive, optimize) in that order."""
+    jobs = {"compact": compact_listings, "archive": archive_listings, "optimize": optimize_database}
+    return {step: jobs[step]() for step in steps or list(jobs)}
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="ticket_listings retention")
+    parser.add_argument("step", nargs="?", default="all", choices=["compact", "archive", "optimize", "all"])
+    args = parser.parse_args()
+
+    from app import app
+
+    with app.app_context():
+        steps = None if args.step == "all" else [args.step]
+        print(json.dumps(run_maintenance(steps)))
+
+
+if __name__ == "__main__":
+    main()
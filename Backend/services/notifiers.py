@@ -0,0 +1,108 @@
+import logging
+import os
+from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+ALERT_WEBHOOK_URL = os.environ.get("ALERT_WEBHOOK_URL", "")
+# Hosts a per-alert webhook_url may point at (comma-separated); none allowed by default
+ALERT_WEBHOOK_HOSTS = {
+    h.strip().lower() for h in os.environ.get("ALERT_WEBHOOK_HOSTS", "").split(",") if h.strip()
+}
+
+
+def webhook_url_error(url: str) -> Optional[str]:
+    """
+    Why a client-supplied webhook URL can't be used, or None if it can.
+    Only https URLs on ALERT_WEBHOOK_HOSTS are accepted, so alerts can't be
+    used to make the server call arbitrary (e.g. internal) addresses.
+    """
+    try:
+        parts = urlsplit(url)
+        host = (parts.hostname or "").lower()
+        parts.port  # raises on a malformed port
+    except ValueError:
+        return "webhook_url is not a valid URL"
+    if parts.scheme != "https" or not host:
+        return "webhook_url must be an https URL"
+    if parts.username or parts.password:
+        return "webhook_url must not carry credentials"
+    if host not in ALERT_WEBHOOK_HOSTS:
+        return "webhook_url host is not allowed"
+    return None
+
+
+class Notifier:
+    """
+    Receives triggered price alerts. Subclass and override notify().
+    """
+
+    def notify(self, alert: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+
+class LocalNotifier(Notifier):
+    """
+    Keeps alerts in memory (and logs them). For tests: install it with
+    set_notifier(); the list is never trimmed.
+    """
+
+    def __init__(self, echo: bool = True):
+        self.sent: List[Dict[str, Any]] = []
+        self.echo = echo
+
+    def notify(self, alert: Dict[str, Any]) -> None:
+        self.sent.append(alert)
+        if self.echo:
+            logger.info("Price alert %s: %s at %s", alert.get("alert_id"), alert.get("name"), alert.get("price"))
+
+
+class WebhookNotifier(Notifier):
+    """
+    POSTs each alert as JSON to the alert's own webhook_url, or to the
+    fallback url; alerts with neither are only logged. Delivery runs on a
+    background thread so ingest never waits on the receiving server.
+    """
+
+    def __init__(self, url: Optional[str] = None, timeout: int = 5, max_workers: int = 2):
+        self.url = url or None
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def _post(self, url: str, alert: Dict[str, Any]) -> None:
+        try:
+            requests.post(url, json=alert, timeout=self.timeout).raise_for_status()
+        except Exception as e:
+            logger.warning("Alert webhook error (%s): %s", url, e)
+
+    def notify(self, alert: Dict[str, Any]) -> None:
+        url = alert.get("webhook_url")
+        # Re-checked here too, for rules stored before the allowlist existed
+        if not url or webhook_url_error(url):
+            url = self.url
+        if url:
+            self._executor.submit(self._post, url, alert)
+        else:
+            logger.info("Price alert %s: %s at %s", alert.get("alert_id"), alert.get("name"), alert.get("price"))
+
+
+_notifier: Optional[Notifier] = None
+
+
+def get_notifier() -> Notifier:
+    global _notifier
+    if _notifier is None:
+        _notifier = WebhookNotifier(ALERT_WEBHOOK_URL)
+    return _notifier
+
+
+def set_notifier(notifier: Optional[Notifier]) -> None:
+    """
+    Swap the active notifier (None resets to the env-configured default).
+    """
+    global _notifier
+    _notifier = notifier
@@ -0,0 +1,22 @@
+"""
+Fresh search results as price observations.
+
+The app registers observe_results with core.search.set_results_hook, so every
+provider fetch - a request's cache miss, a stale-while-revalidate background
+refresh or a cache warmer run - links its events, feeds the price history and
+fires alerts once. Cached answers were observed when they were fetched.
+"""
+from typing import Any, Dict
+
+from services.alerts import evaluate_listings
+from services.events import link_events
+from services.price_history import record_listing_prices
+
+
+def observe_results(app, results: Dict[str, Any]) -> None:
+    # Background refreshes run outside any request, so bring our own context
+    with app.app_context():
+        listings = results.get("listings", [])
+        link_events(results.get("events", []), listings)
+        record_listing_prices(listings)
+        evaluate_listings(listings)
@@ -0,0 +1,271 @@
+import heapq
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional
+from datetime import datetime, timezone
+
+from sqlalchemy import case, func
+from sqlalchemy.dialects.sqlite import insert
+
+from utils.price import BASE_CURRENCY, safe_price
+from core.events import event_key
+from models.event import EventAlias
+from models.price_history import PricePoint, PriceRollup
+from models import db
+from core.metrics import timed
+
+# Rollup bucket sizes in seconds
+RESOLUTIONS = {"hour": 3600, "day": 86400}
+
+DEFAULT_MAX_POINTS = 200
+
+
+def _to_ts(value: Optional[datetime]) -> int:
+    if value is None:
+        return int(datetime.now(timezone.utc).timestamp())
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def to_cents(value: Any) -> Optional[int]:
+    """
+    "$120.50" -> 12050, "€100" -> 10800 (in BASE_CURRENCY), None -> None
+    """
+    p = safe_price(value, base_currency=BASE_CURRENCY)
+    if p is None:
+        return None
+    return int(round(p * 100))
+
+
+def _upsert_rollup(key: str, source: str, resolution: str, ts: int, cents: int) -> None:
+    bucket = ts - ts % RESOLUTIONS[resolution]
+    stmt = insert(PriceRollup).values(
+        event_key=key,
+        source=source,
+        resolution=resolution,
+        bucket_ts=bucket,
+        min_cents=cents,
+        max_cents=cents,
+        last_cents=cents,
+        last_ts=ts,
+        count=1,
+    )
+    ex = stmt.excluded
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["event_key", "source", "resolution", "bucket_ts"],
+        set_={
+            # two-argument min()/max() are scalar functions in SQLite
+            "min_cents": func.min(PriceRollup.min_cents, ex.min_cents),
+            "max_cents": func.max(PriceRollup.max_cents, ex.max_cents),
+            "last_cents": case((ex.last_ts >= PriceRollup.last_ts, ex.last_cents),
+                               else_=PriceRollup.last_cents),
+            "last_ts": func.max(PriceRollup.last_ts, ex.last_ts),
+            "count": PriceRollup.count + 1,
+        },
+    )
+    db.session.execute(stmt)
+
+
+def record_price(key: str, source: str, price: Any, observed_at: Optional[datetime] = None) -> bool:
+    """
+    Store one observation and fold it into the hourly/daily rollups.
+    Duplicate (event, source, ts) points are ignored.
+    Does not commit.
+    """
+    cents = to_cents(price)
+    if cents is None or not key or not source:
+        return False
+
+    ts = _to_ts(observed_at)
+    res = db.session.execute(
+        insert(PricePoint)
+        .values(event_key=key, source=source, ts=ts, price_cents=cents)
+        .on_conflict_do_nothing()
+    )
+    if not res.rowcount:
+        return False
+
+    for resolution in RESOLUTIONS:
+        _upsert_rollup(key, source, resolution, ts, cents)
+    return True
+
+
+@timed("db", op="prices")
+def record_listing_prices(listings: Iterable[Dict[str, Any]], observed_at: Optional[datetime] = None) -> int:
+    """
+    Record prices for search/scrape listing dicts.
+    Listing keys used: name, event_date, venue, price, platform/source.
+
+    Returns number of points stored.
+    """
+    stored = 0
+    for item in listings or []:
+        source = (item.get("platform") or item.get("source") or "").strip().lower()
+        key = item.get("event_key") or event_key(item.get("name") or item.get("event_name"),
+                                                 item.get("event_date"), item.get("venue"))
+        if record_price(key, source, item.get("price"), observed_at):
+            stored += 1
+
+    if stored:
+        db.session.commit()
+    return stored
+
+
+def _merge_buckets(rows: List[PriceRollup], step: int) -> List[Dict[str, Any]]:
+    """
+    Merge rollup rows (possibly from several sources) into buckets of `step` seconds.
+    Rows must be ordered by bucket_ts.
+    """
+    out: List[Dict[str, Any]] = []
+    for r in rows:
+        bucket = r.bucket_ts - r.bucket_ts % step
+        if out and out[-1]["ts"] == bucket:
+            cur = out[-1]
+            cur["min"] = min(cur["min"], r.min_cents)
+            cur["max"] = max(cur["max"], r.max_cents)
+            if r.last_ts >= cur["_last_ts"]:
+                cur["last"] = r.last_cents
+                cur["_last_ts"] = r.last_ts
+            cur["count"] += r.count
+            continue
+        out.append({
+            "ts": bucket,
+            "min": r.min_cents,
+            "max": r.max_cents,
+            "last": r.last_cents,
+            "_last_ts": r.last_ts,
+            "count": r.count,
+        })
+    return out
+
+
+def _first_bucket_ts(keys: List[str], source: Optional[str]) -> Optional[int]:
+    q = db.session.query(func.min(PriceRollup.bucket_ts)).filter(
+        PriceRollup.event_key.in_(keys),
+        PriceRollup.resolution == "day",
+    )
+    if source:
+        q = q.filter(PriceRollup.source == source)
+    return q.scalar()
+
+
+def _raw_points(keys: List[str], source: Optional[str], start_ts: Optional[int], end_ts: int, limit: int) -> List[PricePoint]:
+    """
+    The newest `limit` raw points across keys, oldest first. Each key is read
+    newest first straight off an index (the primary key, or ix_price_history_key_ts
+    without a source) and stops at `limit`, so no key's whole history is sorted.
+    """
+    per_key = []
+    for key in keys:
+        q = PricePoint.query.filter(PricePoint.event_key == key, PricePoint.ts <= end_ts)
+        if source:
+            q = q.filter(PricePoint.source == source)
+        if start_ts is not None:
+            q = q.filter(PricePoint.ts >= start_ts)
+        per_key.append(q.order_by(PricePoint.ts.desc()).limit(limit).all())
+    newest = heapq.merge(*per_key, key=lambda r: r.ts, reverse=True)
+    return list(islice(newest, limit))[::-1]
+
+
+def _series(
+    keys: List[str],
+    source: Optional[str],
+    start: Optional[datetime],
+    end: Optional[datetime],
+    max_points: int,
+    resolution: Optional[str],
+) -> Dict[str, Any]:
+    max_points = max(1, min(int(max_points), 2000))
+    end_ts = _to_ts(end)
+
+    if resolution == "raw":
+        rows = _raw_points(keys, source, _to_ts(start) if start is not None else None, end_ts, max_points)
+        return {"source": source, "resolution": "raw", "points": [r.to_dict() for r in rows]}
+
+    start_ts = _to_ts(start) if start is not None else (_first_bucket_ts(keys, source) if keys else None)
+    if start_ts is None:
+        return {"source": source, "resolution": resolution, "points": []}
+
+    span = max(end_ts - start_ts, 1)
+    if resolution not in RESOLUTIONS:
+        resolution = "hour" if span // RESOLUTIONS["hour"] < max_points else "day"
+    base_step = RESOLUTIONS[resolution]
+
+    q = PriceRollup.query.filter(
+        PriceRollup.event_key.in_(keys),
+        PriceRollup.resolution == resolution,
+        PriceRollup.bucket_ts >= start_ts - start_ts % base_step,
+        PriceRollup.bucket_ts <= end_ts,
+    )
+    if source:
+        q = q.filter(PriceRollup.source == source)
+    rows = q.order_by(PriceRollup.bucket_ts.asc()).all()
+
+    # Widen buckets when even daily rollups exceed the point budget
+    step = base_step
+    buckets = span // base_step + 1
+    if buckets > max_points:
+        step = base_step * -(-buckets // max_points)
+
+    points = _merge_buckets(rows, step)
+    for p in points:
+        p.pop("_last_ts")
+        p["min"] /= 100.0
+        p["max"] /= 100.0
+        p["last"] /= 100.0
+
+    return {
+        "source": source,
+        "resolution": resolution,
+        "step_seconds": step,
+        "points": points,
+    }
+
+
+def get_price_series(
+    key: str,
+    source: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    max_points: int = DEFAULT_MAX_POINTS,
+    resolution: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Downsampled price series for charting.
+
+    Picks the finest rollup whose bucket count over [start, end] fits in
+    max_points, so the amount of work depends on the window, not on how many
+    raw observations exist. resolution="raw" returns the newest raw points
+    (capped at max_points).
+    """
+    return {"event_key": key, **_series([key], source, start, end, max_points, resolution)}
+
+
+def event_keys_for(event_id: int) -> List[str]:
+    """Every provider event_key linked to a canonical event (services.events.link_events)."""
+    rows = (
+        db.session.query(EventAlias.event_key)
+        .filter(EventAlias.event_id == event_id)
+        .order_by(EventAlias.event_key)
+        .all()
+    )
+    return [key for (key,) in rows]
+
+
+def get_event_price_series(
+    event_id: int,
+    source: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    max_points: int = DEFAULT_MAX_POINTS,
+    resolution: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    get_price_series for a canonical event id, as search responses return it:
+    the history of every provider listing linked to the event, merged into
+    one series. None for an event with no linked listings.
+    """
+    keys = event_keys_for(event_id)
+    if not keys:
+        return None
+    return {"event_id": event_id, "event_keys": keys, **_series(keys, source, start, end, max_points, resolution)}
@@ -2,8 +2,11 @@
 
 from typing import List, Dict, Any
 
+from utils.price import BASE_CURRENCY, safe_prices
+from core.ranking import cheapest, cheapest_k, cheapest_k_by_source
 
-def build_ticket_summary(artist: str, listings: List[Dict[str, Any]]) -> Dict[str, Any]:
+
+def build_ticket_summary(artist: str, listings: List[Dict[str, Any]], top: int = 0) -> Dict[str, Any]:
     """
     Takes all scraped listings for an artist and returns a clean summary
     for the frontend:
@@ -11,6 +14,7 @@ def build_ticket_summary(artist: str, listings: List[Dict[str, Any]]) -> Dict[st
       - total listings
       - cheapest ticket
       - grouped results by source
+      - with top > 0: the `top` cheapest overall and per source
     """
 
     if not listings:
@@ -23,11 +27,8 @@ def build_ticket_summary(artist: str, listings: List[Dict[str, Any]]) -> Dict[st
 
     # Normalize prices and filter bad data
     cleaned = []
-    for item in listings:
-        price = item.get("price")
-        try:
-            price = float(price)
-        except (TypeError, ValueError):
+    for item, price in zip(listings, safe_prices((item.get("price") for item in listings), base_currency=BASE_CURRENCY)):
+        if price is None:
             continue
 
         cleaned.append({
@@ -46,18 +47,19 @@ def build_ticket_summary(artist: str, listings: List[Dict[str, Any]]) -> Dict[st
             "sources": {},
         }
 
-    # Find cheapest ticket
-    cheapest = min(cleaned, key=lambda x: x["price"])
-
     # Group by source
     sources: Dict[str, List[Dict[str, Any]]] = {}
     for item in cleaned:
         src = item.get("source", "unknown")
         sources.setdefault(src, []).append(item)
 
-    return {
+    summary = {
         "artist": artist,
         "total": len(cleaned),
-        "cheapest": cheapest,
+        "cheapest": cheapest(cleaned),
         "sources": sources,
     }
+    if top > 0:
+        summary["top"] = cheapest_k(cleaned, top)
+        summary["top_by_source"] = cheapest_k_by_source(cleaned, top, source_key="source")
+    return summary
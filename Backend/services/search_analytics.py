@@ -0,0 +1,251 @@
+"""
+Search analytics over ArtistSearch, served from the hourly artist_search_rollups.
+
+    python -m services.search_analytics compact [--days 90]
+
+deletes raw searches older than the retention period; their counts live on
+in the rollups.
+"""
+import math
+import os
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert
+
+from core.events import normalize_text
+from core.metrics import timed
+from models.artist_search import ArtistSearch, ArtistSearchRollup
+from models import db
+
+HOUR = 3600
+
+SEARCH_RETENTION_DAYS = int(os.environ.get("SEARCH_RETENTION_DAYS", "90"))
+# Rows deleted per transaction by the retention job, so writers aren't blocked for long
+COMPACT_BATCH = 5000
+
+
+def _hour(ts: int) -> int:
+    return ts - ts % HOUR
+
+
+def _to_ts(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def _upsert_rollup(artist: str, bucket_ts: int, count: int = 1) -> None:
+    stmt = insert(ArtistSearchRollup).values(
+        artist_key=normalize_text(artist),
+        bucket_ts=bucket_ts,
+        artist=artist,
+        count=count,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["artist_key", "bucket_ts"],
+        set_={
+            "artist": stmt.excluded.artist,
+            "count": ArtistSearchRollup.count + stmt.excluded.count,
+        },
+    )
+    db.session.execute(stmt)
+
+
+@timed("db", op="artist_search")
+def record_search(artist: str, city: Optional[str] = None, searched_at: Optional[datetime] = None) -> None:
+    """
+    Log one search and count it in its hourly rollup, in one transaction.
+    """
+    searched_at = searched_at or datetime.now(timezone.utc)
+    db.session.add(ArtistSearch(artist=artist, city=city or None, created_at=searched_at))
+    if normalize_text(artist):
+        _upsert_rollup(artist, _hour(_to_ts(searched_at)))
+    db.session.commit()
+
+
+def _window(hours: float, now: Optional[float] = None) -> Tuple[int, int]:
+    """(first, last) hour bucket of the last `hours` whole hours, the current one included."""
+    last = _hour(int(now if now is not None else time.time()))
+    return last - (max(1, math.ceil(hours)) - 1) * HOUR, last
+
+
+def _counts(start: int, end: int) -> Dict[str, int]:
+    rows = (
+        db.session.query(ArtistSearchRollup.artist_key, func.sum(ArtistSearchRollup.count))
+        .filter(ArtistSearchRollup.bucket_ts >= start, ArtistSearchRollup.bucket_ts <= end)
+        .group_by(ArtistSearchRollup.artist_key)
+        .all()
+    )
+    return {key: int(total) for key, total in rows}
+
+
+def _display_names(keys: List[str]) -> Dict[str, str]:
+    """Latest spelling per artist_key."""
+    if not keys:
+        return {}
+    latest = (
+        db.session.query(ArtistSearchRollup.artist_key, func.max(ArtistSearchRollup.bucket_ts).label("ts"))
+        .filter(ArtistSearchRollup.artist_key.in_(keys))
+        .group_by(ArtistSearchRollup.artist_key)
+        .subquery()
+    )
+    rows = (
+        db.session.query(ArtistSearchRollup.artist_key, ArtistSearchRollup.artist)
+        .join(latest, (ArtistSearchRollup.artist_key == latest.c.artist_key)
+              & (ArtistSearchRollup.bucket_ts == latest.c.ts))
+        .all()
+    )
+    return dict(rows)
+
+
+def top_artists(window_hours: float = 24, limit: int = 10, now: Optional[float] = None) -> List[Dict[str, Any]]:
+    """Most searched artists over the last window_hours (whole hours), most first."""
+    start, end = _window(window_hours, now)
+    rows = (
+        db.session.query(ArtistSearchRollup.artist_key, func.sum(ArtistSearchRollup.count).label("searches"))
+        .filter(ArtistSearchRollup.bucket_ts >= start, ArtistSearchRollup.bucket_ts <= end)
+        .group_by(ArtistSearchRollup.artist_key)
+        .order_by(func.sum(ArtistSearchRollup.count).desc(), ArtistSearchRollup.artist_key)
+        .limit(limit)
+        .all()
+    )
+    names = _display_names([key for key, _ in rows])
+    return [{"artist": names.get(key, key), "searches": int(searches)} for key, searches in rows]
+
+
+def trending_artists(
+    window_hours: float = 24,
+    limit: int = 10,
+    min_searches: int = 3,
+    now: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Artists searched more in the last window_hours than in the window before
+    it, ranked by growth = (searches + 1) / (previous + 1). Artists with fewer
+    than min_searches in the window are left out so one-off searches don't top
+    the list.
+    """
+    start, end = _window(window_hours, now)
+    recent = _counts(start, end)
+    previous = _counts(start - (end - start) - HOUR, start - HOUR)
+
+    ranked = []
+    for key, searches in recent.items():
+        before = previous.get(key, 0)
+        if searches < min_searches or searches <= before:
+            continue
+        ranked.append((-(searches + 1) / (before + 1), -searches, key, searches, before))
+    ranked.sort()
+    ranked = ranked[:limit]
+
+    names = _display_names([key for _, _, key, _, _ in ranked])
+    return [
+        {"artist": names.get(key, key), "searches": searches, "previous": before,
+         "growth": round(-growth, 2)}
+        for growth, _, key, searches, before in ranked
+    ]
+
+
+def decayed_artist_scores(
+    limit: int,
+    half_life_hours: float,
+    window_days: float,
+    now: Optional[float] = None,
+) -> List[Tuple[str, float]]:
+    """
+    [(artist, score), ...] highest first, where score counts each search in
+    the window weighted 0.5 ** (age / half life).
+    """
+    start, end = _window(window_days * 24, now)
+    rows = (
+        db.session.query(ArtistSearchRollup.artist_key, ArtistSearchRollup.bucket_ts, ArtistSearchRollup.count)
+        .filter(ArtistSearchRollup.bucket_ts >= start, ArtistSearchRollup.bucket_ts <= end)
+        .all()
+    )
+    scores: Dict[str, float] = defaultdict(float)
+    for key, bucket_ts, count in rows:
+        age_hours = (end - bucket_ts) / HOUR
+        scores[key] += count * math.pow(0.5, age_hours / half_life_hours)
+
+    top = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    names = _display_names([key for key, _ in top])
+    return [(names.get(key, key), round(score, 3)) for key, score in top]
+
+
+def searched_cities(
+    window_days: float,
+    per_artist: int,
+    now: Optional[float] = None,
+) -> Dict[str, List[Optional[str]]]:
+    """
+    {artist_key: [city, ...]}: the cities each artist was searched with over
+    the last window_days, most searched first, None for searches without a
+    city. Read from the raw searches, as the rollups don't keep the city.
+    """
+    since = datetime.fromtimestamp(now if now is not None else time.time(), timezone.utc)
+    # created_at is stored as naive UTC
+    since = since.replace(tzinfo=None) - timedelta(days=window_days)
+    rows = (
+        db.session.query(ArtistSearch.artist, ArtistSearch.city, func.count(ArtistSearch.id))
+        .filter(ArtistSearch.created_at >= since)
+        .group_by(ArtistSearch.artist, ArtistSearch.city)
+        .all()
+    )
+    counts: Dict[str, Counter] = defaultdict(Counter)
+    spelling: Dict[Tuple[str, str], Optional[str]] = {}
+    for artist, city, searches in rows:
+        key, city_key = normalize_text(artist), normalize_text(city)
+        if not key:
+            continue
+        counts[key][city_key] += searches
+        spelling.setdefault((key, city_key), city.strip() if city_key else None)
+    return {
+        key: [spelling[(key, city_key)] for city_key, _ in by_city.most_common(per_artist)]
+        for key, by_city in counts.items()
+    }
+
+
+def compact_searches(retain_days: int = SEARCH_RETENTION_DAYS, batch: int = COMPACT_BATCH) -> int:
+    """
+    Delete raw ArtistSearch rows older than retain_days, `batch` rows per
+    transaction. Their counts are already in the rollups. Returns rows deleted.
+    """
+    # created_at is stored as naive UTC
+    cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=retain_days)
+    deleted = 0
+    while True:
+        ids = [
+            row_id for (row_id,) in db.session.query(ArtistSearch.id)
+            .filter(ArtistSearch.created_at < cutoff)
+            .order_by(ArtistSearch.created_at)
+            .limit(batch)
+            .all()
+        ]
+        if not ids:
+            return deleted
+        db.session.query(ArtistSearch).filter(ArtistSearch.id.in_(ids)).delete(synchronize_session=False)
+        db.session.commit()
+        deleted += len(ids)
+
+
+def main():
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Delete raw searches older than the retention period")
+    parser.add_argument("command", choices=["compact"])
+    parser.add_argument("--days", type=int, default=SEARCH_RETENTION_DAYS)
+    args = parser.parse_args()
+
+    from app import app
+
+    with app.app_context():
+        print(json.dumps({"deleted": compact_searches(args.days)}))
+
+
+if __name__ == "__main__":
+    main()
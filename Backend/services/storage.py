@@ -1,15 +1,22 @@
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 
-from utils.price import safe_price
+from utils.artist_match import ArtistMatcher
+from utils.price import BASE_CURRENCY, safe_prices
+from core.events import event_key
+from services.price_history import record_price
+from services.alerts import evaluate_listings
 from models.ticket_listing import TicketListing
+from models.tracked_artist import TrackedArtist
 from models import db
+from core.metrics import timed
 
 
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+@timed("db", op="listings")
 def save_listings(artist: str, source: str, listings: List[Dict[str, Any]]) -> int:
     """
     Save ticket listing dicts to the DB.
@@ -20,18 +27,24 @@ def save_listings(artist: str, source: str, listings: List[Dict[str, Any]]) -> i
       - url
       - created_at (optional)
 
+    A listing that doesn't mention `artist` but does mention a tracked artist
+    (a festival bill, a support slot) is saved under that tracked artist.
+
     Returns number of rows inserted.
     """
     if not listings:
         return 0
 
     inserted = 0
+    observed: List[Dict[str, Any]] = []
+    # Stored in one currency so cheapest / history compare like with like
+    prices = safe_prices((item.get("price") for item in listings), base_currency=BASE_CURRENCY)
+    # One index for the whole batch, however many artists are tracked
+    matcher = ArtistMatcher([artist, *(name for (name,) in db.session.query(TrackedArtist.name).all())])
 
-    for item in listings:
+    for item, price_num in zip(listings, prices):
         name = item.get("name") or item.get("event_name") or artist
         url = item.get("url") or ""
-        price_raw = item.get("price")
-        price_num = safe_price(price_raw)
 
         # Skip rows without essentials
         if not url or price_num is None:
@@ -46,8 +59,9 @@ def save_listings(artist: str, source: str, listings: List[Dict[str, Any]]) -> i
         else:
             created_at_dt = created_at
 
+        mentioned = matcher.match(name)
         row = TicketListing(
-            artist=artist,
+            artist=artist if artist in mentioned or not mentioned else mentioned[0],
             name=name,
             source=source,
             url=url,
@@ -56,9 +70,16 @@ def save_listings(artist: str, source: str, listings: List[Dict[str, Any]]) -> i
         )
 
         db.session.add(row)
+        # Same key as search results, so scraped and searched history line up
+        key = item.get("event_key") or event_key(name, item.get("event_date"), item.get("venue"))
+        record_price(key, source.lower(), price_num, created_at_dt)
+        observed.append({**item, "name": name, "price": price_num, "source": source, "event_key": key})
         inserted += 1
 
     db.session.commit()
+
+    # Scraped prices fire alerts just like search results do
+    evaluate_listings(observed)
     return inserted
 
 
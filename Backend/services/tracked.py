@@ -0,0 +1,49 @@
+from typing import Any, Dict, List, Tuple
+from datetime import datetime, timezone
+
+from sqlalchemy.dialects.sqlite import insert
+
+from models.tracked_event import TrackedEvent
+from models.table_version import bump_table_version
+from models import db
+from core.metrics import timed
+
+
+@timed("db", op="tracked")
+def upsert_tracked_events(items: List[Dict[str, Any]]) -> Tuple[List[TrackedEvent], List[bool]]:
+    """
+    Track many events in one transaction.
+
+    items: cleaned payloads from validate_tracked_event_request (must carry event_key).
+    Rows whose event_key already exists are left untouched (INSERT ... ON CONFLICT
+    DO NOTHING), so concurrent requests can't create duplicates.
+
+    Returns (rows in input order, created flags).
+    """
+    if not items:
+        return [], []
+
+    now = datetime.now(timezone.utc)
+    values = [{**it, "created_at": now} for it in items]
+
+    stmt = (
+        insert(TrackedEvent)
+        .values(values)
+        .on_conflict_do_nothing(index_elements=["event_key"])
+        .returning(TrackedEvent.event_key)
+    )
+    created_keys = set(db.session.execute(stmt).scalars().all())
+    if created_keys:
+        bump_table_version(TrackedEvent.__tablename__)
+    db.session.commit()
+
+    keys = [it["event_key"] for it in items]
+    by_key = {r.event_key: r for r in TrackedEvent.query.filter(TrackedEvent.event_key.in_(set(keys))).all()}
+
+    rows, created = [], []
+    for key in keys:
+        rows.append(by_key[key])
+        # Only the first occurrence of a key in the batch counts as created
+        created.append(key in created_keys)
+        created_keys.discard(key)
+    return rows, created
@@ -0,0 +1,129 @@
+"""
+Search cache warmer: refresh the results of the most searched artists and
+everything tracked before users ask for them. Searches are warmed with the
+cities they are made with, since that is the cache key the frontend hits.
+Warmed results go through the same results hook as any other provider fetch,
+so they also feed price history and alerts (core.search.set_results_hook).
+
+    python -m services.warmer [--top 50] [--budget 100]
+
+or POST /api/cache/warm. Run it more often than SEARCH_CACHE_TTL (e.g. every
+2 minutes for the default 5) so popular searches never go stale.
+"""
+import os
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from core import providers
+from core.events import normalize_text
+from core.search import search_cache_key, search_fresh_for, warm_search
+from services.search_analytics import decayed_artist_scores, searched_cities
+from models.tracked_artist import TrackedArtist
+from models.tracked_event import TrackedEvent
+from models import db
+
+WARM_TOP_N = int(os.environ.get("WARM_TOP_N", "50"))
+# Most provider requests one run may spend
+WARM_BUDGET = int(os.environ.get("WARM_BUDGET", "100"))
+# Search counts lose half their weight every WARM_HALF_LIFE_HOURS
+WARM_HALF_LIFE_HOURS = float(os.environ.get("WARM_HALF_LIFE_HOURS", "24"))
+WARM_WINDOW_DAYS = int(os.environ.get("WARM_WINDOW_DAYS", "7"))
+# Entries going stale within this many seconds are refreshed too
+WARM_REFRESH_WITHIN = float(os.environ.get("WARM_REFRESH_WITHIN", "120"))
+# Most searched cities warmed per trending artist
+WARM_CITIES_PER_ARTIST = int(os.environ.get("WARM_CITIES_PER_ARTIST", "3"))
+WARM_WORKERS = 4
+
+Target = Tuple[str, Optional[str], str]
+
+
+def _venue_city(venue: Optional[str]) -> Optional[str]:
+    # "<name>, <city>, <state>", as providers format venues
+    parts = [p.strip() for p in (venue or "").split(",")]
+    return parts[1] if len(parts) >= 2 and parts[1] else None
+
+
+def warm_targets(top_n: int = WARM_TOP_N) -> List[Target]:
+    """
+    [(artist, city, reason), ...] to keep warm, most important first:
+    trending artists with the cities they are searched in, then tracked
+    artists, then tracked events in their venue's city. One entry per search
+    cache key.
+    """
+    trending = decayed_artist_scores(top_n, WARM_HALF_LIFE_HOURS, WARM_WINDOW_DAYS)
+    cities = searched_cities(WARM_WINDOW_DAYS, WARM_CITIES_PER_ARTIST)
+    candidates: List[Target] = [
+        (artist, city, "trending")
+        for artist, _ in trending
+        # Searches older than the raw retention only survive as rollups, without a city
+        for city in cities.get(normalize_text(artist)) or [None]
+    ]
+    candidates += [(name, None, "tracked_artist") for (name,) in db.session.query(TrackedArtist.name).all()]
+    candidates += [
+        (name, _venue_city(venue), "tracked_event")
+        for name, venue in db.session.query(TrackedEvent.name, TrackedEvent.venue).distinct().all()
+    ]
+
+    seen = set()
+    targets = []
+    for artist, city, reason in candidates:
+        key = ("near:" if city else "") + search_cache_key(artist, city)
+        if artist and key not in seen:
+            seen.add(key)
+            targets.append((artist, city, reason))
+    return targets
+
+
+def warm_cache(
+    top_n: int = WARM_TOP_N,
+    budget: int = WARM_BUDGET,
+    refresh_within: float = WARM_REFRESH_WITHIN,
+) -> Dict[str, Any]:
+    """
+    Refresh missing or soon-stale cache entries for warm_targets(), in
+    priority order, until the provider request budget is spent.
+    Each search costs one request per configured provider (a city with no
+    events also pays for the nearest-city fallback); entries that stay fresh
+    for longer than refresh_within cost nothing.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    cost = max(1, sum(1 for key in providers.provider_api_keys().values() if key))
+    targets = warm_targets(top_n)
+    due = [t for t in targets if search_fresh_for(t[0], t[1]) <= refresh_within]
+    affordable = due[: budget // cost]
+
+    def warm(target: Target) -> str:
+        return warm_search(target[0], target[1], refresh_within=refresh_within)
+
+    with ThreadPoolExecutor(max_workers=WARM_WORKERS) as executor:
+        outcomes = list(executor.map(warm, affordable))
+
+    counts = Counter(outcomes)
+    return {
+        "targets": len(targets),
+        "fresh": len(targets) - len(due) + counts["fresh"],
+        "warmed": counts["warmed"],
+        "failed": counts["failed"],
+        "over_budget": len(due) - len(affordable),
+        "provider_requests": (counts["warmed"] + counts["failed"]) * cost,
+    }
+
+
+def main():
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Warm the search cache for trending and tracked artists")
+    parser.add_argument("--top", type=int, default=WARM_TOP_N)
+    parser.add_argument("--budget", type=int, default=WARM_BUDGET, help="most provider requests to spend")
+    args = parser.parse_args()
+
+    from app import app
+
+    with app.app_context():
+        print(json.dumps(warm_cache(args.top, args.budget)))
+
+
+if __name__ == "__main__":
+    main()
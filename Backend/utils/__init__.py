@@ -1,3 +1,6 @@
-from .price import safe_price, is_artist_match, cheapest_listing, cheapest_by_source
+from .price import safe_price, safe_prices, parse_price, to_base_currency, cheapest_listing, cheapest_by_source
 from .time import now_utc, iso_utc, parse_iso_datetime
+from core.events import normalize_text, event_day, event_key
 from .http import json_error, json_ok
+from core.ranking import cheapest, cheapest_k, cheapest_k_by_source
+from .artist_match import ArtistMatcher, is_artist_match, name_tokens
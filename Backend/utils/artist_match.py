@@ -0,0 +1,87 @@
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple
+
+from core.events import normalize_text
+
+Tokens = Tuple[str, ...]
+
+
+@lru_cache(maxsize=65536)
+def name_tokens(name: str) -> Tokens:
+    """
+    Normalized word tokens, cached: "Beyoncé & Friends!" -> ("beyonce", "friends")
+    """
+    return tuple(normalize_text(name).split())
+
+
+def _contains_run(haystack: Tokens, needle: Tokens) -> bool:
+    n = len(needle)
+    if not n or n > len(haystack):
+        return False
+    first = needle[0]
+    for i in range(len(haystack) - n + 1):
+        if haystack[i] == first and haystack[i:i + n] == needle:
+            return True
+    return False
+
+
+def is_artist_match(listing_name: str, artist: str) -> bool:
+    """
+    True when the artist's tokens appear as a contiguous run of whole words in
+    the listing name, ignoring case, accents and punctuation.
+    "Calvin Harris & Friends" matches "calvin harris"; "Harrison" doesn't match "Harris".
+    """
+    if not listing_name or not artist:
+        return False
+    return _contains_run(name_tokens(listing_name), name_tokens(artist))
+
+
+class ArtistMatcher:
+    """
+    Matches many artists against many listing names in one pass.
+
+    Artist names are compiled into a token trie once per batch; each listing
+    name is tokenized once (cached) and walked from every start position, so
+    the cost per listing depends on its length, not on how many artists are
+    matched.
+    """
+
+    _END = ""  # trie key holding the artists that end at a node
+
+    def __init__(self, artists: Iterable[str]):
+        self._trie: Dict[str, Any] = {}
+        for artist in artists:
+            toks = name_tokens(artist or "")
+            if not toks:
+                continue
+            node = self._trie
+            for t in toks:
+                node = node.setdefault(t, {})
+            node.setdefault(self._END, []).append(artist)
+
+    def match(self, listing_name: str) -> List[str]:
+        """
+        Artists whose names appear as whole words in listing_name, in the
+        order they appear.
+        """
+        toks = name_tokens(listing_name or "")
+        found: Dict[str, None] = {}
+        for i in range(len(toks)):
+            node = self._trie
+            for t in toks[i:]:
+                node = node.get(t)
+                if node is None:
+                    break
+                for artist in node.get(self._END, ()):
+                    found[artist] = None
+        return list(found)
+
+    def match_listings(self, listings: Iterable[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        {artist: [listings that mention the artist]}
+        """
+        out: Dict[str, List[Dict[str, Any]]] = {}
+        for item in listings:
+            for artist in self.match(item.get("name") or item.get("event_name") or ""):
+                out.setdefault(artist, []).append(item)
+        return out
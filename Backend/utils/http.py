@@ -1,5 +1,37 @@
+import gzip
+import hmac
+import time
+from functools import wraps
 from typing import Any, Dict, Optional
-from flask import jsonify
+from flask import current_app, g, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+
+from core.metrics import REQUESTS, current_timings, server_timing_header, span, start_timing
+
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+# Responses smaller than this aren't worth compressing
+COMPRESS_MIN_BYTES = 1024
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
+
+COMPRESSIBLE_MIMETYPES = {
+    "application/json",
+    "application/javascript",
+    "text/html",
+    "text/css",
+    "text/plain",
+    "text/csv",
+    "application/x-ndjson",
+}
 
 
 def json_ok(data: Optional[Dict[str, Any]] = None, status: int = 200):
@@ -20,3 +52,141 @@ def json_error(message: str, status: int = 400, extra: Optional[Dict[str, Any]]
     if extra:
         payload.update(extra)
     return jsonify(payload), status
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    jsonify() backed by orjson when it is installed, stdlib json otherwise.
+    Datetimes and dataclasses still go through Flask's default() so the output
+    matches the stdlib provider.
+    """
+
+    sort_keys = False
+
+    if orjson is not None:
+        _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+        def _dump_bytes(self, obj: Any, indent: bool = False) -> bytes:
+            option = self._OPTIONS | (orjson.OPT_INDENT_2 if indent else 0)
+            return orjson.dumps(obj, default=self.default, option=option)
+
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            if set(kwargs) - {"separators", "indent"}:
+                return super().dumps(obj, **kwargs)
+            return self._dump_bytes(obj, indent=bool(kwargs.get("indent"))).decode("utf-8")
+
+        def response(self, *args: Any, **kwargs: Any):
+            obj = self._prepare_response_obj(args, kwargs)
+            indent = (self.compact is None and self._app.debug) or self.compact is False
+            return self._app.response_class(self._dump_bytes(obj, indent) + b"\n", mimetype=self.mimetype)
+
+
+def _pick_encoding() -> Optional[str]:
+    accepted = request.accept_encodings
+    if brotli is not None and accepted["br"]:
+        return "br"
+    if accepted["gzip"]:
+        return "gzip"
+    return None
+
+
+def compress_response(response):
+    """
+    after_request hook: add a content ETag to GET responses (answering
+    If-None-Match with 304), then gzip/brotli-compress bodies above
+    COMPRESS_MIN_BYTES when the client accepts it.
+    """
+    if response.direct_passthrough or response.is_streamed:
+        return response
+
+    if request.method == "GET" and response.status_code == 200 and "ETag" not in response.headers:
+        # Weak: the same validator covers the identity and compressed encodings
+        response.add_etag(weak=True)
+        response.make_conditional(request)
+
+    if (
+        response.status_code != 200
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_BYTES:
+        return response
+
+    response.vary.add("Accept-Encoding")
+    encoding = _pick_encoding()
+    if encoding is None:
+        return response
+    with span("serialize", step=encoding):
+        if encoding == "br":
+            data = brotli.compress(data, quality=BROTLI_QUALITY)
+        else:
+            data = gzip.compress(data, compresslevel=GZIP_LEVEL)
+
+    response.set_data(data)
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+
+def cache_for(response, max_age: int, stale_while_revalidate: int = 0, public: bool = True):
+    """
+    Set Cache-Control on a response (or a (response, status) tuple) and return it.
+    """
+    resp = response[0] if isinstance(response, tuple) else response
+    value = f"{'public' if public else 'private'}, max-age={max_age}"
+    if stale_while_revalidate:
+        value += f", stale-while-revalidate={stale_while_revalidate}"
+    resp.headers["Cache-Control"] = value
+    return response
+
+
+def require_admin(view):
+    """
+    Route decorator for maintenance endpoints: the request must carry the
+    app's ADMIN_TOKEN as "Authorization: Bearer <token>" or "X-Admin-Token".
+    Without a configured token these endpoints are disabled.
+    """
+    @wraps(view)
+    def guarded(*args, **kwargs):
+        token = current_app.config.get("ADMIN_TOKEN") or ""
+        if not token:
+            return json_error("admin endpoints are disabled (ADMIN_TOKEN is not set)", 403)
+        auth = request.headers.get("Authorization") or ""
+        given = auth[7:].strip() if auth[:7].lower() == "bearer " else request.headers.get("X-Admin-Token") or ""
+        if not hmac.compare_digest(given.encode("utf-8"), token.encode("utf-8")):
+            return json_error("admin token required", 401)
+        return view(*args, **kwargs)
+    return guarded
+
+
+def _start_request_timing() -> None:
+    g.request_started = time.perf_counter()
+    start_timing()
+
+
+def _finish_request_timing(response):
+    """
+    after_request hook: record the request in the latency histogram and send
+    the spans collected while serving it as a Server-Timing header.
+    """
+    started = g.pop("request_started", None)
+    if started is None:
+        return response
+    elapsed = time.perf_counter() - started
+    route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+    REQUESTS.observe(elapsed, method=request.method, route=route, status=str(response.status_code))
+    response.headers["Server-Timing"] = server_timing_header(current_timings(), total=elapsed)
+    return response
+
+
+def init_http(app) -> None:
+    """
+    Install the fast JSON provider, response compression and request timing.
+    """
+    app.json = FastJSONProvider(app)
+    app.before_request(_start_request_timing)
+    # after_request hooks run in reverse order: timing wraps compression
+    app.after_request(_finish_request_timing)
+    app.after_request(compress_response)
@@ -1,61 +1,199 @@
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from .artist_match import is_artist_match
+from core.ranking import cheapest
 
-_CURRENCY_RE = re.compile(r"[^0-9.\-]+")
 
+# Currency markers; symbols with a country prefix come first ("CA$" before "$")
+_CURRENCY_RE = re.compile(r"CA\$|C\$|US\$|A\$|€|£|\$|\b(?:CAD|USD|AUD|EUR|GBP)\b", re.IGNORECASE)
+_CURRENCY_CODES = {
+    "CA$": "CAD", "C$": "CAD", "US$": "USD", "A$": "AUD",
+    "€": "EUR", "£": "GBP", "$": "USD",
+}
 
-def safe_price(value: Any) -> Optional[float]:
-    """
-    Convert common price formats into a float.
+BASE_CURRENCY = "USD"
 
-    Examples:
-      120 -> 120.0
-      "120" -> 120.0
-      "$120.50" -> 120.5
-      "CA$ 145.00" -> 145.0
-      "from $99" -> 99.0
-      None / "" / "N/A" -> None
-    """
-    if value is None:
-        return None
+# Local rate table: units of BASE_CURRENCY per unit of currency
+RATES_TO_BASE: Dict[str, float] = {
+    "USD": 1.0,
+    "CAD": 0.73,
+    "EUR": 1.08,
+    "GBP": 1.27,
+    "AUD": 0.66,
+}
 
-    if isinstance(value, (int, float)):
-        return float(value)
+_EMPTY = frozenset({"", "n/a", "na", "none", "null"})
 
-    if not isinstance(value, str):
+# Number-like token: digits with optional , / . separators, or a bare fraction (".99")
+_NUMBER_RE = re.compile(r"-?(?:\d[\d,.]*|\.\d+)")
+_THOUSANDS_RE = re.compile(r"^-?\d{1,3}(?:,\d{3})+$")
+
+
+def _currency_code(m: Optional[re.Match]) -> Optional[str]:
+    if not m:
         return None
+    marker = m.group(0).upper()
+    return _CURRENCY_CODES.get(marker, marker)
 
-    s = value.strip()
-    if not s or s.lower() in {"n/a", "na", "none", "null"}:
+
+def _price_token(s: str, currency: Optional[re.Match]) -> Optional[str]:
+    """
+    The number written next to the currency marker ("2 tickets from $99" -> "99",
+    "1.200,50 €" -> "1.200,50"), otherwise the first number ("99-120" -> "99").
+    """
+    numbers = list(_NUMBER_RE.finditer(s))
+    if not numbers:
         return None
+    if currency:
+        for m in numbers:
+            if m.start() >= currency.end() and not s[currency.end():m.start()].strip():
+                return m.group(0)
+        for m in numbers:
+            if m.end() <= currency.start() and not s[m.end():currency.start()].strip():
+                return m.group(0)
+    return numbers[0].group(0)
+
 
-    # Extract a number-like token. Prefer the first valid number.
-    # Remove currency symbols/letters and keep digits/dot/minus
-    cleaned = _CURRENCY_RE.sub("", s)
-    # Sometimes you get strings like "99-120", take first chunk
-    cleaned = cleaned.split("-")[0].strip()
+def _parse_number(token: str) -> Optional[float]:
+    """
+    "1,200" -> 1200, "1,200.50" -> 1200.5, "1.200,50" -> 1200.5, "12,50" -> 12.5
+    """
+    token = token.rstrip(".,")
+    has_comma = "," in token
+    has_dot = "." in token
+
+    if has_comma and has_dot:
+        # Whichever separator comes last is the decimal point
+        if token.rfind(",") > token.rfind("."):
+            token = token.replace(".", "").replace(",", ".")
+        else:
+            token = token.replace(",", "")
+    elif has_comma:
+        token = token.replace(",", "") if _THOUSANDS_RE.match(token) else token.replace(",", ".")
+    elif token.count(".") > 1:
+        # "1.200.000"
+        token = token.replace(".", "")
 
     try:
-        return float(cleaned)
+        return float(token)
     except ValueError:
-        # As a fallback, find any number in the string
-        m = re.search(r"(-?\d+(?:\.\d+)?)", s)
-        if not m:
-            return None
-        try:
-            return float(m.group(1))
-        except ValueError:
-            return None
+        return None
+
+
+@lru_cache(maxsize=65536)
+def _parse_str(value: str) -> Tuple[Optional[float], Optional[str]]:
+    s = value.strip()
+    if s.lower() in _EMPTY:
+        return None, None
+
+    currency = _CURRENCY_RE.search(s)
+    token = _price_token(s, currency)
+    if token is None:
+        return None, None
+    return _parse_number(token), _currency_code(currency)
+
+
+def parse_price(value: Any) -> Tuple[Optional[float], Optional[str]]:
+    """
+    Parse a price and detect its currency.
+
+    Examples:
+      120 -> (120.0, None)
+      "$1,200" -> (1200.0, "USD")
+      "CA$ 145.00" -> (145.0, "CAD")
+      "1.200,50 €" -> (1200.5, "EUR")
+      "$.99" -> (0.99, "USD")
+      "2 tickets from $99" -> (99.0, "USD")
+      None / "" / "N/A" -> (None, None)
+    """
+    if value is None:
+        return None, None
+    if isinstance(value, (int, float)):
+        return float(value), None
+    if not isinstance(value, str):
+        return None, None
+    return _parse_str(value)
 
 
-def is_artist_match(listing_name: str, artist: str) -> bool:
+def to_base_currency(
+    amount: Optional[float],
+    currency: Optional[str],
+    base_currency: str = BASE_CURRENCY,
+    rates: Optional[Dict[str, float]] = None,
+) -> Optional[float]:
+    """
+    Convert amount from currency to base_currency using the local rate table.
+    Unknown currency is treated as already being in base_currency.
     """
-    Basic artist match: case-insensitive substring.
+    if amount is None or not currency or currency == base_currency:
+        return amount
+    rates = rates or RATES_TO_BASE
+    if currency not in rates or base_currency not in rates:
+        return amount
+    return round(amount * rates[currency] / rates[base_currency], 2)
+
+
+def safe_price(
+    value: Any,
+    base_currency: Optional[str] = None,
+    rates: Optional[Dict[str, float]] = None,
+) -> Optional[float]:
+    """
+    Convert common price formats into a float: the amount as written, or
+    converted to base_currency when that is set.
+
+    Examples:
+      120 -> 120.0
+      "120" -> 120.0
+      "$120.50" -> 120.5
+      "$1,200" -> 1200.0
+      "CA$ 145.00" -> 145.0
+      "from $99" -> 99.0
+      None / "" / "N/A" -> None
+      "€100", base_currency="USD" -> 108.0
     """
-    if not listing_name or not artist:
-        return False
-    return artist.lower() in listing_name.lower()
+    amount, currency = parse_price(value)
+    if base_currency is not None:
+        amount = to_base_currency(amount, currency, base_currency, rates)
+    return amount
+
+
+def safe_prices(
+    values: Iterable[Any],
+    base_currency: Optional[str] = None,
+    rates: Optional[Dict[str, float]] = None,
+) -> List[Optional[float]]:
+    """
+    Batch version of safe_price for a whole column of raw prices.
+
+    Numbers pass straight through; each distinct string is parsed once per call.
+    With base_currency set, detected currencies are converted via the rate table.
+    """
+    memo: Dict[str, Optional[float]] = {}
+    out: List[Optional[float]] = []
+    append = out.append
+
+    for v in values:
+        if v.__class__ is float:
+            append(v)
+            continue
+        if v.__class__ is int:
+            append(float(v))
+            continue
+        if v.__class__ is str:
+            if v in memo:
+                append(memo[v])
+                continue
+            amount, currency = _parse_str(v)
+            if base_currency is not None:
+                amount = to_base_currency(amount, currency, base_currency, rates)
+            memo[v] = amount
+            append(amount)
+            continue
+        append(parse_price(v)[0])
+    return out
 
 
 def cheapest_listing(listings: List[Dict[str, Any]], artist: str) -> Optional[Dict[str, Any]]:
@@ -64,25 +202,15 @@ def cheapest_listing(listings: List[Dict[str, Any]], artist: str) -> Optional[Di
     Expects listing dicts with at least: name/event_name + price.
     Adds "_price_num" to the returned dict.
     """
-    candidates: List[Tuple[float, Dict[str, Any]]] = []
-
-    for item in listings or []:
-        name = item.get("name") or item.get("event_name") or ""
-        if not is_artist_match(name, artist):
-            continue
-
-        p = safe_price(item.get("price"))
-        if p is None:
-            continue
+    matched = [
+        item for item in listings or []
+        if is_artist_match(item.get("name") or item.get("event_name") or "", artist)
+    ]
 
+    for item, p in zip(matched, safe_prices((item.get("price") for item in matched), base_currency=BASE_CURRENCY)):
         item["_price_num"] = p
-        candidates.append((p, item))
-
-    if not candidates:
-        return None
 
-    candidates.sort(key=lambda x: x[0])
-    return candidates[0][1]
+    return cheapest(matched, price=lambda item: item["_price_num"])
 
 
 def cheapest_by_source(